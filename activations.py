@@ -0,0 +1,311 @@
+"""
+Fonctions d'activation et leurs dérivées, calculées sans allocation
+
+Chaque activation calcule, en une seule passe, sa valeur et sa dérivée dans
+des tampons fournis par l'appelant (`forward_derivative(z, out, derivative)`),
+ce qui évite à la boucle d'entraînement de recalculer la dérivée à partir de
+la sortie et d'allouer des tableaux temporaires. `out` peut être `z` lui-même
+(calcul en place).
+
+Les activations sont enregistrées par nom :
+    sigmoid, sigmoid_lut, tanh, relu, leaky_relu, softplus
+
+    activation = get_activation('leaky_relu', alpha=0.1)
+    activation.forward_derivative(z, out=z, derivative=buffer)
+
+sigmoid_lut est une approximation de la sigmoïde par table (valeur la plus
+proche, erreur absolue < 1e-3 avec la table par défaut). Avec NumPy, elle
+n'est pas plus rapide que la forme tanh (la conversion des indices et np.take
+coûtent plus cher) : elle n'est utile que là où tanh/exp sont lents.
+"""
+
+import numpy as np
+
+
+class Activation:
+    """
+    Classe de base : les sous-classes implémentent `forward`,
+    `forward_derivative` et `derivative` (dérivée exprimée à partir de la sortie).
+    `scalar` et `scalar_derivative` calculent les mêmes valeurs pour un
+    exemple isolé ; par défaut elles passent par les versions tableau, que
+    les sous-classes remplacent par une formule directe (bien plus rapide).
+    """
+
+    name = None
+
+    def __call__(self, x):
+        """Valeur de l'activation pour un scalaire ou un tableau (nouveau résultat)"""
+        # Exemple isolé (predict, train) : formule directe, sans tampon
+        if isinstance(x, (float, int, np.generic)):
+            return self.scalar(x)
+        x = np.array(x, dtype=_float_type(np.asarray(x)))
+        return self.forward(x, out=x)[()]
+
+    def scalar(self, z):
+        """f(z) pour un scalaire ; les sous-classes fournissent une formule directe"""
+        return self.forward(np.array(z, dtype=_float_type(np.asarray(z))))[()]
+
+    def scalar_derivative(self, y):
+        """f'(z) pour un scalaire, à partir de la sortie y = f(z)"""
+        return self.derivative(np.array(y, dtype=_float_type(np.asarray(y))))[()]
+
+    def forward(self, z, out=None):
+        """Écrit f(z) dans `out` (alloué si None) et le renvoie"""
+        raise NotImplementedError
+
+    def forward_derivative(self, z, out, derivative):
+        """Écrit f(z) dans `out` et f'(z) dans `derivative`, en une passe"""
+        raise NotImplementedError
+
+    def derivative(self, y, out=None):
+        """Dérivée f'(z) exprimée à partir de la sortie y = f(z)"""
+        raise NotImplementedError
+
+    def get_config(self):
+        """Description sérialisable, acceptée par get_activation"""
+        return {'name': self.name}
+
+    def __repr__(self):
+        params = ", ".join(f"{k}={v!r}" for k, v in self.get_config().items() if k != 'name')
+        return f"{type(self).__name__}({params})"
+
+
+# Type flottant des résultats : celui de l'entrée, float64 pour les entiers
+def _float_type(z):
+    return z.dtype if np.issubdtype(z.dtype, np.floating) else np.float64
+
+
+def _output(z, out):
+    return np.empty_like(z, dtype=_float_type(z)) if out is None else out
+
+
+class Sigmoid(Activation):
+    """σ(z) = 1 / (1 + exp(-z)), calculée comme 0.5·(1 + tanh(z/2)) (sans dépassement)"""
+
+    name = 'sigmoid'
+
+    def scalar(self, z):
+        return 0.5 * (1 + np.tanh(0.5 * z))
+
+    def scalar_derivative(self, y):
+        return y * (1 - y)
+
+    def forward(self, z, out=None):
+        out = _output(z, out)
+        np.multiply(z, 0.5, out=out)
+        np.tanh(out, out=out)
+        out += 1
+        out *= 0.5
+        return out
+
+    def forward_derivative(self, z, out, derivative):
+        self.forward(z, out)
+        return out, self.derivative(out, derivative)
+
+    def derivative(self, y, out=None):
+        # σ' = σ·(1 - σ)
+        out = _output(y, out)
+        np.subtract(1, y, out=out)
+        out *= y
+        return out
+
+
+class SigmoidLUT(Sigmoid):
+    """
+    Sigmoïde approchée par une table de `size` valeurs sur [-bound, bound].
+
+    Au-delà de l'intervalle, la sortie est celle de la borne la plus proche.
+    La dérivée est celle de la sigmoïde, calculée à partir de la sortie.
+    """
+
+    name = 'sigmoid_lut'
+
+    def __init__(self, size=4096, bound=8.0):
+        if size < 2 or bound <= 0:
+            raise ValueError("size doit être au moins 2 et bound positif")
+        self.size = size
+        self.bound = bound
+        self._scale = (size - 1) / (2 * bound)
+        self._table = Sigmoid().forward(np.linspace(-bound, bound, size))
+        self._index = np.empty(0, dtype=np.intp)
+
+    # La valeur scalaire passe par la table, comme les tableaux
+    scalar = Activation.scalar
+
+    def forward(self, z, out=None):
+        out = _output(z, out)
+        if self._index.size < z.size:
+            self._index = np.empty(z.size, dtype=np.intp)
+        index = self._index[:z.size].reshape(z.shape)
+
+        # Indice du point de la table le plus proche, borné à la table
+        np.multiply(z, self._scale, out=out)
+        out += self.bound * self._scale + 0.5
+        np.clip(out, 0, self.size - 1, out=out)
+        np.copyto(index, out, casting='unsafe')
+        np.take(self._table, index, out=out)
+        return out
+
+    def get_config(self):
+        return {'name': self.name, 'size': self.size, 'bound': self.bound}
+
+
+class Tanh(Activation):
+    """tanh(z), sortie dans ]-1, 1["""
+
+    name = 'tanh'
+
+    def scalar(self, z):
+        return np.tanh(z)
+
+    def scalar_derivative(self, y):
+        return 1 - y * y
+
+    def forward(self, z, out=None):
+        return np.tanh(z, out=_output(z, out))
+
+    def forward_derivative(self, z, out, derivative):
+        np.tanh(z, out=out)
+        return out, self.derivative(out, derivative)
+
+    def derivative(self, y, out=None):
+        # tanh' = 1 - tanh²
+        out = _output(y, out)
+        np.multiply(y, y, out=out)
+        np.subtract(1, out, out=out)
+        return out
+
+
+class ReLU(Activation):
+    """max(0, z)"""
+
+    name = 'relu'
+
+    def scalar(self, z):
+        return np.maximum(z, 0.0)
+
+    def scalar_derivative(self, y):
+        return 1.0 if y > 0 else 0.0
+
+    def forward(self, z, out=None):
+        return np.maximum(z, 0, out=_output(z, out))
+
+    def forward_derivative(self, z, out, derivative):
+        # La dérivée est calculée d'abord : `out` peut être `z`
+        np.greater(z, 0, out=derivative)
+        np.maximum(z, 0, out=out)
+        return out, derivative
+
+    def derivative(self, y, out=None):
+        return np.greater(y, 0, out=_output(y, out))
+
+
+class LeakyReLU(Activation):
+    """z si z > 0, alpha·z sinon"""
+
+    name = 'leaky_relu'
+
+    def __init__(self, alpha=0.01):
+        self.alpha = alpha
+        self._scaled = np.empty(0)
+
+    def scalar(self, z):
+        return z * (1.0 if z > 0 else self.alpha)
+
+    def scalar_derivative(self, y):
+        return 1.0 if y > 0 else self.alpha
+
+    def forward(self, z, out=None):
+        # max(z, alpha·z) (min si alpha > 1), alpha·z dans un tampon réutilisé
+        out = _output(z, out)
+        if self._scaled.size < out.size or self._scaled.dtype != out.dtype:
+            self._scaled = np.empty(out.size, dtype=out.dtype)
+        scaled = self._scaled[:out.size].reshape(out.shape)
+        np.multiply(z, self.alpha, out=scaled)
+        select = np.maximum if self.alpha <= 1 else np.minimum
+        return select(z, scaled, out=out)
+
+    def forward_derivative(self, z, out, derivative):
+        # pente = 1 si z > 0, alpha sinon ; sortie = z · pente
+        np.greater(z, 0, out=derivative)
+        derivative *= 1 - self.alpha
+        derivative += self.alpha
+        np.multiply(z, derivative, out=out)
+        return out, derivative
+
+    def derivative(self, y, out=None):
+        # La sortie a le signe de z (alpha > 0)
+        out = _output(y, out)
+        np.greater(y, 0, out=out)
+        out *= 1 - self.alpha
+        out += self.alpha
+        return out
+
+    def get_config(self):
+        return {'name': self.name, 'alpha': self.alpha}
+
+
+class Softplus(Activation):
+    """log(1 + exp(z)), version lisse de ReLU ; sa dérivée est la sigmoïde"""
+
+    name = 'softplus'
+
+    def scalar(self, z):
+        return np.logaddexp(0, z)
+
+    def scalar_derivative(self, y):
+        return 1 - np.exp(-y)
+
+    def forward(self, z, out=None):
+        return np.logaddexp(0, z, out=_output(z, out))
+
+    def forward_derivative(self, z, out, derivative):
+        # La dérivée est calculée d'abord : `out` peut être `z`
+        _SIGMOID.forward(z, out=derivative)
+        np.logaddexp(0, z, out=out)
+        return out, derivative
+
+    def derivative(self, y, out=None):
+        # σ(z) = 1 - exp(-softplus(z))
+        out = _output(y, out)
+        np.negative(y, out=out)
+        np.exp(out, out=out)
+        np.subtract(1, out, out=out)
+        return out
+
+
+_SIGMOID = Sigmoid()
+
+ACTIVATIONS = {
+    'sigmoid': Sigmoid,
+    'sigmoid_lut': SigmoidLUT,
+    'tanh': Tanh,
+    'relu': ReLU,
+    'leaky_relu': LeakyReLU,
+    'softplus': Softplus,
+}
+
+
+def register_activation(name, activation_class):
+    """Ajouter une activation au registre (classe dérivée d'Activation)"""
+    ACTIVATIONS[name] = activation_class
+
+
+def get_activation(activation='sigmoid', **params):
+    """
+    Instance d'activation à partir de son nom.
+
+    Args:
+        activation: Nom du registre, dictionnaire de get_config(), ou
+                    instance d'Activation (renvoyée telle quelle)
+        **params: Paramètres de l'activation (ex : alpha pour leaky_relu)
+    """
+    if isinstance(activation, Activation):
+        return activation
+    if isinstance(activation, dict):
+        params = {**activation, **params}
+        activation = params.pop('name')
+    if activation not in ACTIVATIONS:
+        raise ValueError(f"Activation inconnue: {activation!r} "
+                         f"(disponibles: {', '.join(ACTIVATIONS)})")
+    return ACTIVATIONS[activation](**params)
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Banc d'essai des performances du neurone
+
+Mesure, sans interface graphique et sur CPU :
+    - le débit de sigmoid (éléments/s)
+    - le débit de Neurone.predict, exemple par exemple et par lot (exemples/s)
+    - le débit de Neurone.train (exemples/s) et de Neurone.fit (époques/s),
+      en float64 et en float32
+    - la boucle d'entraînement de neurone.py (porte OR), par exemple et vectorisée
+    - le nombre d'époques nécessaires pour apprendre chaque porte logique
+
+en faisant varier la dimension des entrées et la taille du jeu de données.
+Les résultats sont écrits en JSON et comparés à une référence enregistrée :
+toute régression au-delà de la tolérance fait échouer le script. La référence
+(benchmarks/baseline.json par défaut) dépend de la machine : elle n'est pas
+versionnée et doit être enregistrée sur chaque machine, dans le même mode
+(--quick ou non) que les comparaisons.
+
+Usage:
+    python benchmarks/bench_neurone.py --save-baseline    # enregistrer la référence
+    python benchmarks/bench_neurone.py                    # comparer à la référence
+    python benchmarks/bench_neurone.py --quick            # version courte
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+# Ajouter le chemin parent
+parent_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, parent_dir)
+
+import numpy as np
+
+from convergence import ConvergenceMonitor
+from neurone import Neurone, sigmoid
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+GATES = {
+    'OR': [0, 1, 1, 1],
+    'AND': [0, 0, 0, 1],
+    'NOR': [1, 0, 0, 0],
+    'NAND': [1, 1, 1, 0],
+}
+GATE_INPUTS = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+
+
+def best_time(function, repeat=3):
+    """Meilleur temps d'exécution (en secondes) sur `repeat` essais"""
+    best = np.inf
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def metric(value, unit, higher_is_better=True):
+    return {'value': float(value), 'unit': unit, 'higher_is_better': higher_is_better}
+
+
+def bench_sigmoid(sizes):
+    results = {}
+    for n in sizes:
+        x = np.random.randn(n)
+        t = best_time(lambda: sigmoid(x))
+        results[f"sigmoid/n{n}"] = metric(n / t, 'éléments/s')
+    return results
+
+
+def bench_predict(dims, sizes, loop_samples):
+    results = {}
+    for d in dims:
+        neurone = Neurone(d)
+        X_loop = np.random.rand(loop_samples, d)
+
+        def predict_loop():
+            for x in X_loop:
+                neurone.predict(x)
+
+        t = best_time(predict_loop)
+        results[f"predict_boucle/d{d}"] = metric(loop_samples / t, 'exemples/s')
+
+        for n in sizes:
+            X = np.random.rand(n, d)
+            t = best_time(lambda: neurone.predict(X))
+            results[f"predict_lot/d{d}/n{n}"] = metric(n / t, 'exemples/s')
+    return results
+
+
+def bench_train(dims, loop_samples):
+    results = {}
+    for d in dims:
+        neurone = Neurone(d)
+        X = np.random.rand(loop_samples, d)
+        y = (np.random.rand(loop_samples) > 0.5).astype(float)
+
+        def train_loop():
+            for i in range(loop_samples):
+                neurone.train(X[i], y[i])
+
+        t = best_time(train_loop)
+        results[f"train/d{d}"] = metric(loop_samples / t, 'exemples/s')
+    return results
+
+
+def bench_fit(dims, sizes, epochs):
+    results = {}
+    for d in dims:
+        for n in sizes:
+            X = np.random.rand(n, d)
+            y = (np.random.rand(n) > 0.5).astype(float)
+            for dtype, prefix in ((np.float64, 'fit'), (np.float32, 'fit_float32')):
+                neurone = Neurone(d, dtype=dtype)
+                X_typed = X.astype(dtype)
+                t = best_time(lambda: neurone.fit(X_typed, y, epochs=epochs), repeat=2)
+                results[f"{prefix}/d{d}/n{n}"] = metric(epochs / t, 'époques/s')
+                if dtype is np.float64:
+                    results[f"fit_exemples/d{d}/n{n}"] = metric(epochs * n / t, 'exemples/s')
+    return results
+
+
+def bench_training_loop(epochs):
+    """La boucle de neurone.py sur la porte OR : par exemple (train) et vectorisée (fit)"""
+    y = np.array(GATES['OR'])
+    neurone = Neurone(2)
+
+    def per_sample_loop():
+        for _ in range(epochs):
+            for i in range(len(GATE_INPUTS)):
+                neurone.train(GATE_INPUTS[i], y[i])
+
+    t = best_time(per_sample_loop, repeat=1)
+    results = {'boucle_or/train': metric(epochs / t, 'époques/s')}
+
+    t = best_time(lambda: neurone.fit(GATE_INPUTS, y, epochs=epochs, record_every=10), repeat=1)
+    results['boucle_or/fit'] = metric(epochs / t, 'époques/s')
+    return results
+
+
+def bench_convergence(max_epochs, seed=0):
+    """Époques nécessaires pour apprendre chaque porte (graine fixe, résultat déterministe)"""
+    results = {}
+    for gate, targets in GATES.items():
+        np.random.seed(seed)
+        neurone = Neurone(2)
+        monitor = ConvergenceMonitor(target_accuracy=1.0)
+        neurone.fit(GATE_INPUTS, np.array(targets), epochs=max_epochs, learning_rate=1.0,
+                    monitor=monitor)
+        epochs = monitor.stopped_epoch + 1 if monitor.stopped else max_epochs
+        results[f"convergence/{gate}"] = metric(epochs, 'époques', higher_is_better=False)
+    return results
+
+
+def run_all(quick=False):
+    """Exécuter tout le banc d'essai et renvoyer le dictionnaire des métriques"""
+    np.random.seed(0)
+    if quick:
+        dims, sizes, loop_samples, fit_epochs, loop_epochs = [2, 32], [1000], 500, 50, 1000
+    else:
+        dims, sizes, loop_samples, fit_epochs, loop_epochs = [2, 32, 512], [1000, 100000], 5000, 200, 150000
+
+    results = {}
+    results.update(bench_sigmoid(sizes))
+    results.update(bench_predict(dims, sizes, loop_samples))
+    results.update(bench_train(dims, loop_samples))
+    results.update(bench_fit(dims, sizes, fit_epochs))
+    results.update(bench_training_loop(loop_epochs))
+    results.update(bench_convergence(max_epochs=10000))
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    Comparer les résultats à la référence.
+
+    Returns:
+        Liste de messages, un par métrique en régression au-delà de la tolérance
+    """
+    regressions = []
+    for name, ref in baseline.items():
+        if name not in results:
+            continue
+        value, ref_value = results[name]['value'], ref['value']
+        if ref['higher_is_better']:
+            regressed = value < ref_value * (1 - tolerance)
+        else:
+            regressed = value > ref_value * (1 + tolerance)
+        if regressed:
+            change = (value / ref_value - 1) * 100
+            regressions.append(f"{name}: {value:.4g} {ref['unit']} "
+                               f"(référence {ref_value:.4g}, {change:+.1f}%)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Banc d'essai des performances du neurone")
+    parser.add_argument('--quick', action='store_true', help="version courte (quelques secondes)")
+    parser.add_argument('--output', help="fichier JSON des résultats")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="fichier JSON de référence")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="enregistrer les résultats comme nouvelle référence")
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help="régression relative tolérée (défaut: 0.25)")
+    args = parser.parse_args(argv)
+
+    # Les tailles et répétitions dépendent du mode : pas de comparaison croisée
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get('quick') != args.quick:
+            mode = "rapide (--quick)" if baseline.get('quick') else "complet"
+            print(f"❌ La référence {args.baseline} a été mesurée en mode {mode} : "
+                  f"relancez dans ce mode, ou enregistrez une nouvelle référence")
+            return 2
+
+    print("=" * 60)
+    print("⏱️  BANC D'ESSAI DU NEURONE" + (" (rapide)" if args.quick else ""))
+    print("=" * 60)
+
+    results = run_all(quick=args.quick)
+    for name, m in results.items():
+        print(f"   {name:<32} {m['value']:>14.4g} {m['unit']}")
+
+    report = {
+        'machine': platform.machine(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'quick': args.quick,
+        'results': results,
+    }
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n📄 Résultats écrits dans {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Référence enregistrée dans {args.baseline}")
+        return 0
+
+    if baseline is None:
+        print(f"\n⚠️  Pas de référence ({args.baseline}) : lancez avec --save-baseline")
+        return 0
+
+    regressions = compare(results, baseline['results'], args.tolerance)
+    if regressions:
+        print(f"\n❌ {len(regressions)} RÉGRESSION(S) DE PERFORMANCE:")
+        for message in regressions:
+            print(f"   - {message}")
+        return 1
+
+    print(f"\n✅ Aucune régression (tolérance {args.tolerance:.0%})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+Rappels (callbacks) et instrumentation de la boucle d'entraînement
+
+Neurone.fit et Neurone.fit_stream acceptent une liste de rappels. Chaque
+rappel peut implémenter tout ou partie des points d'accroche :
+
+    on_train_begin(neurone, logs)
+    on_batch_end(neurone, batch, logs)      logs: size, error_sum (selon la perte)
+    on_epoch_end(neurone, epoch, logs)      logs: error ; renvoyer True arrête l'entraînement
+    on_train_end(neurone, logs)             logs: epochs, history
+
+Seuls les points d'accroche réellement redéfinis sont appelés : sans rappel,
+la boucle ne paie qu'un test de liste vide par lot et par époque.
+
+TrainingProfiler mesure en plus le temps passé dans la passe avant, le calcul
+du gradient et la mise à jour des poids.
+"""
+
+import time
+
+
+class Callback:
+    """Classe de base : tous les points d'accroche ne font rien"""
+
+    def on_train_begin(self, neurone, logs):
+        pass
+
+    def on_batch_end(self, neurone, batch, logs):
+        pass
+
+    def on_epoch_end(self, neurone, epoch, logs):
+        pass
+
+    def on_train_end(self, neurone, logs):
+        pass
+
+
+class LambdaCallback(Callback):
+    """Rappel construit à partir de simples fonctions"""
+
+    def __init__(self, on_train_begin=None, on_batch_end=None, on_epoch_end=None,
+                 on_train_end=None):
+        hooks = {'on_train_begin': on_train_begin, 'on_batch_end': on_batch_end,
+                 'on_epoch_end': on_epoch_end, 'on_train_end': on_train_end}
+        for name, function in hooks.items():
+            if function is not None:
+                setattr(self, name, function)
+
+
+class TrainingProfiler(Callback):
+    """
+    Compteurs et chronomètres de la boucle d'entraînement.
+
+    Le temps de chaque lot est réparti entre la passe avant (produit et
+    sigmoïde), le gradient (erreur et produit transposé) et la mise à jour
+    (optimiseur).
+    """
+
+    PHASES = ('forward', 'gradient', 'update')
+    PHASE_NAMES = {'forward': "passe avant", 'gradient': "gradient", 'update': "mise à jour"}
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.timers = dict.fromkeys(self.PHASES, 0.0)
+        self.batches = 0
+        self.samples = 0
+        self.epochs = 0
+        self.total_time = 0.0
+        self._start = None
+
+    def record_batch(self, size, forward, gradient, update):
+        """Appelé par la boucle d'entraînement avec les durées de chaque phase"""
+        self.timers['forward'] += forward
+        self.timers['gradient'] += gradient
+        self.timers['update'] += update
+        self.batches += 1
+        self.samples += size
+
+    def on_train_begin(self, neurone, logs):
+        self._start = time.perf_counter()
+
+    def on_epoch_end(self, neurone, epoch, logs):
+        self.epochs += 1
+
+    def on_train_end(self, neurone, logs):
+        if self._start is not None:
+            self.total_time += time.perf_counter() - self._start
+            self._start = None
+
+    def summary(self):
+        """Rapport lisible du temps passé dans chaque phase"""
+        measured = sum(self.timers.values())
+        lines = [f"Époques: {self.epochs}, lots: {self.batches}, exemples: {self.samples}",
+                 f"Temps total: {self.total_time:.4f} s"]
+        for phase in self.PHASES:
+            share = self.timers[phase] / self.total_time * 100 if self.total_time else 0.0
+            lines.append(f"  {self.PHASE_NAMES[phase]:<12} {self.timers[phase]:.4f} s ({share:.1f}%)")
+        other = self.total_time - measured
+        if self.total_time:
+            lines.append(f"  {'autre':<12} {other:.4f} s ({other / self.total_time * 100:.1f}%)")
+            lines.append(f"Débit: {self.samples / self.total_time:.4g} exemples/s")
+        return "\n".join(lines)
+
+
+def _overrides(callback, name):
+    return (getattr(type(callback), name) is not getattr(Callback, name)
+            or name in vars(callback))
+
+
+class CallbackList:
+    """Liste des points d'accroche effectivement redéfinis, préparée une fois par entraînement"""
+
+    def __init__(self, callbacks=None):
+        callbacks = list(callbacks or [])
+        self.train_begin = [cb.on_train_begin for cb in callbacks if _overrides(cb, 'on_train_begin')]
+        self.batch_end = [cb.on_batch_end for cb in callbacks if _overrides(cb, 'on_batch_end')]
+        self.epoch_end = [cb.on_epoch_end for cb in callbacks if _overrides(cb, 'on_epoch_end')]
+        self.train_end = [cb.on_train_end for cb in callbacks if _overrides(cb, 'on_train_end')]
+        self.profiler = next((cb for cb in callbacks if isinstance(cb, TrainingProfiler)), None)
+
+    def on_train_begin(self, neurone, logs):
+        for hook in self.train_begin:
+            hook(neurone, logs)
+
+    def on_batch_end(self, neurone, batch, logs):
+        for hook in self.batch_end:
+            hook(neurone, batch, logs)
+
+    def on_epoch_end(self, neurone, epoch, logs):
+        """Renvoie True si un des rappels demande l'arrêt de l'entraînement"""
+        stop = False
+        for hook in self.epoch_end:
+            stop = bool(hook(neurone, epoch, logs)) or stop
+        return stop
+
+    def on_train_end(self, neurone, logs):
+        for hook in self.train_end:
+            hook(neurone, logs)
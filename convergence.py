@@ -0,0 +1,114 @@
+"""
+Détection de la convergence et arrêt anticipé de l'entraînement
+
+Le moniteur est mis à jour une fois par époque avec l'erreur (et, si besoin,
+la précision) et indique quand l'entraînement peut s'arrêter, à quelle époque
+et pour quelle raison. Il est utilisé par Neurone.fit et par l'interface
+graphique.
+"""
+
+import time
+
+import numpy as np
+
+
+class ConvergenceMonitor:
+    """Critères d'arrêt : tolérance sur l'erreur, patience, précision atteinte, temps maximal"""
+
+    REASONS = {
+        'loss_tol': "erreur sous la tolérance",
+        'patience': "plus d'amélioration de l'erreur",
+        'accuracy': "précision cible atteinte",
+        'max_time': "temps maximal écoulé",
+    }
+
+    def __init__(self, loss_tol=None, patience=None, min_delta=0.0,
+                 target_accuracy=None, max_time=None):
+        """
+        Args:
+            loss_tol: Arrêter dès que l'erreur est inférieure ou égale à cette valeur
+            patience: Arrêter après ce nombre d'époques sans amélioration de l'erreur
+            min_delta: Amélioration minimale de l'erreur comptée par la patience
+            target_accuracy: Arrêter dès que la précision (entre 0 et 1) est atteinte
+            max_time: Arrêter après ce nombre de secondes d'entraînement
+        """
+        self.loss_tol = loss_tol
+        self.patience = patience
+        self.min_delta = min_delta
+        self.target_accuracy = target_accuracy
+        self.max_time = max_time
+        self.reset()
+
+    @property
+    def needs_accuracy(self):
+        """La précision doit-elle être fournie à `update` ?"""
+        return self.target_accuracy is not None
+
+    def reset(self):
+        """Réinitialiser le moniteur avant un nouvel entraînement"""
+        self.best_loss = np.inf
+        self.wait = 0
+        self.stopped_epoch = None
+        self.reason = None
+        self._start_time = None
+
+    def start(self):
+        """Démarrer le chronomètre du critère de temps maximal"""
+        self._start_time = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        if self._start_time is None:
+            return 0.0
+        return time.perf_counter() - self._start_time
+
+    @property
+    def stopped(self):
+        return self.reason is not None
+
+    def update(self, epoch, loss, accuracy=None):
+        """
+        Enregistrer le résultat d'une époque.
+
+        Args:
+            epoch: Numéro de l'époque
+            loss: Erreur moyenne de l'époque
+            accuracy: Précision entre 0 et 1 (requise si target_accuracy est défini)
+
+        Returns:
+            True si l'entraînement doit s'arrêter
+        """
+        if self._start_time is None:
+            self.start()
+
+        if self.loss_tol is not None and loss <= self.loss_tol:
+            return self._stop(epoch, 'loss_tol')
+
+        if (self.target_accuracy is not None and accuracy is not None
+                and accuracy >= self.target_accuracy):
+            return self._stop(epoch, 'accuracy')
+
+        if self.patience is not None:
+            if loss < self.best_loss - self.min_delta:
+                self.best_loss = loss
+                self.wait = 0
+            else:
+                self.wait += 1
+                if self.wait >= self.patience:
+                    return self._stop(epoch, 'patience')
+
+        if self.max_time is not None and self.elapsed >= self.max_time:
+            return self._stop(epoch, 'max_time')
+
+        return False
+
+    def _stop(self, epoch, reason):
+        self.stopped_epoch = epoch
+        self.reason = reason
+        return True
+
+    def summary(self):
+        """Description lisible de l'arrêt"""
+        if not self.stopped:
+            return "Pas d'arrêt anticipé"
+        return f"Arrêt à l'époque {self.stopped_epoch}: {self.REASONS[self.reason]}"
@@ -0,0 +1,202 @@
+"""
+Historique d'entraînement compact et borné
+
+Remplace les listes Python (une copie de tableau par époque) par des tableaux
+NumPy préalloués qui grandissent par doublement. L'historique peut être
+décimé (une entrée toutes les k époques, avec l'enveloppe min/max de l'erreur
+sur les époques sautées) et plafonné : lorsque le plafond est atteint, les
+entrées sont fusionnées deux à deux et le facteur de décimation double, de
+sorte que la mémoire reste bornée quelle que soit la durée de l'entraînement.
+
+Les attributs `epochs`, `errors`, `weights`, `bias`, `error_min` et
+`error_max` sont des vues sans copie, utilisables directement par
+plot_training_history et par les graphiques de l'interface ; `last_error`
+est l'erreur de la dernière époque enregistrée, même décimée.
+"""
+
+import numpy as np
+
+
+class TrainingHistory:
+    """Historique préalloué, décimé et borné de l'erreur, des poids et du biais"""
+
+    def __init__(self, n_inputs, decimation=1, max_records=None, max_bytes=None,
+                 initial_capacity=256, dtype=np.float64):
+        """
+        Args:
+            n_inputs: Nombre de poids enregistrés par entrée
+            decimation: Conserver une entrée toutes les k époques
+            max_records: Nombre maximal d'entrées conservées (None = illimité)
+            max_bytes: Plafond mémoire en octets, converti en nombre d'entrées
+            initial_capacity: Capacité allouée au départ
+            dtype: Type des erreurs, poids et biais enregistrés (float32 divise
+                   la mémoire par deux ; les époques restent des entiers 64 bits)
+        """
+        self.n_inputs = n_inputs
+        self.dtype = np.dtype(dtype)
+        self.decimation = decimation
+        if max_bytes is not None:
+            max_records = max(2, max_bytes // self.record_nbytes)
+        if max_records is not None and max_records < 2:
+            raise ValueError("max_records doit être au moins 2")
+        self.max_records = max_records
+        self.count = 0
+        self._window = 0
+        self.last_error = None
+        self._allocate(initial_capacity if max_records is None
+                       else min(initial_capacity, max_records))
+
+    @property
+    def record_nbytes(self):
+        """Taille en octets d'une entrée (époque, erreur, min, max, poids, biais)"""
+        return 8 + self.dtype.itemsize * (4 + self.n_inputs)
+
+    @property
+    def nbytes(self):
+        """Mémoire allouée par l'historique, en octets"""
+        return self._capacity * self.record_nbytes
+
+    def _allocate(self, capacity):
+        old_count = self.count
+        old = None
+        if old_count:
+            old = (self.epochs, self.errors, self.error_min, self.error_max,
+                   self.weights, self.bias)
+
+        self._capacity = capacity
+        self._epochs = np.empty(capacity, dtype=np.int64)
+        self._errors = np.empty(capacity, dtype=self.dtype)
+        self._error_min = np.empty(capacity, dtype=self.dtype)
+        self._error_max = np.empty(capacity, dtype=self.dtype)
+        self._weights = np.empty((capacity, self.n_inputs), dtype=self.dtype)
+        self._bias = np.empty(capacity, dtype=self.dtype)
+
+        if old is not None:
+            for dst, src in zip((self._epochs, self._errors, self._error_min,
+                                 self._error_max, self._weights, self._bias), old):
+                dst[:old_count] = src
+
+    def clear(self):
+        """Vider l'historique (la mémoire allouée est conservée)"""
+        self.count = 0
+        self._window = 0
+        self.last_error = None
+
+    def copy(self):
+        """Copie indépendante, de capacité ajustée aux entrées enregistrées"""
+        other = TrainingHistory(self.n_inputs, self.decimation, self.max_records,
+                                initial_capacity=max(self.count, 1), dtype=self.dtype)
+        for dst, src in zip((other._epochs, other._errors, other._error_min,
+                             other._error_max, other._weights, other._bias),
+                            (self.epochs, self.errors, self.error_min, self.error_max,
+                             self.weights, self.bias)):
+            dst[:self.count] = src
+        other.count = self.count
+        other._window = self._window
+        other.last_error = self.last_error
+        return other
+
+    def append(self, epoch, error, weights, bias, force=False):
+        """
+        Enregistrer une époque.
+
+        Une nouvelle entrée est créée toutes les `decimation` époques ; entre deux,
+        seule l'enveloppe min/max de l'erreur de l'entrée courante est mise à jour.
+
+        Args:
+            epoch: Numéro de l'époque
+            error: Erreur moyenne de l'époque
+            weights: Poids du neurone (copiés si l'entrée est conservée)
+            bias: Biais du neurone
+            force: Créer une entrée même au milieu d'une fenêtre de décimation
+                   (par exemple pour la dernière époque d'un entraînement)
+
+        Returns:
+            True si une nouvelle entrée a été créée
+        """
+        self.last_error = error
+        if self.count and self._window < self.decimation and not force:
+            k = self.count - 1
+            if error < self._error_min[k]:
+                self._error_min[k] = error
+            elif error > self._error_max[k]:
+                self._error_max[k] = error
+            self._window += 1
+            return False
+
+        if self.count == self._capacity:
+            if self.max_records is not None and self._capacity >= self.max_records:
+                self._compact()
+            else:
+                new_capacity = 2 * self._capacity
+                if self.max_records is not None:
+                    new_capacity = min(new_capacity, self.max_records)
+                self._allocate(new_capacity)
+
+        k = self.count
+        self._epochs[k] = epoch
+        self._errors[k] = error
+        self._error_min[k] = error
+        self._error_max[k] = error
+        self._weights[k] = weights
+        self._bias[k] = bias
+        self.count += 1
+        self._window = 1
+        return True
+
+    def _compact(self):
+        """Fusionner les entrées deux à deux et doubler la décimation"""
+        n = self.count // 2
+        odd = self.count % 2
+        self._epochs[:n] = self._epochs[0:2 * n:2]
+        self._errors[:n] = self._errors[0:2 * n:2]
+        self._weights[:n] = self._weights[0:2 * n:2]
+        self._bias[:n] = self._bias[0:2 * n:2]
+        np.minimum(self._error_min[0:2 * n:2], self._error_min[1:2 * n:2], out=self._error_min[:n])
+        np.maximum(self._error_max[0:2 * n:2], self._error_max[1:2 * n:2], out=self._error_max[:n])
+
+        if odd:
+            # La dernière entrée, seule, garde sa fenêtre en cours
+            last = self.count - 1
+            for a in (self._epochs, self._errors, self._error_min, self._error_max,
+                      self._weights, self._bias):
+                a[n] = a[last]
+        else:
+            # La dernière entrée fusionnée couvre aussi la fenêtre précédente
+            self._window += self.decimation
+
+        self.count = n + odd
+        self.decimation *= 2
+
+    # ----- Vues sans copie -----
+
+    @property
+    def epochs(self):
+        return self._epochs[:self.count]
+
+    @property
+    def errors(self):
+        return self._errors[:self.count]
+
+    @property
+    def error_min(self):
+        return self._error_min[:self.count]
+
+    @property
+    def error_max(self):
+        return self._error_max[:self.count]
+
+    @property
+    def weights(self):
+        return self._weights[:self.count]
+
+    @property
+    def bias(self):
+        return self._bias[:self.count]
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        # Permet `errors, weights, bias = history`, comme les anciens triplets
+        return iter((self.errors, self.weights, self.bias))
@@ -1,14 +1,36 @@
+import json
+import os
+import time
+
 import numpy as np
 import matplotlib.pyplot as plt
 
-# Fonction d'activation sigmoïde
+from activations import get_activation
+from callbacks import CallbackList
+from convergence import ConvergenceMonitor
+from historique import TrainingHistory
+from optimiseurs import SGD
+from pertes import get_loss
+
+# Fonction d'activation sigmoïde, sous la forme 0.5·(1 + tanh(x/2)) :
+# mêmes valeurs que 1/(1 + exp(-x)), sans dépassement pour les grands |x|,
+# et le type des tableaux float32 est conservé
 def sigmoid(x):
-    return 1 / (1 + np.exp(-x))
+    return 0.5 * (1 + np.tanh(0.5 * x))
 
 # Dérivée de la sigmoïde (pour l'apprentissage)
 def sigmoid_derivative(x):
     return x * (1 - x)
 
+# Matrices creuses (scipy.sparse, CSR ou COO) : reconnues sans importer scipy,
+# qui reste une dépendance optionnelle
+def _is_sparse(X):
+    return hasattr(X, 'tocsr') and hasattr(X, 'nnz')
+
+def _as_csr(X, dtype=np.float64):
+    X = X.tocsr()
+    return X if X.dtype == dtype else X.astype(dtype)
+
 # Fonctions de visualisation
 def plot_activation_functions():
     """
@@ -29,28 +51,42 @@ def plot_activation_functions():
     plt.tight_layout()
     plt.show()
 
-def plot_training_history(errors_history, weights_history, bias_history):
+def plot_training_history(errors_history, weights_history=None, bias_history=None):
     """
     Affiche l'évolution de l'erreur et des paramètres pendant l'entraînement.
     
     Args:
-        errors_history: Liste des erreurs moyennes par époque
-        weights_history: Liste des poids à différentes époques
-        bias_history: Liste des biais à différentes époques
+        errors_history: Erreurs moyennes par époque, ou un TrainingHistory
+                        (les deux autres arguments sont alors ignorés)
+        weights_history: Poids à différentes époques
+        bias_history: Biais à différentes époques
     """
+    epochs = None
+    envelope = None
+    if isinstance(errors_history, TrainingHistory):
+        history = errors_history
+        errors_history, weights_history, bias_history = history
+        epochs = history.epochs
+        if history.decimation > 1:
+            envelope = (history.error_min, history.error_max)
+    if epochs is None:
+        epochs = np.arange(len(errors_history))
+
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     
     # Graphique 1: Évolution de l'erreur
-    axes[0, 0].plot(errors_history, color='red', linewidth=2)
+    axes[0, 0].plot(epochs, errors_history, color='red', linewidth=2)
+    if envelope is not None:
+        axes[0, 0].fill_between(epochs, *envelope, color='red', alpha=0.2)
     axes[0, 0].set_title('Évolution de l\'erreur moyenne', fontsize=12, fontweight='bold')
     axes[0, 0].set_xlabel('Époque')
     axes[0, 0].set_ylabel('Erreur moyenne')
     axes[0, 0].grid(True, alpha=0.3)
     
     # Graphique 2: Évolution des poids
-    weights_array = np.array(weights_history)
+    weights_array = np.asarray(weights_history)
     for i in range(weights_array.shape[1]):
-        axes[0, 1].plot(weights_array[:, i], label=f'Poids {i+1}', linewidth=2)
+        axes[0, 1].plot(epochs, weights_array[:, i], label=f'Poids {i+1}', linewidth=2)
     axes[0, 1].set_title('Évolution des poids', fontsize=12, fontweight='bold')
     axes[0, 1].set_xlabel('Époque')
     axes[0, 1].set_ylabel('Valeur du poids')
@@ -58,14 +94,14 @@ def plot_training_history(errors_history, weights_history, bias_history):
     axes[0, 1].grid(True, alpha=0.3)
     
     # Graphique 3: Évolution du biais
-    axes[1, 0].plot(bias_history, color='green', linewidth=2)
+    axes[1, 0].plot(epochs, bias_history, color='green', linewidth=2)
     axes[1, 0].set_title('Évolution du biais', fontsize=12, fontweight='bold')
     axes[1, 0].set_xlabel('Époque')
     axes[1, 0].set_ylabel('Valeur du biais')
     axes[1, 0].grid(True, alpha=0.3)
     
     # Graphique 4: Erreur en échelle logarithmique
-    axes[1, 1].plot(errors_history, color='purple', linewidth=2)
+    axes[1, 1].plot(epochs, errors_history, color='purple', linewidth=2)
     axes[1, 1].set_yscale('log')
     axes[1, 1].set_title('Évolution de l\'erreur (échelle log)', fontsize=12, fontweight='bold')
     axes[1, 1].set_xlabel('Époque')
@@ -75,41 +111,683 @@ def plot_training_history(errors_history, weights_history, bias_history):
     plt.tight_layout()
     plt.show()
 
+# Sauvegarde de tableaux nommés : fichier .npz, ou dossier de fichiers .npy
+# (format projetable en mémoire pour les grands vecteurs de poids)
+def _save_arrays(path, arrays, mmap=False):
+    if mmap:
+        os.makedirs(path, exist_ok=True)
+        for name, array in arrays.items():
+            np.save(os.path.join(path, f"{name}.npy"), array)
+    else:
+        np.savez(path, **arrays)
+
+
+# Chargement des tableaux écrits par _save_arrays ; mmap_mode ('r', 'r+', 'c')
+# ne s'applique qu'au format dossier. Les tableaux de `optional` absents du
+# fichier (sauvegardes plus anciennes) sont simplement omis.
+def _load_arrays(path, names, mmap_mode=None, optional=()):
+    if os.path.isdir(path):
+        return {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode=mmap_mode)
+                for name in (*names, *optional)
+                if name not in optional or os.path.exists(os.path.join(path, f"{name}.npy"))}
+    if not os.path.exists(path) and os.path.exists(path + ".npz"):
+        path += ".npz"
+    with np.load(path) as data:
+        return {name: data[name] for name in (*names, *optional)
+                if name not in optional or name in data.files}
+
+
 # Classe du neurone
 class Neurone:
-    def __init__(self, n_inputs):
-        # Initialisation aléatoire des poids et du biais
-        self.weights = np.random.rand(n_inputs)
+    def __init__(self, n_inputs, warm_start=None, dtype=np.float64, activation='sigmoid',
+                 loss='mse'):
+        # Fonction d'activation du registre de `activations` (nom ou instance)
+        self.activation = get_activation(activation)
+        # Perte de `pertes` ('mse', 'bce', 'hinge') : règle de mise à jour de
+        # train/fit/fit_stream et erreur rapportée dans l'historique
+        self.loss = get_loss(loss)
+        self.loss.check_activation(self.activation)
+        # Initialisation aléatoire des poids et du biais ; les poids, les entrées
+        # et les tampons d'entraînement utilisent le type `dtype` (float32 divise
+        # par deux la mémoire et la bande passante)
+        self.weights = np.random.rand(n_inputs).astype(dtype, copy=False)
         self.bias = np.random.rand(1)
         # Conversion du biais en scalaire pour éviter les warnings
         if isinstance(self.bias, np.ndarray) and self.bias.size == 1:
             self.bias = float(self.bias[0])
+        # Compteur incrémenté à chaque modification des poids par le neurone
+        # (sert de clé aux caches de prédictions)
+        self.weights_version = 0
+
+        # Démarrage à partir de poids connus (fichier sauvegardé ou autre Neurone)
+        if warm_start is not None:
+            self.load_weights(warm_start)
+
+    @property
+    def dtype(self):
+        """Type des poids, des entrées et des calculs du neurone"""
+        return self.weights.dtype
+
+    def save(self, path, mmap=False):
+        """
+        Sauvegarde les poids, le biais, l'activation et la perte.
+
+        Args:
+            path: Fichier .npz, ou dossier si mmap=True
+            mmap: Écrire un dossier de fichiers .npy, rechargeable par projection
+                  mémoire (utile pour les très grands vecteurs de poids)
+        """
+        _save_arrays(path, {'weights': self.weights, 'bias': np.array([self.bias]),
+                            'activation': np.array(json.dumps(self.activation.get_config())),
+                            'loss': np.array(self.loss.name)},
+                     mmap)
+
+    @classmethod
+    def load(cls, path, mmap_mode=None):
+        """
+        Recharge un neurone sauvegardé par `save`.
+
+        Args:
+            path: Fichier .npz ou dossier écrit avec mmap=True
+            mmap_mode: Mode de projection mémoire des poids (format dossier) :
+                       'r' pour la prédiction seule, 'r+' ou 'c' pour l'entraînement
+
+        Le neurone rechargé garde le type des poids sauvegardés. Les fichiers
+        antérieurs sans activation ni perte donnent sigmoid et "mse".
+        """
+        arrays = _load_arrays(path, ('weights', 'bias'), mmap_mode,
+                              optional=('activation', 'loss'))
+        neurone = cls.__new__(cls)
+        neurone.activation = get_activation(json.loads(str(arrays['activation']))
+                                            if 'activation' in arrays else 'sigmoid')
+        neurone.loss = get_loss(str(arrays['loss']) if 'loss' in arrays else 'mse')
+        weights = arrays['weights']
+        if not np.issubdtype(weights.dtype, np.floating):
+            weights = weights.astype(np.float64)
+        neurone.weights = weights if mmap_mode else np.array(weights)
+        neurone.bias = float(arrays['bias'][0])
+        neurone.weights_version = 0
+        return neurone
+
+    def load_weights(self, source):
+        """
+        Remplace les poids et le biais par ceux d'un fichier ou d'un autre neurone
+        (convertis dans le type de ce neurone).
+
+        Args:
+            source: Chemin accepté par `load`, ou instance de Neurone
+        """
+        if not isinstance(source, Neurone):
+            source = Neurone.load(source)
+        if len(source.weights) != len(self.weights):
+            raise ValueError(f"Poids incompatibles: {len(source.weights)} entrées "
+                             f"au lieu de {len(self.weights)}")
+        self.weights = np.array(source.weights, dtype=self.dtype)
+        self.bias = float(source.bias)
+        self.weights_version += 1
 
     def predict(self, inputs):
-        # Calcul de la sortie : somme pondérée + biais, puis sigmoïde
+        if _is_sparse(inputs):
+            return self.predict_batch(inputs)
+        # Calcul de la sortie : somme pondérée + biais, puis activation,
+        # dans le type du neurone (comme fit et predict_batch)
+        inputs = np.asarray(inputs, dtype=self.weights.dtype)
         weighted_sum = np.dot(inputs, self.weights) + self.bias
-        return sigmoid(weighted_sum)
+        if inputs.ndim == 1:
+            return self.activation.scalar(weighted_sum)
+        return self.activation.forward(weighted_sum, out=weighted_sum)
+
+    def predict_batch(self, X):
+        """
+        Sorties du neurone pour toutes les lignes d'une matrice, en un seul produit.
+
+        Args:
+            X: Matrice des entrées (n_exemples, n_inputs), dense ou creuse ; un
+               exemple seul (vecteur) est traité comme une matrice d'une ligne
+
+        Returns:
+            Vecteur des sorties (n_exemples,)
+        """
+        if _is_sparse(X):
+            output = _as_csr(X, self.dtype) @ self.weights
+        else:
+            X = np.atleast_2d(np.asarray(X, dtype=self.dtype))
+            if X.ndim != 2:
+                raise ValueError(f"X doit être de forme (n_exemples, {len(self.weights)})")
+            output = X @ self.weights
+        output += self.bias
+        return self.activation.forward(output, out=output)
+
+    def predict_proba(self, X):
+        """
+        Probabilités des deux classes pour chaque ligne de X.
+
+        Returns:
+            Matrice (n_exemples, 2) : colonnes P(classe 0) et P(classe 1)
+        """
+        p = self.predict_batch(X)
+        return np.column_stack((1 - p, p))
+
+    def predict_labels(self, X, threshold=0.5):
+        """
+        Classes prédites (0 ou 1) pour chaque ligne de X.
+
+        Args:
+            X: Matrice des entrées (n_exemples, n_inputs)
+            threshold: Seuil de décision sur la sortie du neurone
+        """
+        return (self.predict_batch(X) >= threshold).astype(int)
+
+    def train(self, inputs, target, learning_rate=0.1, optimizer=None):
+        inputs = np.asarray(inputs, dtype=self.dtype)
+
+        # Pré-activation, puis erreur et terme de correction selon la perte
+        # (version scalaire de la perte : aucun tableau alloué pour un exemple)
+        weighted_sum = float(np.dot(inputs, self.weights)) + self.bias
+        loss_value, delta = self.loss.scalar(self.activation, weighted_sum, target)
+
+        if optimizer is None:
+            # Ajustement des poids et du biais
+            self.weights += learning_rate * delta * inputs
+            self.bias += learning_rate * delta
+            self.weights_version += 1
+        else:
+            # L'optimiseur reçoit le gradient de la perte (signe opposé à la correction)
+            bias = np.array([self.bias])
+            optimizer.step((self.weights, bias), (-delta * inputs, np.array([-delta])))
+            self.bias = float(bias[0])
+            self.weights_version += 1
+
+        # Retourner l'erreur de l'exemple pour le suivi (erreur absolue avec "mse")
+        return loss_value
+
+    # Au-delà de ce nombre d'entrées, la méthode "newton" passe à L-BFGS
+    # (le hessien (n+1)x(n+1) devient trop coûteux à former et à factoriser)
+    newton_max_features = 500
+
+    def fit(self, X, y, epochs=1000, batch_size=None, learning_rate=0.1,
+            shuffle=True, record_every=1, method="gd", tol=1e-6, l2=1e-4,
+            optimizer=None, monitor=None, history=None, warm_start=None, callbacks=None):
+        """
+        Entraîne le neurone sur tout le jeu de données par lots vectorisés.
+
+        Pour chaque lot, la passe avant, l'erreur et le gradient sont calculés
+        en une seule opération matricielle, dans des tampons de travail alloués
+        une fois avant la boucle. Le gradient est moyenné sur le lot.
+
+        Avec method="newton", le neurone est ajusté comme une régression
+        logistique par IRLS (Newton-Raphson sur l'entropie croisée), qui converge
+        en quelques dizaines d'itérations ; au-delà de `newton_max_features`
+        entrées, L-BFGS est utilisé à la place. Le résultat est écrit dans
+        `weights` et `bias`.
+
+        La perte du neurone (`loss`) fixe la mise à jour et l'erreur enregistrée
+        dans l'historique : erreur absolue moyenne avec "mse", entropie croisée
+        avec "bce", perte charnière avec "hinge". Les méthodes "newton" et
+        "lbfgs" minimisent toujours l'entropie croisée.
+
+        X et y sont convertis dans le type du neurone (`dtype`), ainsi que les
+        tampons de travail et l'historique créé par défaut ; les méthodes
+        "newton" et "lbfgs" calculent toujours en float64.
+
+        X peut être une matrice creuse scipy.sparse (CSR ou COO, "gd"
+        uniquement) : chaque lot ne met alors à jour que les poids des colonnes
+        non nulles du lot (avec SGD ; les autres optimiseurs reçoivent un
+        gradient dense, nul hors de ces colonnes).
+
+        Args:
+            X: Matrice des entrées (n_exemples, n_inputs), dense ou creuse
+            y: Vecteur des cibles (n_exemples,)
+            epochs: Nombre d'époques (itérations maximales pour "newton"/"lbfgs")
+            batch_size: Taille des mini-lots (None = lot complet, "gd" uniquement)
+            learning_rate: Taux d'apprentissage ("gd" sans optimiseur uniquement)
+            shuffle: Mélanger les exemples à chaque époque (mini-lots uniquement)
+            record_every: Enregistrer l'historique toutes les k époques ("gd" uniquement)
+            method: "gd" (descente de gradient), "newton" (IRLS) ou "lbfgs"
+            tol: Tolérance de convergence ("newton"/"lbfgs")
+            l2: Régularisation L2 des poids ("newton"/"lbfgs"), nécessaire pour
+                que la solution reste finie sur des données séparables
+            optimizer: Optimiseur de `optimiseurs` ("gd" uniquement) ; par défaut
+                       SGD(learning_rate). Son planificateur est appelé à chaque époque.
+            monitor: ConvergenceMonitor de `convergence` ("gd" uniquement) ;
+                     l'entraînement s'arrête dès qu'un de ses critères est atteint
+                     et la dernière époque effectuée est enregistrée dans l'historique
+            history: TrainingHistory à compléter (None = nouvel historique,
+                     décimé selon record_every)
+            warm_start: Fichier ou Neurone dont les poids servent de point de départ
+            callbacks: Liste de rappels de `callbacks` ("gd" uniquement) ; un
+                       TrainingProfiler y chronomètre chaque phase des lots
+
+        Returns:
+            TrainingHistory ; `errors, weights, bias = neurone.fit(...)` donne
+            directement les tableaux de l'historique
+        """
+        dtype = self.dtype
+        sparse = _is_sparse(X)
+        X = _as_csr(X, dtype) if sparse else np.ascontiguousarray(X, dtype=dtype)
+        y = np.ascontiguousarray(y, dtype=dtype).ravel()
+        if X.ndim != 2 or X.shape[1] != len(self.weights):
+            raise ValueError(f"X doit être de forme (n_exemples, {len(self.weights)})")
+        if y.shape[0] != X.shape[0]:
+            raise ValueError("X et y doivent avoir le même nombre d'exemples")
+
+        if warm_start is not None:
+            self.load_weights(warm_start)
+        if history is None:
+            history = TrainingHistory(X.shape[1], decimation=record_every, dtype=dtype)
+
+        if sparse and method != "gd":
+            raise ValueError("Les entrées creuses ne sont prises en charge qu'avec method='gd'")
+        if method in ("newton", "lbfgs"):
+            if self.activation.name != 'sigmoid':
+                raise ValueError(f"La méthode {method!r} suppose une activation sigmoïde")
+            # Hessien et recherche linéaire : toujours en double précision
+            X64, y64 = X.astype(np.float64, copy=False), y.astype(np.float64, copy=False)
+            if method == "lbfgs" or X.shape[1] > self.newton_max_features:
+                return self._fit_lbfgs(X64, y64, epochs, tol, l2, history)
+            return self._fit_newton(X64, y64, epochs, tol, l2, history)
+        if method != "gd":
+            raise ValueError(f"Méthode inconnue: {method!r} (attendu: 'gd', 'newton', 'lbfgs')")
+
+        n_samples, n_inputs = X.shape
+        if batch_size is None or batch_size > n_samples:
+            batch_size = n_samples
+
+        # Tampons de travail réutilisés d'un lot à l'autre
+        output = np.empty(batch_size, dtype=dtype)
+        error = np.empty(batch_size, dtype=dtype)
+        delta = np.empty(batch_size, dtype=dtype)
+        grad = np.empty(n_inputs, dtype=dtype)
+        bias = np.array([self.bias])
+        bias_grad = np.empty(1)
+
+        if optimizer is None:
+            optimizer = SGD(learning_rate)
+
+        shuffled = shuffle and batch_size < n_samples
+        if shuffled and sparse:
+            X_work, y_work = X, np.empty_like(y)
+        elif shuffled:
+            X_work, y_work = np.empty_like(X), np.empty_like(y)
+        else:
+            X_work, y_work = X, y
+
+        if monitor is not None:
+            monitor.reset()
+            monitor.start()
+        callbacks = CallbackList(callbacks)
+        profiler = callbacks.profiler
+        callbacks.on_train_begin(self, {})
+
+        batch_index = 0
+        for epoch in range(epochs):
+            optimizer.set_epoch(epoch)
+            if shuffled:
+                order = np.random.permutation(n_samples)
+                if sparse:
+                    X_work = X[order]
+                else:
+                    np.take(X, order, axis=0, out=X_work)
+                np.take(y, order, out=y_work)
 
-    def train(self, inputs, target, learning_rate=0.1):
-        # Prédiction
-        output = self.predict(inputs)
+            error_sum = 0.0
+            for start in range(0, n_samples, batch_size):
+                stop = min(start + batch_size, n_samples)
+                m = stop - start
+                if sparse:
+                    batch_error = self._fit_sparse_batch(X_work[start:stop], y_work[start:stop],
+                                                         optimizer, grad, bias, bias_grad,
+                                                         profiler)
+                else:
+                    batch_error = self._fit_batch(X_work[start:stop], y_work[start:stop],
+                                                  optimizer, output[:m], error[:m],
+                                                  delta[:m], grad, bias, bias_grad, profiler)
+                error_sum += batch_error
+                if callbacks.batch_end:
+                    callbacks.on_batch_end(self, batch_index,
+                                           {'size': m, 'error_sum': batch_error})
+                batch_index += 1
 
-        # Calcul de l'erreur
-        error = target - output
+            avg_error = error_sum / n_samples
+            converged = False
+            if monitor is not None:
+                accuracy = None
+                if monitor.needs_accuracy:
+                    accuracy = float(np.mean((self.predict(X) >= 0.5) == (y >= 0.5)))
+                converged = monitor.update(epoch, avg_error, accuracy)
+            if callbacks.epoch_end:
+                converged = callbacks.on_epoch_end(self, epoch, {'error': avg_error}) or converged
 
-        # Ajustement des poids et du biais
-        self.weights += learning_rate * error * sigmoid_derivative(output) * inputs
-        # S'assurer que le biais reste un scalaire
-        self.bias += float(learning_rate * error * sigmoid_derivative(output))
-        
-        # Retourner l'erreur absolue pour le suivi
-        return abs(error)
+            history.append(epoch, avg_error, self.weights, self.bias, force=converged)
+            if converged:
+                break
+
+        callbacks.on_train_end(self, {'epochs': epoch + 1 if epochs else 0, 'history': history})
+        return history
+
+    def fit_stream(self, source, epochs=1, learning_rate=0.1, optimizer=None, monitor=None,
+                   history=None, warm_start=None, callbacks=None):
+        """
+        Entraîne le neurone à partir d'une source de mini-lots (voir `sources`).
+
+        Les lots sont lus au fur et à mesure : la mémoire utilisée ne dépend que
+        de la taille des lots, pas de celle du jeu de données. Les lots peuvent
+        être des matrices creuses, traitées comme dans `fit`.
+
+        Args:
+            source: Itérable ré-itérable de couples (X, y), une passe par époque
+            epochs: Nombre d'époques
+            learning_rate: Taux d'apprentissage (sans optimiseur)
+            optimizer: Optimiseur de `optimiseurs` ; par défaut SGD(learning_rate)
+            monitor: ConvergenceMonitor optionnel, mis à jour à chaque époque ;
+                     s'il vise une précision, elle est mesurée sur les lots de
+                     l'époque, chacun avant sa mise à jour (la source n'est
+                     pas relue)
+            history: TrainingHistory à compléter (None = une entrée par époque)
+            warm_start: Fichier ou Neurone dont les poids servent de point de départ
+            callbacks: Liste de rappels de `callbacks`, comme pour `fit`
+
+        Returns:
+            TrainingHistory
+        """
+        if warm_start is not None:
+            self.load_weights(warm_start)
+        n_inputs = len(self.weights)
+        dtype = self.dtype
+        if history is None:
+            history = TrainingHistory(n_inputs, dtype=dtype)
+
+        # Tampons de travail, agrandis si un lot dépasse leur taille
+        capacity = 0
+        grad = np.empty(n_inputs, dtype=dtype)
+        bias = np.array([self.bias])
+        bias_grad = np.empty(1)
+
+        if optimizer is None:
+            optimizer = SGD(learning_rate)
+        if monitor is not None:
+            monitor.reset()
+            monitor.start()
+        callbacks = CallbackList(callbacks)
+        profiler = callbacks.profiler
+        callbacks.on_train_begin(self, {})
+
+        batch_index = 0
+        for epoch in range(epochs):
+            optimizer.set_epoch(epoch)
+            error_sum = 0.0
+            n_seen = 0
+            n_correct = 0
+            needs_accuracy = monitor is not None and monitor.needs_accuracy
+            for X, y in source:
+                sparse = _is_sparse(X)
+                X = _as_csr(X, dtype) if sparse else np.ascontiguousarray(X, dtype=dtype)
+                y = np.ascontiguousarray(y, dtype=dtype).ravel()
+                if X.ndim != 2 or X.shape[1] != n_inputs:
+                    raise ValueError(f"Les lots doivent être de forme (n_exemples, {n_inputs})")
+                m = X.shape[0]
+                if needs_accuracy:
+                    n_correct += int(np.count_nonzero((self.predict_batch(X) >= 0.5) == (y >= 0.5)))
+                if sparse:
+                    batch_error = self._fit_sparse_batch(X, y, optimizer, grad, bias, bias_grad,
+                                                         profiler)
+                else:
+                    if m > capacity:
+                        capacity = m
+                        output, error, delta = (np.empty(m, dtype=dtype), np.empty(m, dtype=dtype),
+                                                np.empty(m, dtype=dtype))
+                    batch_error = self._fit_batch(X, y, optimizer, output[:m], error[:m],
+                                                  delta[:m], grad, bias, bias_grad, profiler)
+                error_sum += batch_error
+                n_seen += m
+                if callbacks.batch_end:
+                    callbacks.on_batch_end(self, batch_index,
+                                           {'size': m, 'error_sum': batch_error})
+                batch_index += 1
+
+            if n_seen == 0:
+                raise ValueError("La source n'a produit aucun exemple")
+            avg_error = error_sum / n_seen
+            converged = False
+            if monitor is not None:
+                accuracy = n_correct / n_seen if needs_accuracy else None
+                converged = monitor.update(epoch, avg_error, accuracy)
+            if callbacks.epoch_end:
+                converged = callbacks.on_epoch_end(self, epoch, {'error': avg_error}) or converged
+            history.append(epoch, avg_error, self.weights, self.bias, force=converged)
+            if converged:
+                break
+
+        callbacks.on_train_end(self, {'epochs': epoch + 1 if epochs else 0, 'history': history})
+        return history
+
+    def _fit_batch(self, X, y, optimizer, output, error, delta, grad, bias, bias_grad,
+                   profiler=None):
+        """
+        Une mise à jour de gradient sur un lot, sans allocation temporaire.
+
+        Si un TrainingProfiler est fourni, la durée de la passe avant, du
+        gradient et de la mise à jour lui est transmise ; sinon la seule
+        dépense est un test `is not None` par phase.
+
+        Returns:
+            Somme des erreurs du lot selon la perte (avant la mise à jour)
+        """
+        m = X.shape[0]
+        if profiler is not None:
+            t0 = time.perf_counter()
+
+        # Passe avant X·w + b, puis perte et delta = -dL/dz (voir `pertes`)
+        np.matmul(X, self.weights, out=output)
+        output += self.bias
+        error_sum = self.loss.batch(self.activation, output, y, error, delta)
+        if profiler is not None:
+            t1 = time.perf_counter()
+
+        # Gradient moyen de la perte sur le lot, appliqué par l'optimiseur
+        np.matmul(delta, X, out=grad)
+        grad *= -1.0 / m
+        bias_grad[0] = -delta.sum() / m
+        if profiler is not None:
+            t2 = time.perf_counter()
+
+        bias[0] = self.bias
+        optimizer.step((self.weights, bias), (grad, bias_grad))
+        self.bias = float(bias[0])
+        self.weights_version += 1
+        if profiler is not None:
+            t3 = time.perf_counter()
+            profiler.record_batch(m, t1 - t0, t2 - t1, t3 - t2)
+
+        return error_sum
+
+    def _fit_sparse_batch(self, X, y, optimizer, grad, bias, bias_grad, profiler=None):
+        """
+        Une mise à jour de gradient sur un lot creux (CSR).
+
+        Le gradient n'est calculé que sur les colonnes présentes dans le lot :
+        coût proportionnel au nombre de valeurs non nulles, pas à n_inputs.
+        Avec SGD, seuls ces poids sont modifiés ; les optimiseurs à état
+        (inertie, Adam...) reçoivent le gradient dense complet dans `grad`.
+
+        Returns:
+            Somme des erreurs du lot selon la perte (avant la mise à jour)
+        """
+        m = X.shape[0]
+        if profiler is not None:
+            t0 = time.perf_counter()
+
+        # Passe avant : seules les valeurs non nulles interviennent
+        output = X @ self.weights
+        output += self.bias
+        error, delta = np.empty_like(output), np.empty_like(output)
+        error_sum = self.loss.batch(self.activation, output, y, error, delta)
+        if profiler is not None:
+            t1 = time.perf_counter()
+
+        # Gradient par colonne active
+        columns, position = np.unique(X.indices, return_inverse=True)
+        contributions = X.data * np.repeat(delta, np.diff(X.indptr))
+        active_grad = np.bincount(position, weights=contributions, minlength=len(columns))
+        active_grad *= -1.0 / m
+        bias_grad[0] = -delta.sum() / m
+        if profiler is not None:
+            t2 = time.perf_counter()
+
+        if type(optimizer) is SGD:
+            optimizer.iterations += 1
+            active_grad *= optimizer.learning_rate
+            self.weights[columns] -= active_grad
+            self.bias -= optimizer.learning_rate * bias_grad[0]
+        else:
+            grad[:] = 0.0
+            grad[columns] = active_grad
+            bias[0] = self.bias
+            optimizer.step((self.weights, bias), (grad, bias_grad))
+            self.bias = float(bias[0])
+        self.weights_version += 1
+        if profiler is not None:
+            t3 = time.perf_counter()
+            profiler.record_batch(m, t1 - t0, t2 - t1, t3 - t2)
+
+        return error_sum
+
+    def _fit_newton(self, X, y, max_iter, tol, l2, history):
+        """
+        Régression logistique par IRLS : à chaque itération, résout
+        H·d = g avec le hessien H = Xᵀ·diag(p(1-p))·X / m + l2.
+        """
+        Xa = np.hstack([X, np.ones((X.shape[0], 1))])
+        theta = np.append(self.weights.astype(np.float64), self.bias)
+        m, n = Xa.shape
+        # Le biais n'est pas régularisé ; petit terme de stabilité sur la diagonale
+        ridge = np.full(n, float(l2))
+        ridge[-1] = 0.0
+        ridge += 1e-10
+
+        loss = _logistic_loss(Xa, y, theta, ridge)
+        iteration = 0
+        for iteration in range(max_iter):
+            p = sigmoid(Xa @ theta)
+            _record_iteration(history, iteration, y, p, theta)
+
+            grad = Xa.T @ (p - y) / m + ridge * theta
+            s = p * (1 - p)
+            hessian = (Xa.T * s) @ Xa / m
+            hessian[np.diag_indices(n)] += ridge
+            step = np.linalg.solve(hessian, grad)
+
+            # Pas de Newton amorti si la perte augmente
+            t = 1.0
+            new_loss = _logistic_loss(Xa, y, theta - step, ridge)
+            while new_loss > loss and t > 1e-8:
+                t *= 0.5
+                new_loss = _logistic_loss(Xa, y, theta - t * step, ridge)
+            theta -= t * step
+
+            converged = abs(loss - new_loss) < tol or np.max(np.abs(t * step)) < tol
+            loss = new_loss
+            if converged:
+                break
+
+        self.weights = theta[:-1].astype(self.dtype)
+        self.bias = float(theta[-1])
+        self.weights_version += 1
+        _record_iteration(history, iteration + 1, y, sigmoid(Xa @ theta), theta)
+        return history
+
+    def _fit_lbfgs(self, X, y, max_iter, tol, l2, history, memory=10):
+        """
+        Régression logistique par L-BFGS (récursion à deux boucles et
+        recherche linéaire d'Armijo), sans jamais former le hessien.
+        """
+        Xa = np.hstack([X, np.ones((X.shape[0], 1))])
+        theta = np.append(self.weights.astype(np.float64), self.bias)
+        m, n = Xa.shape
+        ridge = np.full(n, float(l2))
+        ridge[-1] = 0.0
+
+        def loss_and_grad(theta):
+            z = Xa @ theta
+            loss = _logistic_loss(Xa, y, theta, ridge, z)
+            grad = Xa.T @ (sigmoid(z) - y) / m + ridge * theta
+            return loss, grad
+
+        s_list, y_list = [], []
+        loss, grad = loss_and_grad(theta)
+        iteration = 0
+        for iteration in range(max_iter):
+            _record_iteration(history, iteration, y, sigmoid(Xa @ theta), theta)
+            if np.max(np.abs(grad)) < tol:
+                break
+
+            # Récursion à deux boucles : direction ≈ -H⁻¹·g
+            q = grad.copy()
+            alphas = []
+            for s_k, y_k in reversed(list(zip(s_list, y_list))):
+                alpha = s_k @ q / (y_k @ s_k)
+                q -= alpha * y_k
+                alphas.append(alpha)
+            if s_list:
+                q *= (s_list[-1] @ y_list[-1]) / (y_list[-1] @ y_list[-1])
+            for (s_k, y_k), alpha in zip(zip(s_list, y_list), reversed(alphas)):
+                beta = y_k @ q / (y_k @ s_k)
+                q += (alpha - beta) * s_k
+            direction = -q
+
+            # Recherche linéaire d'Armijo
+            t = 1.0
+            slope = grad @ direction
+            new_loss, new_grad = loss_and_grad(theta + t * direction)
+            while new_loss > loss + 1e-4 * t * slope and t > 1e-10:
+                t *= 0.5
+                new_loss, new_grad = loss_and_grad(theta + t * direction)
+
+            s_k = t * direction
+            y_k = new_grad - grad
+            if s_k @ y_k > 1e-12:
+                s_list.append(s_k)
+                y_list.append(y_k)
+                if len(s_list) > memory:
+                    s_list.pop(0)
+                    y_list.pop(0)
+
+            theta = theta + s_k
+            converged = abs(loss - new_loss) < tol * max(1.0, abs(loss))
+            loss, grad = new_loss, new_grad
+            if converged:
+                break
+
+        self.weights = theta[:-1].astype(self.dtype)
+        self.bias = float(theta[-1])
+        self.weights_version += 1
+        _record_iteration(history, iteration + 1, y, sigmoid(Xa @ theta), theta)
+        return history
+
+
+# Enregistrement d'une itération des solveurs du second ordre dans l'historique
+def _record_iteration(history, iteration, y, p, theta):
+    history.append(iteration, np.abs(y - p).mean(), theta[:-1], theta[-1], force=True)
+
+
+# Entropie croisée moyenne régularisée, log(1 + exp(z)) calculé sans dépassement
+def _logistic_loss(Xa, y, theta, ridge, z=None):
+    if z is None:
+        z = Xa @ theta
+    return float(np.mean(np.logaddexp(0, z) - y * z) + 0.5 * np.sum(ridge * theta ** 2))
 
 
 # Exemple d'utilisation
 if __name__ == "__main__":
-    # Création d'un neurone avec 2 entrées
-    neurone = Neurone(n_inputs=2)
+    # Création d'un neurone avec 2 entrées, à partir du modèle sauvegardé s'il existe.
+    # L'entropie croisée ("bce") évite le gradient évanescent de la sigmoïde
+    # saturée : environ 20 fois moins d'époques qu'avec l'erreur quadratique
+    model_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'modeles', 'or.npz')
+    if os.path.exists(model_path):
+        print(f"Reprise depuis le modèle sauvegardé: {model_path}")
+        neurone = Neurone(n_inputs=2, warm_start=model_path, loss='bce')
+    else:
+        neurone = Neurone(n_inputs=2, loss='bce')
 
     # Données d'entraînement : entrées et cible (ex : porte logique OR)
     X = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
@@ -126,26 +804,17 @@ if __name__ == "__main__":
     print(f"Poids initiaux: {initial_weights}")
     print(f"Biais initial: {initial_bias}")
 
-    # Historique pour les graphiques
-    errors_history = []
-    weights_history = []
-    bias_history = []
-    
-    # Entraînement
+    # Historique borné : une entrée toutes les 10 époques, au plus 5000 entrées
+    history = TrainingHistory(n_inputs=2, decimation=10, max_records=5000)
+
+    # Entraînement vectorisé (lot complet), arrêté dès que l'erreur ne diminue
+    # plus significativement
     print(f"\nDébut de l'entraînement...")
-    n_epochs = 150000
-    for epoch in range(n_epochs):
-        epoch_errors = []
-        for i in range(len(X)):
-            error = neurone.train(X[i], y[i])
-            epoch_errors.append(error)
-        
-        # Enregistrer l'erreur moyenne et les paramètres toutes les 10 époques
-        if epoch % 10 == 0:
-            avg_error = np.mean(epoch_errors)
-            errors_history.append(avg_error)
-            weights_history.append(neurone.weights.copy())
-            bias_history.append(neurone.bias)
+    max_epochs = 150000
+    monitor = ConvergenceMonitor(loss_tol=0.02, patience=1000, min_delta=1e-4)
+    neurone.fit(X, y, epochs=max_epochs, learning_rate=0.1, monitor=monitor, history=history)
+    n_epochs = monitor.stopped_epoch + 1 if monitor.stopped else max_epochs
+    print(monitor.summary())
 
     # Calculer le nombre total d'itérations
     total_iterations = n_epochs * len(X)
@@ -157,10 +826,15 @@ if __name__ == "__main__":
     print(f"Nombre d'époques: {n_epochs}")
     print(f"Nombre d'exemples par époque: {len(X)}")
     print(f"Nombre total d'itérations: {total_iterations}")
-    print(f"Erreur finale moyenne: {errors_history[-1]:.6f}")
+    print(f"Entropie croisée finale: {history.errors[-1]:.6f}")
     print(f"Poids finaux: {neurone.weights}")
     print(f"Biais final: {neurone.bias}")
     
+    # Sauvegarder le modèle pour les prochaines exécutions
+    os.makedirs(os.path.dirname(model_path), exist_ok=True)
+    neurone.save(model_path)
+    print(f"Modèle sauvegardé: {model_path}")
+    
     # Test
     print(f"\n{'='*60}")
     print("PRÉDICTIONS")
@@ -176,7 +850,7 @@ if __name__ == "__main__":
 
     # Affichage des graphiques d'entraînement
     print("\nAffichage de l'évolution de l'entraînement...")
-    plot_training_history(errors_history, weights_history, bias_history)
+    plot_training_history(history)
     
     # Affichage de la fonction d'activation et de sa dérivée
     # print("\nAffichage de la fonction sigmoïde et de sa dérivée...")
@@ -10,15 +10,711 @@ import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 import matplotlib.patches as patches
+from matplotlib.collections import LineCollection, PatchCollection, PolyCollection
+import copy
+import queue
 import sys
 import os
+import threading
+import time
 
 # Importer la classe Neurone
 sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from neurone import Neurone, sigmoid
+from convergence import ConvergenceMonitor
+from historique import TrainingHistory
+
+
+class PredictionCache:
+    """
+    Prédictions du neurone sur le jeu d'entraînement, partagées par tous les panneaux.
+    
+    Le calcul (un seul predict_batch) n'est refait que lorsque le neurone, ses
+    poids (compteur weights_version) ou les données ont changé.
+    """
+    
+    def __init__(self):
+        self._key = None
+        self._predictions = None
+        
+    def get(self, neurone, X):
+        key = (neurone, neurone.weights_version, X)
+        if self._key is None or any(a is not b for a, b in zip(key, self._key)):
+            self._predictions = neurone.predict_batch(X)
+            self._key = key
+        return self._predictions
+
+
+class EpochScheduler:
+    """
+    Nombre d'époques par tranche d'entraînement, ajusté à un budget de temps.
+    
+    La durée d'une époque est mesurée (moyenne glissante) et chaque tranche
+    enchaîne autant d'époques que le budget (12 ms par défaut) en contient :
+    peu d'époques par tranche sur un gros jeu de données, beaucoup sur une
+    porte logique. Entre deux tranches, le thread lit ses commandes et publie
+    un instantané.
+    
+    Si l'interface signale un retard (`report_lag`), le budget est divisé par
+    deux et une pause est insérée entre les tranches, pour lui laisser la main ;
+    budget et pause reviennent progressivement à la normale dès que le retard
+    disparaît. `epochs_per_second` est la vitesse effectivement atteinte,
+    pauses comprises.
+    """
+    
+    # Retard de l'interface toléré avant de ralentir (s)
+    LAG_TOLERANCE = 0.02
+    MAX_PAUSE = 0.05
+    
+    def __init__(self, budget=0.012, min_budget=0.002, smoothing=0.2):
+        """
+        Args:
+            budget: Durée visée d'une tranche (s)
+            min_budget: Durée minimale d'une tranche quand l'interface est en retard
+            smoothing: Poids de la dernière mesure dans les moyennes glissantes
+        """
+        self.target_budget = budget
+        self.min_budget = min_budget
+        self.smoothing = smoothing
+        self.lag = 0.0
+        self.reset()
+        
+    def reset(self):
+        self.budget = self.target_budget
+        self.pause = 0.0
+        self.epoch_time = None
+        self.epochs_per_second = 0.0
+        self._last_record = None
+        
+    def _smooth(self, average, value):
+        return value if not average else average + self.smoothing * (value - average)
+        
+    def next_slice(self, max_epochs=None):
+        """Nombre d'époques de la prochaine tranche (au moins 1, au plus max_epochs)"""
+        if self.epoch_time is None:
+            return 1
+        count = max(1, int(self.budget / self.epoch_time))
+        return count if max_epochs is None else min(count, max_epochs)
+        
+    def record(self, epochs, elapsed):
+        """Enregistrer une tranche de `epochs` époques qui a duré `elapsed` secondes"""
+        now = time.perf_counter()
+        self.epoch_time = self._smooth(self.epoch_time, max(elapsed, 1e-9) / epochs)
+        wall = elapsed if self._last_record is None else now - self._last_record
+        self.epochs_per_second = self._smooth(self.epochs_per_second, epochs / max(wall, 1e-9))
+        self._last_record = now
+        
+        if self.lag > self.LAG_TOLERANCE:
+            self.budget = max(self.min_budget, self.budget / 2)
+            self.pause = min(self.MAX_PAUSE, 2 * self.pause or self.budget)
+        else:
+            self.budget = min(self.target_budget, self.budget * 1.25)
+            self.pause = self.pause / 2 if self.pause > 1e-3 else 0.0
+            
+    def report_lag(self, lag):
+        """Retard de l'interface par rapport à son rythme prévu (appelé par son thread)"""
+        self.lag = lag
+
+
+class TrainingWorker:
+    """
+    Entraînement du neurone dans un thread d'arrière-plan, piloté par messages.
+    
+    L'interface envoie des commandes ('load', 'start', 'stop', 'step',
+    'configure', 'quit') dans la file `commands` ; le thread entraîne sa propre
+    copie du neurone, indépendamment du rythme d'affichage, et publie des
+    instantanés (poids, biais, copie de l'historique) dans la file `snapshots`.
+    
+    Cette file ne contient que le dernier instantané : tant que l'interface n'a
+    pas consommé le précédent, aucun nouvel instantané n'est copié, sauf à
+    l'arrêt (l'état final n'est jamais perdu). Chaque chargement ouvre une
+    nouvelle session ; les instantanés d'une session précédente encore en file
+    sont reconnaissables à leur numéro. De même, 'start' et 'step' portent un
+    numéro de lancement (`run`) recopié dans les instantanés : l'état final
+    d'un lancement terminé, resté en file, ne peut pas arrêter le suivant.
+    
+    Les époques sont enchaînées par tranches dont la taille est fixée par un
+    EpochScheduler (`scheduler`), borné par le paramètre 'epochs_per_cycle'.
+    """
+    
+    def __init__(self):
+        self.commands = queue.Queue()
+        self.snapshots = queue.Queue(maxsize=1)
+        self.scheduler = EpochScheduler()
+        self.session = None
+        self.neurone = None
+        self.running = False
+        self.run = 0
+        self.params = {'learning_rate': 0.1, 'epochs_per_cycle': 100, 'early_stop': True}
+        self._thread = threading.Thread(target=self._run, name='entrainement', daemon=True)
+        self._thread.start()
+        
+    # ----- Messages (appelés depuis le thread de l'interface) -----
+    
+    def load(self, session, neurone, X, y, history, monitor):
+        """
+        Nouvelle session : le neurone et l'historique appartiennent désormais au
+        thread, qui entraîne avec une copie du moniteur de convergence (l'objet
+        passé n'est jamais modifié et peut resservir de modèle).
+        """
+        self.commands.put(('load', (session, neurone, X, y, history, copy.deepcopy(monitor))))
+        
+    def start(self, run=0, **params):
+        self.commands.put(('start', (run, params)))
+        
+    def stop(self):
+        self.commands.put(('stop', None))
+        
+    def step(self, run=0, **params):
+        self.commands.put(('step', (run, params)))
+        
+    def configure(self, **params):
+        self.commands.put(('configure', params))
+        
+    def quit(self):
+        self.commands.put(('quit', None))
+        self._thread.join()
+        
+    def latest_snapshot(self):
+        """Dernier instantané publié, ou None"""
+        try:
+            return self.snapshots.get_nowait()
+        except queue.Empty:
+            return None
+        
+    # ----- Thread d'entraînement -----
+    
+    def _run(self):
+        while True:
+            try:
+                if not self.running:
+                    command, payload = self.commands.get()
+                elif self.scheduler.pause:
+                    # L'interface est en retard : lui laisser la main entre deux tranches
+                    command, payload = self.commands.get(timeout=self.scheduler.pause)
+                else:
+                    command, payload = self.commands.get_nowait()
+            except queue.Empty:
+                self._train_slice()
+                continue
+            if command == 'quit':
+                return
+            self._handle(command, payload)
+            
+    def _handle(self, command, payload):
+        if command == 'load':
+            (self.session, self.neurone, self.X, self.y,
+             self.history, self.monitor) = payload
+            self.epoch = 0
+            self.running = False
+        elif command == 'configure':
+            self.params.update(payload)
+        elif self.neurone is None:
+            return
+        elif command == 'start':
+            self.run, params = payload
+            self.params.update(params)
+            self.monitor.reset()
+            self.monitor.start()
+            self.scheduler.reset()
+            self.running = True
+        elif command == 'stop':
+            self.running = False
+            self._publish(force=True)
+        elif command == 'step':
+            self.run, params = payload
+            self.params.update(params)
+            self._train_epoch()
+            self._publish(force=True)
+            
+    def _train_slice(self):
+        count = self.scheduler.next_slice(self.params['epochs_per_cycle'])
+        start = time.perf_counter()
+        for done in range(1, count + 1):
+            self._train_epoch()
+            if self._converged():
+                self.running = False
+                break
+        self.scheduler.record(done, time.perf_counter() - start)
+        self._publish(force=not self.running)
+        
+    def _train_epoch(self):
+        """Une époque d'apprentissage exemple par exemple"""
+        lr = self.params['learning_rate']
+        error_sum = 0.0
+        for x, target in zip(self.X, self.y):
+            error_sum += self.neurone.train(x, target, learning_rate=lr)
+        self.epoch += 1
+        self.history.append(self.epoch, error_sum / len(self.X), self.neurone.weights,
+                            self.neurone.bias)
+        
+    def _converged(self):
+        """Mettre à jour le moniteur de convergence, True si l'entraînement doit s'arrêter"""
+        if not self.params['early_stop']:
+            return False
+        accuracy = None
+        if self.monitor.needs_accuracy:
+            predictions = self.neurone.predict_batch(self.X)
+            accuracy = float(np.mean((predictions >= 0.5) == (self.y == 1)))
+        return self.monitor.update(self.epoch, self.history.last_error, accuracy)
+        
+    def _publish(self, force=False):
+        if self.snapshots.full():
+            if not force:
+                return
+            try:
+                self.snapshots.get_nowait()
+            except queue.Empty:
+                pass
+        self.snapshots.put({
+            'session': self.session,
+            'run': self.run,
+            'epoch': self.epoch,
+            'weights': self.neurone.weights.copy(),
+            'bias': self.neurone.bias,
+            'history': self.history.copy(),
+            'running': self.running,
+            'converged': self.monitor.stopped,
+            'convergence': self.monitor.summary() if self.monitor.stopped else None,
+            'epochs_per_second': self.scheduler.epochs_per_second,
+        })
+
+
+class RenderScheduler:
+    """
+    Planificateur de rendu : cadence plafonnée et panneaux redessinés à la demande.
+    
+    Chaque panneau (fonction de rendu, fonction de visibilité) est marqué
+    « sale » quand ses données changent ; une image est alors programmée, au
+    plus tôt 1/max_fps seconde après la précédente, et ne redessine que les
+    panneaux sales et visibles. Un panneau caché reste sale jusqu'à ce qu'il
+    redevienne visible : il suffit alors d'appeler `request` (changement
+    d'onglet) pour qu'il soit redessiné.
+    """
+    
+    def __init__(self, after, max_fps=30):
+        """
+        Args:
+            after: Fonction de programmation (délai en ms, rappel), ex: root.after
+            max_fps: Nombre maximal d'images par seconde
+        """
+        self.after = after
+        self.max_fps = max_fps
+        self.panels = {}
+        self.dirty = set()
+        self.frames = 0
+        self._pending = False
+        self._last_frame = None
+        
+    def add_panel(self, name, render, visible=None):
+        """Enregistrer un panneau ; visible=None : toujours visible"""
+        self.panels[name] = (render, visible)
+        self.dirty.add(name)
+        
+    def mark_dirty(self, *names):
+        """Marquer des panneaux à redessiner (tous si aucun nom) et programmer une image"""
+        self.dirty.update(names or self.panels)
+        self.request()
+        
+    def request(self):
+        """Programmer une image si des panneaux sales sont visibles"""
+        if self._pending or not self.dirty:
+            return
+        delay = 0.0
+        if self._last_frame is not None:
+            delay = self._last_frame + 1.0 / self.max_fps - time.perf_counter()
+        self._pending = True
+        self.after(max(0, int(delay * 1000)), self._frame)
+        
+    def _frame(self):
+        self._pending = False
+        self.flush()
+        
+    def flush(self):
+        """Redessiner immédiatement les panneaux sales et visibles"""
+        rendered = False
+        for name, (render, visible) in self.panels.items():
+            if name in self.dirty and (visible is None or visible()):
+                self.dirty.discard(name)
+                render()
+                rendered = True
+        if rendered:
+            self._last_frame = time.perf_counter()
+            self.frames += 1
+
+
+class StructurePlot:
+    """
+    Schéma du neurone (entrées, connexions pondérées, sortie) construit une
+    seule fois par nombre d'entrées.
+    
+    Les connexions forment une LineCollection et les entrées une
+    PatchCollection (ou une image, voir plus bas) : une mise à jour ne change
+    que des couleurs, des épaisseurs et quelques textes. Comme pour LearningPlots, seuls ces
+    éléments « animés » sont redessinés sur le fond mémorisé (blitting).
+    
+    Au-delà de LABEL_THRESHOLD entrées, le schéma est agrégé : les entrées
+    deviennent une image d'une colonne, un pixel de donnée par entrée coloré
+    selon son poids (set_data à chaque mise à jour), les connexions
+    sont regroupées en au plus MAX_CONNECTIONS faisceaux d'entrées voisines
+    (poids moyen), et les étiquettes individuelles sont remplacées par un
+    résumé. Le coût d'une mise à jour ne dépend alors plus du nombre d'entrées.
+    """
+    
+    LABEL_THRESHOLD = 10
+    MAX_CONNECTIONS = 64
+    INPUT_X = 0.5
+    OUTPUT = (3, 2)
+    
+    def __init__(self, figure, canvas):
+        self.figure = figure
+        self.canvas = canvas
+        self.ax = figure.add_subplot(111)
+        self.ax.set_facecolor('#1e1e1e')
+        self.ax.set_xlim(-1, 4)
+        self.ax.set_ylim(-1, 4)
+        self.ax.axis('off')
+        
+        # Éléments fixes : neurone de sortie, titre ; le biais est mis à jour
+        output_x, output_y = self.OUTPUT
+        self.ax.add_patch(patches.Circle(self.OUTPUT, 0.2, facecolor='#2196F3',
+                                         edgecolor='white', linewidth=3, zorder=3))
+        self.ax.text(output_x, output_y, 'Σ', fontsize=16, color='white',
+                     ha='center', va='center', zorder=4)
+        self.ax.text(output_x + 0.4, output_y, 'Output', fontsize=12, color='white', va='center')
+        self.ax.text(2, 3.8, 'Structure du Neurone', fontsize=14, color='white',
+                     ha='center', weight='bold')
+        self.bias_text = self.ax.text(output_x, -0.3, '', fontsize=11, color='cyan',
+                                      bbox=dict(boxstyle='round', facecolor='#2b2b2b',
+                                                edgecolor='cyan', linewidth=2), animated=True)
+        
+        self.n_inputs = None
+        self.connections = None
+        self.inputs = None
+        self.labels = []
+        self.weight_labels = []
+        self.summary_text = None
+        self._background = None
+        canvas.mpl_connect('draw_event', self._on_draw)
+        
+    def _build(self, n_inputs):
+        """Créer les collections et étiquettes pour n_inputs entrées"""
+        for artist in [self.connections, self.inputs, self.summary_text,
+                       *self.labels, *self.weight_labels]:
+            if artist is not None:
+                artist.remove()
+        self.n_inputs = n_inputs
+        self.detailed = n_inputs <= self.LABEL_THRESHOLD
+        positions = np.linspace(0.5, 3.5, n_inputs)
+        output_x, output_y = self.OUTPUT
+        mid_x = (self.INPUT_X + output_x) / 2
+        
+        # Faisceaux d'entrées consécutives (une entrée par faisceau en mode détaillé)
+        n_lines = min(n_inputs, self.MAX_CONNECTIONS)
+        groups = np.array_split(np.arange(n_inputs), n_lines)
+        self._starts = np.array([group[0] for group in groups])
+        self._counts = np.array([len(group) for group in groups])
+        self.width_scale = min(1.0, self.LABEL_THRESHOLD / n_lines)
+        
+        segments = np.empty((n_lines, 2, 2))
+        segments[:, 0, 0] = self.INPUT_X + (0.15 if self.detailed else 0.1)
+        segments[:, 0, 1] = np.add.reduceat(positions, self._starts) / self._counts
+        segments[:, 1] = (output_x - 0.15, output_y)
+        self.connections = LineCollection(segments, zorder=1, animated=True)
+        self.ax.add_collection(self.connections)
+        
+        if self.detailed:
+            self.inputs = PatchCollection([patches.Circle((self.INPUT_X, y), 0.15)
+                                           for y in positions],
+                                          facecolor='#4CAF50', edgecolor='white', linewidth=2,
+                                          zorder=2)
+            self.labels = [self.ax.text(self.INPUT_X - 0.4, y, f'x{i+1}', fontsize=12,
+                                        color='white', va='center')
+                           for i, y in enumerate(positions)]
+            self.weight_labels = [self.ax.text(mid_x, (y + output_y) / 2, '', fontsize=9,
+                                               color='yellow',
+                                               bbox=dict(boxstyle='round', facecolor='#2b2b2b',
+                                                         alpha=0.8), animated=True)
+                                  for y in positions]
+            self.summary_text = None
+            self.ax.add_collection(self.inputs)
+        else:
+            # Une seule image (n_inputs × 1), ligne 0 = x1 en bas : son coût de
+            # dessin ne dépend que de sa taille à l'écran
+            height = 3.0 / (n_inputs - 1)
+            self.inputs = self.ax.imshow(np.zeros((n_inputs, 1, 4)), origin='lower',
+                                         extent=(self.INPUT_X - 0.1, self.INPUT_X + 0.1,
+                                                 positions[0] - height / 2,
+                                                 positions[-1] + height / 2),
+                                         aspect='auto', interpolation='nearest', zorder=2,
+                                         animated=True)
+            # imshow recadre les axes sur l'image
+            self.ax.set_xlim(-1, 4)
+            self.ax.set_ylim(-1, 4)
+            self.labels = [self.ax.text(self.INPUT_X - 0.4, y, name, fontsize=10,
+                                        color='white', va='center')
+                           for y, name in ((positions[0], 'x1'),
+                                           (positions[-1], f'x{n_inputs}'))]
+            self.weight_labels = []
+            self.summary_text = self.ax.text(self.INPUT_X - 0.4, -0.3, '', fontsize=9,
+                                             color='yellow', va='center', animated=True)
+        
+        # Le fond a changé : le prochain update redessine tout
+        self._background = None
+        
+    @staticmethod
+    def _weight_colors(weights):
+        """Vert si positif, rouge sinon ; opacité selon la valeur absolue (plafonnée à 1)"""
+        colors = np.zeros((len(weights), 4))
+        positive = weights > 0
+        colors[positive, 1] = 0.5
+        colors[~positive, 0] = 1.0
+        np.minimum(np.abs(weights), 1.0, out=colors[:, 3])
+        return colors
+        
+    def update(self, neurone):
+        """Mettre à jour couleurs, épaisseurs et textes, puis redessiner"""
+        weights = np.asarray(neurone.weights, dtype=float)
+        if len(weights) != self.n_inputs:
+            self._build(len(weights))
+        
+        if self.detailed:
+            mean, magnitude = weights, np.abs(weights)
+            for label, weight in zip(self.weight_labels, weights):
+                label.set_text(f'{weight:.2f}')
+        else:
+            mean = np.add.reduceat(weights, self._starts) / self._counts
+            magnitude = np.add.reduceat(np.abs(weights), self._starts) / self._counts
+            self.inputs.set_data(self._weight_colors(weights)[:, None, :])
+            positives = int((weights > 0).sum())
+            self.summary_text.set_text(f'{len(weights)} entrées : {positives} poids > 0, '
+                                       f'de {weights.min():.2f} à {weights.max():.2f}')
+        self.connections.set_color(self._weight_colors(mean))
+        self.connections.set_linewidths((magnitude * 3 + 0.5) * self.width_scale)
+        self.bias_text.set_text(f'Biais: {neurone.bias:.3f}')
+        
+        if self._background is None:
+            # Dessin complet ; les éléments animés sont ajoutés par _on_draw
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.ax.bbox)
+        
+    def _draw_animated(self):
+        for artist in [self.connections, self.inputs, *self.weight_labels,
+                       self.summary_text, self.bias_text]:
+            if artist is not None and artist.get_animated():
+                self.ax.draw_artist(artist)
+        
+    def _on_draw(self, event):
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+
+
+class LearningPlots:
+    """
+    Courbes d'apprentissage (erreur, poids, biais, erreur en log) mises à jour
+    sans tout redessiner.
+    
+    Les courbes sont créées une fois et modifiées avec set_data. Elles sont
+    « animées » : exclues du fond de chaque graphique, mémorisé après chaque
+    dessin complet, si bien qu'une image ne coûte que la restauration des fonds
+    et le dessin des courbes (blitting). Le dessin complet n'est refait que
+    lorsque les données sortent des limites des axes (élargies alors avec une
+    marge), après un redimensionnement ou une réinitialisation. Avec un
+    historique borné, le coût d'une image ne dépend pas de la durée de
+    l'entraînement.
+    """
+    
+    # Marge autour des données lors du premier calcul des limites, puis
+    # élargissement quand elles en sortent (facteur sur l'axe des époques,
+    # fraction de l'étendue sur l'axe des valeurs)
+    MARGIN = 0.1
+    X_GROWTH = 2.0
+    Y_GROWTH = 0.25
+    
+    # Au-delà de ce nombre de poids, la légende n'est pas affichée
+    MAX_LEGEND_ENTRIES = 10
+    
+    def __init__(self, figure, canvas):
+        self.figure = figure
+        self.canvas = canvas
+        
+        self.ax_error = figure.add_subplot(221)
+        self.ax_weights = figure.add_subplot(222)
+        self.ax_bias = figure.add_subplot(223)
+        self.ax_error_log = figure.add_subplot(224)
+        self.axes = [self.ax_error, self.ax_weights, self.ax_bias, self.ax_error_log]
+        
+        titles = ['Erreur moyenne', 'Évolution des poids', 'Évolution du biais',
+                  'Erreur (échelle log)']
+        ylabels = ['Erreur', 'Valeur', 'Valeur', 'Erreur (log)']
+        for ax, title, ylabel in zip(self.axes, titles, ylabels):
+            ax.set_facecolor('#1e1e1e')
+            ax.tick_params(colors='white')
+            for spine in ax.spines.values():
+                spine.set_color('white')
+            ax.set_title(title, color='white', fontsize=10)
+            ax.set_xlabel('Époque', color='white')
+            ax.set_ylabel(ylabel, color='white')
+            ax.grid(True, alpha=0.2, color='white')
+        self.ax_error_log.set_yscale('log')
+        
+        # Erreur avec l'enveloppe min/max des époques décimées
+        self.error_line, = self.ax_error.plot([], [], color='#FF5252', linewidth=2, animated=True)
+        self.envelope = PolyCollection([], facecolor='#FF5252', alpha=0.2, animated=True)
+        self.ax_error.add_collection(self.envelope)
+        self.bias_line, = self.ax_bias.plot([], [], color='#4CAF50', linewidth=2, animated=True)
+        self.error_log_line, = self.ax_error_log.plot([], [], color='#9C27B0', linewidth=2,
+                                                      animated=True)
+        self.weight_lines = []
+        
+        self._last_epoch = None
+        self._backgrounds = None
+        self.reset_limits()
+        figure.tight_layout()
+        canvas.mpl_connect('draw_event', self._on_draw)
+        
+    def reset_limits(self):
+        """Revenir aux limites initiales ; le prochain update redessine tout"""
+        for ax in self.axes:
+            ax.set_xlim(0, 10)
+        self._ylimits_set = False
+        self._backgrounds = None
+        
+    def _artists(self, ax):
+        if ax is self.ax_error:
+            return [self.envelope, self.error_line]
+        if ax is self.ax_weights:
+            return self.weight_lines
+        if ax is self.ax_bias:
+            return [self.bias_line]
+        return [self.error_log_line]
+        
+    def _on_draw(self, event):
+        # Après un dessin complet : mémoriser les fonds, puis y ajouter les courbes
+        self._backgrounds = [self.canvas.copy_from_bbox(ax.bbox) for ax in self.axes]
+        for ax in self.axes:
+            for artist in self._artists(ax):
+                ax.draw_artist(artist)
+        
+    def _set_weight_lines(self, n_inputs):
+        for line in self.weight_lines:
+            line.remove()
+        self.weight_lines = [self.ax_weights.plot([], [], color=f'C{i % 10}', label=f'w{i+1}',
+                                                  linewidth=2, animated=True)[0]
+                             for i in range(n_inputs)]
+        legend = self.ax_weights.get_legend()
+        if legend is not None:
+            legend.remove()
+        if n_inputs <= self.MAX_LEGEND_ENTRIES:
+            self.ax_weights.legend(loc='upper right')
+            
+    def _expand(self, ax, x_max, y_min, y_max):
+        """Élargir les limites de l'axe si les données en sortent ; True si modifiées"""
+        changed = False
+        x_low, x_high = ax.get_xlim()
+        if x_max > x_high:
+            ax.set_xlim(x_low, x_max * self.X_GROWTH)
+            changed = True
+        
+        # Calcul dans l'espace de l'axe : log10 pour l'échelle logarithmique
+        log = ax.get_yscale() == 'log'
+        if log:
+            if y_max <= 0:
+                return changed
+            y_min, y_max = np.log10(max(y_min, y_max * 1e-6)), np.log10(y_max)
+        low, high = np.log10(ax.get_ylim()) if log else ax.get_ylim()
+        
+        if not self._ylimits_set:
+            margin = (y_max - y_min) * self.MARGIN or 0.1
+            low, high = y_min - margin, y_max + margin
+        elif low <= y_min and y_max <= high:
+            return changed
+        else:
+            # Élargir du côté dépassé, d'une fraction de la nouvelle étendue
+            span = max(high, y_max) - min(low, y_min)
+            if y_min < low:
+                low = y_min - span * self.Y_GROWTH
+            if y_max > high:
+                high = y_max + span * self.Y_GROWTH
+        ax.set_ylim((10 ** low, 10 ** high) if log else (low, high))
+        return True
+        
+    def update(self, history):
+        """Afficher l'historique ; redessin complet seulement si nécessaire"""
+        count = len(history)
+        if self._last_epoch is not None and (count == 0 or history.epochs[-1] < self._last_epoch):
+            # Nouvel entraînement : repartir des limites initiales
+            self.reset_limits()
+        full_redraw = self._backgrounds is None
+        if history.weights.shape[1] != len(self.weight_lines):
+            self._set_weight_lines(history.weights.shape[1])
+            full_redraw = True
+        
+        epochs = history.epochs
+        errors = history.errors
+        self.error_line.set_data(epochs, errors)
+        self.error_log_line.set_data(epochs, errors)
+        self.bias_line.set_data(epochs, history.bias)
+        for line, weights in zip(self.weight_lines, history.weights.T):
+            line.set_data(epochs, weights)
+        if history.decimation > 1 and count:
+            x = np.concatenate([epochs, epochs[::-1]])
+            y = np.concatenate([history.error_min, history.error_max[::-1]])
+            self.envelope.set_verts([np.column_stack([x, y])])
+        else:
+            self.envelope.set_verts([])
+        
+        if count:
+            self._last_epoch = epochs[-1]
+            x_max = float(epochs[-1])
+            positive = errors[errors > 0]
+            rescaled = [
+                self._expand(self.ax_error, x_max, float(history.error_min.min()),
+                             float(history.error_max.max())),
+                self._expand(self.ax_weights, x_max, float(history.weights.min()),
+                             float(history.weights.max())),
+                self._expand(self.ax_bias, x_max, float(history.bias.min()),
+                             float(history.bias.max())),
+                self._expand(self.ax_error_log, x_max,
+                             float(positive.min()) if len(positive) else 0.0,
+                             float(errors.max())),
+            ]
+            self._ylimits_set = True
+            full_redraw = full_redraw or any(rescaled)
+        else:
+            self._last_epoch = None
+        
+        if full_redraw:
+            # Les courbes sont dessinées par _on_draw, après la mémorisation des fonds
+            self.canvas.draw()
+            return
+        
+        for ax, background in zip(self.axes, self._backgrounds):
+            self.canvas.restore_region(background)
+            for artist in self._artists(ax):
+                ax.draw_artist(artist)
+            self.canvas.blit(ax.bbox)
 
 
 class NeuroneGUI:
+    # Au-delà de ce nombre d'exemples, les valeurs ne sont plus détaillées une à une
+    MAX_LISTED_ROWS = 16
+    
+    # Plafond de l'historique : au-delà, les entrées sont fusionnées deux à deux
+    MAX_HISTORY_RECORDS = 2000
+    
+    # Dossier des modèles sauvegardés (un fichier .npz par jeu de données)
+    MODELS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'modeles')
+    
+    # Intervalle de lecture des instantanés du thread d'entraînement (ms)
+    POLL_INTERVAL_MS = 30
+    
+    # Cadence maximale de rafraîchissement des graphiques (images par seconde)
+    MAX_FPS = 30
+    
     def __init__(self, root):
         self.root = root
         self.root.title("🧠 Visualisation du Neurone Artificiel")
@@ -33,9 +729,20 @@ class NeuroneGUI:
         self.is_training = False
         self.training_data = None
         self.current_epoch = 0
-        self.errors_history = []
-        self.weights_history = []
-        self.bias_history = []
+        self.epochs_per_second = 0.0
+        self.history = None
+        self.prediction_cache = PredictionCache()
+        # Réglages de l'arrêt anticipé : le thread en entraîne une copie, et
+        # l'interface n'affiche que le résumé reçu dans ses instantanés
+        self.convergence_monitor = ConvergenceMonitor(loss_tol=0.02, patience=2000,
+                                                      min_delta=1e-4)
+        self.convergence_summary = None
+        
+        # Entraînement en arrière-plan : l'interface n'affiche que ses instantanés
+        self.worker = TrainingWorker()
+        self.session = 0
+        self.run = 0
+        self._last_poll = None
         
         # Interface
         self.create_widgets()
@@ -43,6 +750,9 @@ class NeuroneGUI:
         # Initialiser avec une porte logique OR par défaut
         self.load_or_gate()
         
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+        self.root.after(self.POLL_INTERVAL_MS, self.poll_worker)
+        
     def setup_style(self):
         """Configuration du style de l'interface"""
         style = ttk.Style()
@@ -91,7 +801,7 @@ class NeuroneGUI:
         learning_rate_scale.pack(fill=tk.X)
         self.lr_label = ttk.Label(params_frame, text="0.1")
         self.lr_label.pack()
-        learning_rate_scale.configure(command=lambda v: self.lr_label.configure(text=f"{float(v):.2f}"))
+        learning_rate_scale.configure(command=self.on_learning_rate_change)
         
         # Nombre d'époques
         ttk.Label(params_frame, text="Époques par cycle:").pack(anchor=tk.W, pady=(10, 0))
@@ -99,6 +809,11 @@ class NeuroneGUI:
         epochs_spinbox = ttk.Spinbox(params_frame, from_=10, to=10000, textvariable=self.epochs_var)
         epochs_spinbox.pack(fill=tk.X)
         
+        # Arrêt anticipé
+        self.early_stop_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(params_frame, text="Arrêt à la convergence",
+                        variable=self.early_stop_var).pack(anchor=tk.W, pady=(10, 0))
+        
         # --- Contrôles d'entraînement ---
         training_frame = ttk.LabelFrame(left_frame, text="Entraînement", padding=10)
         training_frame.pack(fill=tk.X, pady=(0, 10))
@@ -119,6 +834,16 @@ class NeuroneGUI:
                                        command=self.reset_neurone)
         self.reset_button.pack(fill=tk.X, pady=2)
         
+        self.save_button = ttk.Button(training_frame, text="💾 Sauvegarder le modèle", 
+                                      command=self.save_model)
+        self.save_button.pack(fill=tk.X, pady=2)
+        
+        # Démarrage à partir du modèle sauvegardé pour le jeu de données courant
+        self.warm_start_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(training_frame, text="Repartir du modèle sauvegardé",
+                        variable=self.warm_start_var,
+                        command=self.reset_neurone).pack(anchor=tk.W, pady=(5, 0))
+        
         # --- Informations ---
         info_frame = ttk.LabelFrame(left_frame, text="Informations", padding=10)
         info_frame.pack(fill=tk.BOTH, expand=True)
@@ -152,36 +877,39 @@ class NeuroneGUI:
         self.create_learning_plots()
         self.create_predictions_plot()
         
+        # Rendu plafonné à MAX_FPS, limité à l'onglet visible ; les autres
+        # onglets sont redessinés quand on les sélectionne
+        self.renderer = RenderScheduler(self.root.after, self.MAX_FPS)
+        for name, tab, render in (('structure', self.structure_tab, self.draw_neuron_structure),
+                                  ('learning', self.learning_tab, self.update_learning_plots),
+                                  ('predictions', self.predictions_tab,
+                                   self.update_predictions_plot)):
+            self.renderer.add_panel(name, render, self.tab_visible(tab))
+        self.renderer.add_panel('info', self.update_info_text)
+        self.notebook.bind('<<NotebookTabChanged>>', lambda event: self.renderer.request())
+        
+    def tab_visible(self, tab):
+        """Fonction indiquant si l'onglet `tab` est sélectionné"""
+        return lambda: self.notebook.select() == str(tab)
+        
+    def on_learning_rate_change(self, value):
+        """Afficher le taux d'apprentissage et le transmettre à l'entraînement en cours"""
+        self.lr_label.configure(text=f"{float(value):.2f}")
+        self.worker.configure(learning_rate=float(value))
+        
     def create_structure_plot(self):
         """Créer la visualisation de la structure du neurone"""
         self.fig_structure = Figure(figsize=(8, 6), facecolor='#2b2b2b')
-        self.ax_structure = self.fig_structure.add_subplot(111)
-        self.ax_structure.set_facecolor('#1e1e1e')
-        
         self.canvas_structure = FigureCanvasTkAgg(self.fig_structure, self.structure_tab)
+        self.structure_plot = StructurePlot(self.fig_structure, self.canvas_structure)
+        self.ax_structure = self.structure_plot.ax
         self.canvas_structure.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
     def create_learning_plots(self):
         """Créer les graphiques d'apprentissage"""
         self.fig_learning = Figure(figsize=(8, 6), facecolor='#2b2b2b')
-        
-        # Sous-graphiques
-        self.ax_error = self.fig_learning.add_subplot(221)
-        self.ax_weights = self.fig_learning.add_subplot(222)
-        self.ax_bias = self.fig_learning.add_subplot(223)
-        self.ax_error_log = self.fig_learning.add_subplot(224)
-        
-        for ax in [self.ax_error, self.ax_weights, self.ax_bias, self.ax_error_log]:
-            ax.set_facecolor('#1e1e1e')
-            ax.tick_params(colors='white')
-            ax.spines['bottom'].set_color('white')
-            ax.spines['top'].set_color('white')
-            ax.spines['left'].set_color('white')
-            ax.spines['right'].set_color('white')
-        
-        self.fig_learning.tight_layout()
-        
         self.canvas_learning = FigureCanvasTkAgg(self.fig_learning, self.learning_tab)
+        self.learning_plots = LearningPlots(self.fig_learning, self.canvas_learning)
         self.canvas_learning.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
     def create_predictions_plot(self):
@@ -197,118 +925,13 @@ class NeuroneGUI:
         """Dessiner la structure du neurone avec ses connexions"""
         if self.neurone is None:
             return
-            
-        self.ax_structure.clear()
-        self.ax_structure.set_xlim(-1, 4)
-        self.ax_structure.set_ylim(-1, 4)
-        self.ax_structure.axis('off')
-        self.ax_structure.set_facecolor('#1e1e1e')
-        
-        n_inputs = len(self.neurone.weights)
-        
-        # Position des neurones d'entrée
-        input_y_positions = np.linspace(0.5, 3.5, n_inputs)
-        input_x = 0.5
-        
-        # Position du neurone de sortie
-        output_x = 3
-        output_y = 2
-        
-        # Dessiner les connexions avec les poids
-        for i, (y_pos, weight) in enumerate(zip(input_y_positions, self.neurone.weights)):
-            # Épaisseur proportionnelle au poids
-            linewidth = abs(weight) * 3 + 0.5
-            color = 'green' if weight > 0 else 'red'
-            alpha = min(abs(weight), 1.0)
-            
-            self.ax_structure.plot([input_x + 0.15, output_x - 0.15], 
-                                 [y_pos, output_y],
-                                 color=color, linewidth=linewidth, alpha=alpha)
-            
-            # Afficher la valeur du poids
-            mid_x = (input_x + output_x) / 2
-            mid_y = (y_pos + output_y) / 2
-            self.ax_structure.text(mid_x, mid_y, f'{weight:.2f}', 
-                                 fontsize=9, color='yellow',
-                                 bbox=dict(boxstyle='round', facecolor='#2b2b2b', alpha=0.8))
-        
-        # Dessiner les neurones d'entrée
-        for i, y_pos in enumerate(input_y_positions):
-            circle = patches.Circle((input_x, y_pos), 0.15, 
-                                   facecolor='#4CAF50', edgecolor='white', linewidth=2)
-            self.ax_structure.add_patch(circle)
-            self.ax_structure.text(input_x - 0.4, y_pos, f'x{i+1}', 
-                                 fontsize=12, color='white', va='center')
-        
-        # Dessiner le neurone de sortie
-        circle = patches.Circle((output_x, output_y), 0.2, 
-                               facecolor='#2196F3', edgecolor='white', linewidth=3)
-        self.ax_structure.add_patch(circle)
-        self.ax_structure.text(output_x, output_y, 'Σ', 
-                             fontsize=16, color='white', ha='center', va='center')
-        self.ax_structure.text(output_x + 0.4, output_y, 'Output', 
-                             fontsize=12, color='white', va='center')
-        
-        # Afficher le biais
-        bias_y = -0.3
-        self.ax_structure.text(output_x, bias_y, f'Biais: {self.neurone.bias:.3f}', 
-                             fontsize=11, color='cyan',
-                             bbox=dict(boxstyle='round', facecolor='#2b2b2b', 
-                                     edgecolor='cyan', linewidth=2))
-        
-        # Titre
-        self.ax_structure.text(2, 3.8, 'Structure du Neurone', 
-                             fontsize=14, color='white', ha='center', weight='bold')
-        
-        self.canvas_structure.draw()
+        self.structure_plot.update(self.neurone)
         
     def update_learning_plots(self):
         """Mettre à jour les graphiques d'apprentissage"""
-        if not self.errors_history:
+        if self.history is None:
             return
-            
-        # Erreur
-        self.ax_error.clear()
-        self.ax_error.plot(self.errors_history, color='#FF5252', linewidth=2)
-        self.ax_error.set_title('Erreur moyenne', color='white', fontsize=10)
-        self.ax_error.set_xlabel('Époque', color='white')
-        self.ax_error.set_ylabel('Erreur', color='white')
-        self.ax_error.grid(True, alpha=0.2, color='white')
-        self.ax_error.set_facecolor('#1e1e1e')
-        
-        # Poids
-        self.ax_weights.clear()
-        weights_array = np.array(self.weights_history)
-        for i in range(weights_array.shape[1]):
-            self.ax_weights.plot(weights_array[:, i], label=f'w{i+1}', linewidth=2)
-        self.ax_weights.set_title('Évolution des poids', color='white', fontsize=10)
-        self.ax_weights.set_xlabel('Époque', color='white')
-        self.ax_weights.set_ylabel('Valeur', color='white')
-        self.ax_weights.legend(loc='upper right')
-        self.ax_weights.grid(True, alpha=0.2, color='white')
-        self.ax_weights.set_facecolor('#1e1e1e')
-        
-        # Biais
-        self.ax_bias.clear()
-        self.ax_bias.plot(self.bias_history, color='#4CAF50', linewidth=2)
-        self.ax_bias.set_title('Évolution du biais', color='white', fontsize=10)
-        self.ax_bias.set_xlabel('Époque', color='white')
-        self.ax_bias.set_ylabel('Valeur', color='white')
-        self.ax_bias.grid(True, alpha=0.2, color='white')
-        self.ax_bias.set_facecolor('#1e1e1e')
-        
-        # Erreur en log
-        self.ax_error_log.clear()
-        self.ax_error_log.plot(self.errors_history, color='#9C27B0', linewidth=2)
-        self.ax_error_log.set_yscale('log')
-        self.ax_error_log.set_title('Erreur (échelle log)', color='white', fontsize=10)
-        self.ax_error_log.set_xlabel('Époque', color='white')
-        self.ax_error_log.set_ylabel('Erreur (log)', color='white')
-        self.ax_error_log.grid(True, alpha=0.2, color='white')
-        self.ax_error_log.set_facecolor('#1e1e1e')
-        
-        self.fig_learning.tight_layout()
-        self.canvas_learning.draw()
+        self.learning_plots.update(self.history)
         
     def update_predictions_plot(self):
         """Mettre à jour la visualisation des prédictions"""
@@ -320,20 +943,19 @@ class NeuroneGUI:
         X = self.training_data['X']
         y = self.training_data['y']
         
-        # Prédictions
-        predictions = []
-        for x in X:
-            pred = self.neurone.predict(x)
-            predictions.append(pred)
-        
-        # Afficher les points
-        for i, (x_val, target, pred) in enumerate(zip(X, y, predictions)):
-            color = '#4CAF50' if abs(pred - target) < 0.1 else '#FF5252'
-            marker = 'o' if target == 1 else 's'
-            self.ax_predictions.scatter(i, pred, c=color, s=200, marker=marker, 
-                                      edgecolors='white', linewidths=2, alpha=0.7)
-            self.ax_predictions.text(i, pred + 0.1, f'{pred:.3f}', 
-                                   ha='center', color='white', fontsize=9)
+        # Prédictions (partagées avec le panneau d'informations)
+        predictions = self.prediction_cache.get(self.neurone, X)
+        
+        # Afficher les points : un seul nuage par forme de marqueur
+        indices = np.arange(len(X))
+        colors = np.where(np.abs(predictions - y) < 0.1, '#4CAF50', '#FF5252')
+        for marker, mask in (('o', y == 1), ('s', y != 1)):
+            self.ax_predictions.scatter(indices[mask], predictions[mask], c=colors[mask], s=200,
+                                      marker=marker, edgecolors='white', linewidths=2, alpha=0.7)
+        if len(X) <= self.MAX_LISTED_ROWS:
+            for i, pred in enumerate(predictions):
+                self.ax_predictions.text(i, pred + 0.1, f'{pred:.3f}', 
+                                       ha='center', color='white', fontsize=9)
             
         # Ligne de référence
         self.ax_predictions.axhline(y=0.5, color='yellow', linestyle='--', 
@@ -348,9 +970,10 @@ class NeuroneGUI:
         self.ax_predictions.set_facecolor('#1e1e1e')
         
         # Définir les labels de l'axe x
-        labels = [f'{x[0]},{x[1]}' for x in X]
-        self.ax_predictions.set_xticks(range(len(X)))
-        self.ax_predictions.set_xticklabels(labels, color='white')
+        if len(X) <= self.MAX_LISTED_ROWS:
+            labels = [','.join(str(v) for v in x) for x in X]
+            self.ax_predictions.set_xticks(range(len(X)))
+            self.ax_predictions.set_xticklabels(labels, color='white')
         
         self.canvas_predictions.draw()
         
@@ -367,6 +990,7 @@ class NeuroneGUI:
 ╚══════════════════════════════════╝
 
 Époque actuelle: {self.current_epoch}
+Vitesse: {self.epochs_per_second:,.0f} époques/s
 
 --- Paramètres ---
 Poids: {[f'{w:.4f}' for w in self.neurone.weights]}
@@ -375,28 +999,34 @@ Biais: {self.neurone.bias:.4f}
 --- Performance ---
 """
         
-        if self.errors_history:
-            info += f"Erreur actuelle: {self.errors_history[-1]:.6f}\n"
-            info += f"Erreur initiale: {self.errors_history[0]:.6f}\n"
-            reduction = (1 - self.errors_history[-1] / self.errors_history[0]) * 100
+        if self.history:
+            current_error = self.history.last_error
+            initial_error = self.history.errors[0]
+            info += f"Erreur actuelle: {current_error:.6f}\n"
+            info += f"Erreur initiale: {initial_error:.6f}\n"
+            reduction = (1 - current_error / initial_error) * 100
             info += f"Réduction: {reduction:.2f}%\n"
         
+        if self.convergence_summary:
+            info += f"\n--- Convergence ---\n{self.convergence_summary}\n"
+        
         if self.training_data is not None:
             info += "\n--- Prédictions ---\n"
             X = self.training_data['X']
             y = self.training_data['y']
             
-            correct = 0
-            for x, target in zip(X, y):
-                pred = self.neurone.predict(x)
-                pred_binary = 1 if pred >= 0.5 else 0
-                is_correct = "✓" if pred_binary == target else "✗"
-                if pred_binary == target:
-                    correct += 1
-                info += f"{is_correct} [{x[0]},{x[1]}] → {pred:.3f} "
+            predictions = self.prediction_cache.get(self.neurone, X)
+            correct = (predictions >= 0.5).astype(int) == y
+            
+            n_listed = min(len(X), self.MAX_LISTED_ROWS)
+            for x, target, pred, ok in zip(X[:n_listed], y, predictions, correct):
+                is_correct = "✓" if ok else "✗"
+                info += f"{is_correct} [{','.join(str(v) for v in x)}] → {pred:.3f} "
                 info += f"(cible: {target})\n"
+            if len(X) > n_listed:
+                info += f"... {len(X) - n_listed} autres exemples\n"
             
-            accuracy = (correct / len(X)) * 100
+            accuracy = correct.mean() * 100
             info += f"\nPrécision: {accuracy:.1f}%\n"
         
         self.info_text.insert('1.0', info)
@@ -438,36 +1068,56 @@ Biais: {self.neurone.bias:.4f}
         if self.training_data is None:
             return
             
+        # Arrêter le thread avant de remplacer l'état affiché
+        if self.is_training:
+            self.stop_training()
+        
         n_inputs = self.training_data['X'].shape[1]
-        self.neurone = Neurone(n_inputs)
+        warm_start = None
+        if self.warm_start_var.get() and os.path.exists(self.saved_model_path()):
+            warm_start = self.saved_model_path()
+        self.neurone = Neurone(n_inputs, warm_start=warm_start)
         self.current_epoch = 0
-        self.errors_history = []
-        self.weights_history = []
-        self.bias_history = []
+        self.epochs_per_second = 0.0
+        self.history = TrainingHistory(n_inputs, max_records=self.MAX_HISTORY_RECORDS)
+        self.convergence_summary = None
+        
+        # Le thread entraîne sa propre copie ; self.neurone ne sert qu'à l'affichage
+        self.session += 1
+        X = self.training_data['X']
+        self.worker.load(self.session, Neurone(n_inputs, warm_start=self.neurone),
+                         X, self.training_data['y'],
+                         TrainingHistory(n_inputs, max_records=self.MAX_HISTORY_RECORDS),
+                         self.convergence_monitor)
         
         self.update_all_visualizations()
+        self.renderer.flush()
         
-    def train_one_epoch(self):
-        """Entraîner le neurone pour une époque"""
+    def saved_model_path(self):
+        """Chemin du modèle sauvegardé pour le jeu de données courant"""
+        return os.path.join(self.MODELS_DIR, f"{self.training_data['name'].lower()}.npz")
+        
+    def save_model(self):
+        """Sauvegarder les poids du neurone pour le jeu de données courant"""
         if self.neurone is None or self.training_data is None:
             return
             
-        X = self.training_data['X']
-        y = self.training_data['y']
-        lr = self.learning_rate_var.get()
-        
-        epoch_errors = []
-        for i in range(len(X)):
-            error = self.neurone.train(X[i], y[i], learning_rate=lr)
-            epoch_errors.append(error)
+        os.makedirs(self.MODELS_DIR, exist_ok=True)
+        self.neurone.save(self.saved_model_path())
+        messagebox.showinfo("Modèle sauvegardé", self.saved_model_path())
         
-        self.current_epoch += 1
-        avg_error = np.mean(epoch_errors)
-        self.errors_history.append(avg_error)
-        self.weights_history.append(self.neurone.weights.copy())
-        self.bias_history.append(self.neurone.bias)
+    def training_params(self):
+        """Paramètres de l'interface transmis au thread d'entraînement"""
+        return {'learning_rate': self.learning_rate_var.get(),
+                'epochs_per_cycle': self.epochs_var.get(),
+                'early_stop': self.early_stop_var.get()}
         
-        self.update_all_visualizations()
+    def train_one_epoch(self):
+        """Entraîner le neurone pour une époque"""
+        if self.neurone is None or self.training_data is None:
+            return
+        self.run += 1
+        self.worker.step(self.run, **self.training_params())
         
     def start_training(self):
         """Démarrer l'entraînement continu"""
@@ -479,34 +1129,62 @@ Biais: {self.neurone.bias:.4f}
         self.step_button.config(state=tk.DISABLED)
         self.stop_button.config(state=tk.NORMAL)
         
-        self.train_loop()
-        
-    def train_loop(self):
-        """Boucle d'entraînement"""
-        if not self.is_training:
-            return
-            
-        epochs_per_cycle = self.epochs_var.get()
+        self.run += 1
+        self.worker.start(self.run, **self.training_params())
         
-        for _ in range(min(10, epochs_per_cycle)):  # 10 époques à la fois pour la réactivité
-            self.train_one_epoch()
-            
-        if self.is_training:
-            self.root.after(50, self.train_loop)  # Continuer après 50ms
-            
     def stop_training(self):
         """Arrêter l'entraînement"""
+        self.worker.stop()
+        self.set_stopped()
+        
+    def set_stopped(self):
+        """Remettre les boutons dans l'état « à l'arrêt »"""
         self.is_training = False
         self.train_button.config(state=tk.NORMAL)
         self.step_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
         
+    def poll_worker(self):
+        """Afficher le dernier instantané du thread d'entraînement, puis se reprogrammer"""
+        # Retard de ce rappel sur son rythme prévu : le thread ralentit s'il grandit
+        now = time.perf_counter()
+        if self._last_poll is not None:
+            self.worker.scheduler.report_lag(
+                max(0.0, now - self._last_poll - self.POLL_INTERVAL_MS / 1000))
+        self._last_poll = now
+        
+        self.apply_snapshot(self.worker.latest_snapshot())
+        self.root.after(self.POLL_INTERVAL_MS, self.poll_worker)
+        
+    def apply_snapshot(self, snapshot):
+        """Copier un instantané dans le neurone affiché ; True s'il a été appliqué"""
+        # Instantanés d'une autre session ou d'un lancement précédent : périmés
+        if (snapshot is None or snapshot['session'] != self.session
+                or snapshot['run'] != self.run):
+            return False
+        
+        self.neurone.weights[...] = snapshot['weights']
+        self.neurone.bias = snapshot['bias']
+        self.neurone.weights_version += 1
+        self.history = snapshot['history']
+        self.current_epoch = snapshot['epoch']
+        self.convergence_summary = snapshot['convergence']
+        self.epochs_per_second = snapshot['epochs_per_second'] if snapshot['running'] else 0.0
+        if self.is_training and not snapshot['running']:
+            # Arrêt décidé par le thread (convergence)
+            self.set_stopped()
+        
+        self.update_all_visualizations()
+        return True
+        
+    def close(self):
+        """Arrêter le thread d'entraînement et fermer la fenêtre"""
+        self.worker.quit()
+        self.root.destroy()
+        
     def update_all_visualizations(self):
-        """Mettre à jour toutes les visualisations"""
-        self.draw_neuron_structure()
-        self.update_learning_plots()
-        self.update_predictions_plot()
-        self.update_info_text()
+        """Marquer toutes les visualisations à redessiner (à la prochaine image)"""
+        self.renderer.mark_dirty()
 
 
 def main():
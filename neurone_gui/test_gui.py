@@ -108,6 +108,634 @@ except Exception as e:
     traceback.print_exc()
     sys.exit(1)
 
+# Test 9: Entraînement vectorisé par lots
+print("\n9. Test d'entraînement vectorisé (fit)...")
+try:
+    neurone = Neurone(n_inputs=2)
+    errors, weights, bias = neurone.fit(X, y, epochs=2000, learning_rate=1.0, record_every=10)
+    assert errors.shape == (200,) and weights.shape == (200, 2) and bias.shape == (200,)
+    assert errors[-1] < errors[0]
+    errors, _, _ = neurone.fit(X, y, epochs=10, batch_size=2)
+    print(f"   ✅ fit réussi (erreur finale: {errors[-1]:.4f})")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 10: Réseau multi-couches sur XOR
+print("\n10. Test du réseau multi-couches (XOR)...")
+try:
+    from reseau import Network
+    np.random.seed(0)
+    network = Network([2, 4, 1])
+    y_xor = np.array([0, 1, 1, 0])
+    network.fit(X, y_xor, epochs=20000, learning_rate=1.0)
+    predictions = (network.predict(X)[:, 0] >= 0.5).astype(int)
+    assert np.array_equal(predictions, y_xor), predictions
+    print(f"   ✅ XOR appris: {predictions}")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 11: Population de neurones
+print("\n11. Test de la population de neurones...")
+try:
+    from population import NeuronePopulation
+    population = NeuronePopulation(50, n_inputs=2, learning_rates=np.linspace(0.1, 5, 50), seed=0)
+    errors, weights, bias = population.fit(X, y, epochs=500, record_every=50)
+    assert errors.shape == (10, 50) and weights.shape == (10, 50, 2) and bias.shape == (10, 50)
+    best = population.best_member()
+    assert np.array_equal((best.predict(X) >= 0.5).astype(int), y)
+    print(f"   ✅ Population entraînée (meilleur membre: {population.best_index()})")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 12: Solveurs du second ordre
+print("\n12. Test des solveurs du second ordre (newton, lbfgs)...")
+try:
+    for method in ("newton", "lbfgs"):
+        neurone = Neurone(n_inputs=2)
+        errors, weights, bias = neurone.fit(X, y, epochs=100, method=method)
+        assert len(errors) < 50, f"{method}: {len(errors)} itérations"
+        assert np.array_equal((neurone.predict(X) >= 0.5).astype(int), y)
+        print(f"   ✅ {method}: convergence en {len(errors) - 1} itérations")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 13: Optimiseurs
+print("\n13. Test des optimiseurs...")
+try:
+    from optimiseurs import SGD, Momentum, Nesterov, RMSProp, Adam, ExponentialDecay
+    for optimizer in (SGD(1.0), Momentum(1.0), Nesterov(1.0), RMSProp(0.05),
+                      Adam(0.1, schedule=ExponentialDecay(0.999))):
+        neurone = Neurone(n_inputs=2)
+        errors, _, _ = neurone.fit(X, y, epochs=3000, optimizer=optimizer)
+        assert np.array_equal((neurone.predict(X) >= 0.5).astype(int), y), type(optimizer).__name__
+    neurone.train(X[0], y[0], optimizer=Adam(0.1))
+    print("   ✅ SGD, Momentum, Nesterov, RMSProp et Adam convergent")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 14: Arrêt anticipé
+print("\n14. Test de l'arrêt anticipé (ConvergenceMonitor)...")
+try:
+    from convergence import ConvergenceMonitor
+    neurone = Neurone(n_inputs=2)
+    monitor = ConvergenceMonitor(target_accuracy=1.0)
+    errors, weights, bias = neurone.fit(X, y, epochs=100000, learning_rate=1.0, monitor=monitor)
+    assert monitor.stopped and monitor.reason == 'accuracy'
+    assert len(errors) == monitor.stopped_epoch + 1
+    monitor = ConvergenceMonitor(patience=5)
+    for epoch, loss in enumerate([1.0, 0.5, 0.5, 0.5, 0.5, 0.5, 0.5]):
+        if monitor.update(epoch, loss):
+            break
+    assert monitor.reason == 'patience' and monitor.stopped_epoch == 6
+    print(f"   ✅ {monitor.summary()}")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 15: Entraînement en flux
+print("\n15. Test de l'entraînement en flux (sources)...")
+try:
+    import tempfile
+    from sources import NpySource, ShuffleBuffer, Prefetcher
+    with tempfile.TemporaryDirectory() as tmp:
+        X_big = np.tile(X, (500, 1)).astype(float)
+        y_big = np.tile(y, 500).astype(float)
+        np.save(os.path.join(tmp, 'X.npy'), X_big)
+        np.save(os.path.join(tmp, 'y.npy'), y_big)
+        source = Prefetcher(ShuffleBuffer(NpySource(os.path.join(tmp, 'X.npy'),
+                                                    os.path.join(tmp, 'y.npy'), batch_size=100),
+                                          buffer_size=500, batch_size=50, seed=0))
+        assert sum(len(batch_y) for _, batch_y in source) == len(y_big)
+        neurone = Neurone(n_inputs=2)
+        errors, _, _ = neurone.fit_stream(source, epochs=5, learning_rate=1.0)
+    assert errors.shape == (5,) and errors[-1] < errors[0]
+    from sources import ArraySource
+    np.random.seed(0)
+    monitor = ConvergenceMonitor(target_accuracy=1.0)
+    history = Neurone(n_inputs=2).fit_stream(ArraySource(X, y, batch_size=2), epochs=300,
+                                             learning_rate=1.0, monitor=monitor)
+    assert monitor.stopped and len(history) < 300
+    print(f"   ✅ fit_stream réussi (erreur finale: {errors[-1]:.4f})")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 16: Historique borné
+print("\n16. Test de l'historique d'entraînement (TrainingHistory)...")
+try:
+    from historique import TrainingHistory
+    history = TrainingHistory(n_inputs=2, decimation=10, max_records=100)
+    neurone = Neurone(n_inputs=2)
+    result = neurone.fit(X, y, epochs=50000, learning_rate=1.0, history=history)
+    assert result is history and len(history) <= 100
+    assert history.decimation > 10 and history.epochs[0] == 0
+    assert np.all(history.error_min <= history.errors) and np.all(history.errors <= history.error_max)
+    assert history.weights.base is not None  # vue sans copie
+    errors, weights, bias = history
+    print(f"   ✅ {len(history)} entrées, décimation {history.decimation}, {history.nbytes} octets")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 17: Sauvegarde et démarrage à chaud
+print("\n17. Test de la sauvegarde et du démarrage à chaud...")
+try:
+    from population import NeuronePopulation
+    with tempfile.TemporaryDirectory() as tmp:
+        neurone = Neurone(n_inputs=2)
+        neurone.fit(X, y, epochs=20, method="newton")
+        neurone.save(os.path.join(tmp, 'or.npz'))
+        neurone.save(os.path.join(tmp, 'or_mmap'), mmap=True)
+        warm = Neurone(n_inputs=2, warm_start=os.path.join(tmp, 'or.npz'))
+        mapped = Neurone.load(os.path.join(tmp, 'or_mmap'), mmap_mode='r')
+        assert np.allclose(warm.weights, neurone.weights) and warm.bias == neurone.bias
+        assert isinstance(mapped.weights, np.memmap)
+        assert np.allclose(mapped.predict(X), neurone.predict(X))
+
+        population = NeuronePopulation(100, n_inputs=2, seed=0)
+        population.save(os.path.join(tmp, 'population'), mmap=True)
+        loaded = NeuronePopulation.load(os.path.join(tmp, 'population'), mmap_mode='c')
+        assert np.array_equal(loaded.weights, population.weights)
+    print("   ✅ Sauvegarde .npz et projection mémoire réussies")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 18: Banc d'essai des performances
+print("\n18. Test du banc d'essai (benchmarks/bench_neurone.py --quick)...")
+try:
+    sys.path.insert(0, os.path.join(parent_dir, 'benchmarks'))
+    import contextlib
+    import io
+    import json
+    import bench_neurone
+    results = bench_neurone.run_all(quick=True)
+    assert results['convergence/OR']['value'] < 10000
+    assert not bench_neurone.compare(results, results, tolerance=0.25)
+    slower = {name: dict(m, value=m['value'] * (0.5 if m['higher_is_better'] else 2))
+              for name, m in results.items()}
+    assert len(bench_neurone.compare(slower, results, tolerance=0.25)) == len(results)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'baseline.json')
+        with open(path, 'w') as f:
+            json.dump({'quick': False, 'results': results}, f)
+        with contextlib.redirect_stdout(io.StringIO()):
+            assert bench_neurone.main(['--quick', '--baseline', path]) == 2
+    print(f"   ✅ {len(results)} métriques mesurées, détection des régressions OK")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 19: Prédictions par lot
+print("\n19. Test des prédictions par lot (predict_batch, predict_proba, predict_labels)...")
+try:
+    neurone = Neurone(n_inputs=2)
+    neurone.fit(X, y, epochs=20, method="newton")
+    expected = np.array([neurone.predict(x) for x in X])
+    assert np.allclose(neurone.predict_batch(X), expected)
+    proba = neurone.predict_proba(X)
+    assert proba.shape == (4, 2) and np.allclose(proba.sum(axis=1), 1)
+    assert np.array_equal(neurone.predict_labels(X), y)
+    assert np.array_equal(neurone.predict_labels(X, threshold=1.0), np.zeros(4))
+    assert np.allclose(neurone.predict_batch(X[1]), [expected[1]])
+    assert neurone.predict_proba(X[1]).shape == (1, 2)
+    try:
+        neurone.predict_batch(np.zeros((2, 2, 2)))
+        raise AssertionError("entrée 3-D acceptée")
+    except ValueError:
+        pass
+    version = neurone.weights_version
+    neurone.train(X[0], y[0])
+    assert neurone.weights_version == version + 1
+    print("   ✅ Prédictions par lot cohérentes avec predict")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 20: Rappels et instrumentation
+print("\n20. Test des rappels d'entraînement (callbacks, TrainingProfiler)...")
+try:
+    from callbacks import LambdaCallback, TrainingProfiler
+    batches, epochs_seen = [], []
+    profiler = TrainingProfiler()
+    recorder = LambdaCallback(
+        on_batch_end=lambda n, batch, logs: batches.append(logs['size']),
+        on_epoch_end=lambda n, epoch, logs: epochs_seen.append(epoch) or epoch == 9)
+    neurone = Neurone(n_inputs=2)
+    history = neurone.fit(X, y, epochs=100, batch_size=2, callbacks=[profiler, recorder])
+    assert epochs_seen == list(range(10)) and len(history) == 10
+    assert batches == [2] * 20
+    assert profiler.epochs == 10 and profiler.batches == 20 and profiler.samples == 40
+    assert all(t > 0 for t in profiler.timers.values()) and profiler.total_time > 0
+    assert "passe avant" in profiler.summary()
+    print("   ✅ Rappels appelés et phases chronométrées")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 21: Entraînements parallèles
+print("\n21. Test des entraînements parallèles (ParallelRunner, validation croisée)...")
+try:
+    from parallele import ParallelRunner, TrainingJob, kfold_indices, summarize
+    folds = kfold_indices(10, 3, seed=0)
+    assert sorted(np.concatenate([test for _, test in folds])) == list(range(10))
+    gates = {'OR': (X, y), 'AND': (X, np.array([0, 0, 0, 1]))}
+    jobs = [TrainingJob(gate, seed=seed, fit_kwargs={'epochs': 2000, 'learning_rate': 1.0})
+            for gate in gates for seed in range(2)]
+    parallel = ParallelRunner(max_workers=2).run(gates, jobs)
+    serial = ParallelRunner(max_workers=1).run(gates, jobs)
+    assert [r['dataset'] for r in parallel] == ['OR', 'OR', 'AND', 'AND']
+    assert all(np.array_equal(a['weights'], b['weights']) for a, b in zip(parallel, serial))
+    summary = summarize(parallel)
+    assert list(summary) == ['OR', 'AND'] and summary['OR']['test_accuracy'] == 1.0
+    job = TrainingJob('OR', fit_kwargs={'epochs': 500, 'learning_rate': 1.0},
+                      neurone_kwargs={'loss': 'bce', 'dtype': np.float32})
+    result, = ParallelRunner(max_workers=1).run(gates, [job])
+    assert result['weights'].dtype == np.float32 and result['test_accuracy'] == 1.0
+    print("   ✅ Résultats parallèles identiques à l'exécution séquentielle")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 22: Entrées creuses
+print("\n22. Test des entrées creuses (scipy.sparse, optionnel)...")
+try:
+    import scipy.sparse as sp
+except ImportError:
+    sp = None
+    print("   ⚠️  scipy non installé, test ignoré")
+if sp is not None:
+    try:
+        rng = np.random.default_rng(0)
+        X_dense = rng.random((200, 30)) * (rng.random((200, 30)) < 0.1)
+        y_dense = (X_dense.sum(axis=1) > 0.15).astype(float)
+        np.random.seed(0)
+        dense = Neurone(n_inputs=30)
+        dense.fit(X_dense, y_dense, epochs=5, batch_size=16, shuffle=False)
+        np.random.seed(0)
+        sparse = Neurone(n_inputs=30)
+        sparse.fit(sp.coo_matrix(X_dense), y_dense, epochs=5, batch_size=16, shuffle=False)
+        assert np.allclose(dense.weights, sparse.weights) and np.isclose(dense.bias, sparse.bias)
+        assert np.allclose(sparse.predict_batch(sp.csr_matrix(X_dense)), sparse.predict_batch(X_dense))
+        from sources import ArraySource, ShuffleBuffer
+        shuffled = ShuffleBuffer(ArraySource(sp.csr_matrix(X_dense), np.arange(200), batch_size=30),
+                                 buffer_size=64, batch_size=16, seed=0)
+        batches = list(shuffled)
+        rows = np.concatenate([batch_y for _, batch_y in batches]).astype(int)
+        assert all(sp.issparse(batch_X) for batch_X, _ in batches)
+        assert sorted(rows) == list(range(200)) and not np.array_equal(rows, np.arange(200))
+        assert np.allclose(sp.vstack([batch_X for batch_X, _ in batches]).toarray(), X_dense[rows])
+        sparse.fit_stream(shuffled, epochs=2)
+        print("   ✅ Entraînement creux identique à l'entraînement dense")
+    except Exception as e:
+        print(f"   ❌ Erreur: {e}")
+        sys.exit(1)
+
+# Test 23: Textes en flux
+print("\n23. Test du flux de textes (HashingVectorizer, TextStream)...")
+try:
+    from texte import HashingVectorizer, TextStream, tokenize
+    assert tokenize("Un TRÈS bon film !") == ['un', 'très', 'bon', 'film']
+    vectorizer = HashingVectorizer(n_features=1024, ngram_range=(1, 2))
+    data, indices, indptr = vectorizer.transform_arrays(["bon film", "", "très mauvais film"])
+    assert list(indptr) == [0, 3, 3, 8] and indices.max() < 1024
+    assert np.isclose(np.sum(data[:3] ** 2), 1.0)
+    if sp is not None:
+        documents = [("film excellent", 1), ("film horrible", 0)] * 50
+        serial = list(TextStream(documents, vectorizer, batch_size=16))
+        pooled = TextStream(documents, vectorizer, batch_size=16, n_workers=2)
+        for (X_a, y_a), (X_b, y_b) in zip(serial, pooled):
+            assert (X_a != X_b).nnz == 0 and np.array_equal(y_a, y_b)
+        assert pooled.meter.count == 100
+        neurone = Neurone(n_inputs=1024)
+        neurone.fit_stream(pooled, epochs=20, learning_rate=2.0)
+        p = neurone.predict_batch(vectorizer.transform(["excellent", "horrible"]))
+        assert p[0] > 0.5 > p[1]
+    print("   ✅ Vecteurs hachés identiques d'un processus à l'autre")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 24: Précision float32
+print("\n24. Test du mode float32 (dtype)...")
+try:
+    from population import NeuronePopulation
+    assert np.all(np.isfinite(sigmoid(np.array([-1e4, 1e4], dtype=np.float32))))
+    neurone = Neurone(n_inputs=2, dtype=np.float32)
+    history = neurone.fit(X, y, epochs=2000, learning_rate=1.0)
+    assert neurone.weights.dtype == np.float32 and history.weights.dtype == np.float32
+    assert neurone.predict_batch(X).dtype == np.float32
+    assert neurone.predict(X[1]).dtype == np.float32
+    assert np.array_equal(neurone.predict_labels(X), y)
+    neurone.fit(X, y, epochs=20, method="newton")
+    assert neurone.dtype == np.float32 and np.array_equal(neurone.predict_labels(X), y)
+    population = NeuronePopulation(4, 2, learning_rates=1.0, seed=0, dtype=np.float32)
+    errors, _, _ = population.fit(X, y, epochs=100)
+    assert errors.dtype == np.float32 and population.best_member().dtype == np.float32
+    print("   ✅ Poids, calculs et historiques en float32")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 25: Registre d'activations
+print("\n25. Test des activations (noyaux fusionnés, registre)...")
+try:
+    import tempfile
+    from activations import ACTIVATIONS, get_activation
+    z = np.linspace(-5, 5, 101)
+    for name in ACTIVATIONS:
+        activation = get_activation(name)
+        out, derivative = np.empty_like(z), np.empty_like(z)
+        activation.forward_derivative(z, out, derivative)
+        assert np.allclose(out, activation.forward(z))
+        assert np.allclose(derivative, activation.derivative(out))
+        assert np.allclose([activation(v) for v in z], out)
+        assert np.allclose([activation.scalar_derivative(v) for v in out], derivative)
+    assert np.allclose(get_activation('sigmoid').forward(z), sigmoid(z))
+    assert np.abs(get_activation('sigmoid_lut').forward(z) - sigmoid(z)).max() < 1e-3
+    neurone = Neurone(n_inputs=2, activation=get_activation('leaky_relu', alpha=0.1))
+    neurone.fit(X, y, epochs=500, learning_rate=0.1)
+    with tempfile.TemporaryDirectory() as tmp:
+        neurone.save(os.path.join(tmp, 'leaky.npz'))
+        restored = Neurone.load(os.path.join(tmp, 'leaky.npz'))
+    assert restored.activation.get_config() == {'name': 'leaky_relu', 'alpha': 0.1}
+    assert np.allclose(restored.predict_batch(X), neurone.predict_batch(X))
+    print("   ✅ Activations cohérentes et sauvegardées avec le neurone")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 26: Fonctions de perte
+print("\n26. Test des pertes (mse, bce, hinge)...")
+try:
+    from activations import get_activation
+    from pertes import get_loss
+    epochs_needed = {}
+    for loss in ('mse', 'bce'):
+        np.random.seed(0)
+        neurone = Neurone(n_inputs=2, loss=loss)
+        monitor = ConvergenceMonitor(target_accuracy=1.0)
+        neurone.fit(X, y, epochs=5000, learning_rate=1.0, monitor=monitor)
+        p = neurone.predict_batch(X)
+        for extra in range(20000):
+            if np.all(np.abs(y - p) < 0.1):
+                break
+            neurone.fit(X, y, epochs=1, learning_rate=1.0)
+            p = neurone.predict_batch(X)
+        epochs_needed[loss] = extra
+    assert epochs_needed['bce'] * 5 < epochs_needed['mse']
+    np.random.seed(0)
+    neurone = Neurone(n_inputs=2, loss='hinge')
+    history = neurone.fit(X, y, epochs=500, learning_rate=0.5)
+    assert np.array_equal(neurone.predict_labels(X), y) and history.last_error < 0.5
+    z = np.array([-2.0, 3.0])
+    error, delta = np.empty(2), np.empty(2)
+    bce = get_loss('bce').batch(get_activation('sigmoid'), z.copy(), np.array([0.0, 1.0]), error, delta)
+    assert np.isclose(bce, np.log1p(np.exp(-2.0)) + np.log1p(np.exp(-3.0)))
+    for loss in ('mse', 'bce', 'hinge'):
+        for value, target in ((-2.0, 0.0), (0.5, 1.0), (3.0, 0.0)):
+            error, delta = np.empty(1), np.empty(1)
+            total = get_loss(loss).batch(get_activation('sigmoid'), np.array([value]),
+                                         np.array([target]), error, delta)
+            assert np.allclose(get_loss(loss).scalar(get_activation('sigmoid'), value, target),
+                               (total, delta[0]))
+    neurone = Neurone(n_inputs=2, loss='bce')
+    with tempfile.TemporaryDirectory() as tmp:
+        neurone.save(os.path.join(tmp, 'bce.npz'))
+        restored = Neurone.load(os.path.join(tmp, 'bce.npz'))
+        neurone.save(os.path.join(tmp, 'bce'), mmap=True)
+        assert Neurone.load(os.path.join(tmp, 'bce')).loss.name == 'bce'
+    assert restored.loss.name == 'bce'
+    assert np.isclose(restored.train(X[1], y[1]), neurone.train(X[1], y[1]))
+    try:
+        Neurone(n_inputs=2, activation='relu', loss='bce')
+        raise AssertionError("bce accepté avec relu")
+    except ValueError:
+        pass
+    print(f"   ✅ Époques jusqu'à |erreur| < 0.1: mse {epochs_needed['mse']}, bce {epochs_needed['bce']}")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 27: Entraînement réparti d'un seul neurone
+print("\n27. Test de l'entraînement réparti (DataParallelTrainer)...")
+try:
+    from parallele import DataParallelTrainer
+    rng = np.random.default_rng(0)
+    X_big = rng.normal(size=(600, 5))
+    y_big = (X_big @ rng.normal(size=5) > 0).astype(float)
+    np.random.seed(1)
+    serial = Neurone(n_inputs=5)
+    serial.fit(X_big, y_big, epochs=30, learning_rate=1.0)
+    np.random.seed(1)
+    shared = Neurone(n_inputs=5)
+    history = DataParallelTrainer(shared, n_workers=3).fit(X_big, y_big, epochs=30,
+                                                           learning_rate=1.0)
+    assert len(history) == 30
+    assert np.allclose(serial.weights, shared.weights) and np.isclose(serial.bias, shared.bias)
+    hogwild = Neurone(n_inputs=5)
+    DataParallelTrainer(hogwild, n_workers=2, mode='async').fit(X_big, y_big, epochs=10,
+                                                                batch_size=20, learning_rate=1.0)
+    assert np.mean((hogwild.predict_batch(X_big) >= 0.5) == y_big) > 0.95
+    print("   ✅ Mode synchrone identique au lot complet, mode asynchrone convergent")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 28: Jeux de données synthétiques
+print("\n28. Test des jeux de données synthétiques...")
+try:
+    import tempfile
+    from synthetiques import logic_gate, linear_separable, gaussian_blobs, hyperplane
+    X_gate, y_gate = logic_gate('or', 2)
+    assert np.array_equal(X_gate, X) and np.array_equal(y_gate, y)
+    X_par, y_par = logic_gate('parity', 5, n_samples=1000, seed=3)
+    assert np.array_equal(y_par, X_par.sum(axis=1) % 2)
+    X_lin, y_lin = linear_separable(100000, 8, margin=0.1, seed=2)
+    assert np.array_equal(X_lin @ hyperplane(8, seed=2) > 0, y_lin == 1)
+    X_blob, y_blob = gaussian_blobs(1000, 3, centers=[[-4, 0, 0], [4, 0, 0]], std=0.5)
+    assert np.array_equal(X_blob[:, 0] > 0, y_blob == 1)
+    with tempfile.TemporaryDirectory() as folder:
+        X_mm, y_mm = linear_separable(100000, 8, margin=0.1, seed=2, path=folder)
+        assert isinstance(X_mm, np.memmap)
+        assert np.array_equal(np.load(os.path.join(folder, "X.npy")), X_lin)
+        del X_mm, y_mm
+    print("   ✅ Générateurs reproductibles, en mémoire ou projetés sur disque")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 29: Entraînement en arrière-plan de l'interface
+print("\n29. Test du thread d'entraînement de l'interface (TrainingWorker)...")
+try:
+    import time
+    from types import SimpleNamespace
+    from neurone_gui import NeuroneGUI, TrainingWorker
+    from convergence import ConvergenceMonitor
+    from historique import TrainingHistory
+
+    def wait_snapshot(worker, condition, timeout=30):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            snapshot = worker.latest_snapshot()
+            if snapshot is not None and condition(snapshot):
+                return snapshot
+            time.sleep(0.01)
+        raise TimeoutError("aucun instantané")
+
+    worker = TrainingWorker()
+    np.random.seed(0)
+    template = ConvergenceMonitor(loss_tol=0.02, patience=2000, min_delta=1e-4)
+    worker.load(1, Neurone(n_inputs=2), X, y, TrainingHistory(2, max_records=2000), template)
+    worker.step(1, learning_rate=0.5, epochs_per_cycle=100, early_stop=True)
+    stale = wait_snapshot(worker, lambda s: True)
+    assert stale['epoch'] == 1 and len(stale['history']) == 1 and stale['run'] == 1
+    worker.start(2, learning_rate=1.0, epochs_per_cycle=100, early_stop=True)
+    snapshot = wait_snapshot(worker, lambda s: not s['running'])
+    assert snapshot['converged'] and snapshot['history'].last_error <= 0.02
+    assert snapshot['convergence'] and not template.stopped
+    worker.quit()
+
+    shown = Neurone(n_inputs=2)
+    gui = SimpleNamespace(session=1, run=2, neurone=shown, is_training=True, stopped=[],
+                          set_stopped=lambda: gui.stopped.append(True),
+                          update_all_visualizations=lambda: None)
+    assert not NeuroneGUI.apply_snapshot(gui, dict(snapshot, session=0))
+    # L'état final de l'étape (lancement 1) ne doit pas arrêter le lancement 2
+    assert not NeuroneGUI.apply_snapshot(gui, stale) and not gui.stopped
+    assert NeuroneGUI.apply_snapshot(gui, snapshot)
+    assert np.array_equal(shown.weights, snapshot['weights']) and gui.stopped
+    assert gui.current_epoch == snapshot['epoch']
+    assert gui.convergence_summary == snapshot['convergence']
+    print(f"   ✅ Convergence en arrière-plan en {snapshot['epoch']} époques, instantané appliqué")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 30: Courbes d'apprentissage incrémentales
+print("\n30. Test des courbes d'apprentissage incrémentales (LearningPlots)...")
+try:
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from neurone_gui import LearningPlots
+    fig = Figure(figsize=(8, 6))
+    canvas = FigureCanvasAgg(fig)
+    plots = LearningPlots(fig, canvas)
+    full_draws = []
+    canvas.mpl_connect('draw_event', lambda event: full_draws.append(True))
+    history = TrainingHistory(2, max_records=500)
+    frames = 0
+    for epoch in range(5000):
+        history.append(epoch, 0.5 * np.exp(-epoch / 1000) + 0.01, [np.sin(epoch / 800), 0.5],
+                       -epoch / 5000)
+        if epoch % 10 == 0:
+            plots.update(history)
+            frames += 1
+    plots.update(history)
+    assert len(full_draws) < frames / 10, f"{len(full_draws)} dessins complets"
+    assert len(plots.error_line.get_xdata()) == len(history) and len(plots.weight_lines) == 2
+    assert plots.ax_error.get_xlim()[1] >= history.epochs[-1]
+    plots.update(TrainingHistory(3))
+    assert plots.ax_error.get_xlim() == (0, 10) and len(plots.weight_lines) == 3
+    print(f"   ✅ {frames} images, dont {len(full_draws)} dessins complets")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 31: Planificateur de rendu
+print("\n31. Test du planificateur de rendu (RenderScheduler)...")
+try:
+    from neurone_gui import RenderScheduler
+    scheduled = []
+    renders = {'structure': 0, 'learning': 0, 'info': 0}
+    selected = ['structure']
+    renderer = RenderScheduler(lambda delay, callback: scheduled.append((delay, callback)),
+                               max_fps=20)
+    for name in ('structure', 'learning'):
+        renderer.add_panel(name, lambda name=name: renders.__setitem__(name, renders[name] + 1),
+                           lambda name=name: selected[0] == name)
+    renderer.add_panel('info', lambda: renders.__setitem__('info', renders['info'] + 1))
+    for _ in range(100):
+        renderer.mark_dirty()
+    assert len(scheduled) == 1 and scheduled[0][0] == 0
+    scheduled.pop()[1]()
+    assert renders == {'structure': 1, 'learning': 0, 'info': 1}
+    renderer.mark_dirty()
+    assert 0 < scheduled[-1][0] <= 50
+    scheduled.pop()[1]()
+    selected[0] = 'learning'
+    renderer.request()
+    scheduled.pop()[1]()
+    assert renders == {'structure': 2, 'learning': 1, 'info': 2} and not scheduled
+    print("   ✅ Une image par intervalle, onglets cachés redessinés à la sélection")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 32: Tranches d'entraînement adaptatives
+print("\n32. Test du découpage adaptatif des époques (EpochScheduler)...")
+try:
+    from neurone_gui import EpochScheduler
+    scheduler = EpochScheduler(budget=0.012)
+    assert scheduler.next_slice(100) == 1
+    scheduler.record(1, 0.0001)
+    assert scheduler.next_slice() == 120 and scheduler.next_slice(100) == 100
+    scheduler.report_lag(0.2)
+    scheduler.record(100, 0.01)
+    assert scheduler.budget == 0.006 and scheduler.pause > 0
+    assert scheduler.next_slice() < 120
+    scheduler.report_lag(0.0)
+    for _ in range(20):
+        scheduler.record(10, 0.001)
+    assert scheduler.budget == 0.012 and scheduler.pause == 0
+    assert scheduler.epochs_per_second > 0
+    print("   ✅ Tranches ajustées au budget, ralentissement quand l'interface est en retard")
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
+# Test 33: Schéma du neurone à grande échelle
+print("\n33. Test du schéma du neurone en collections (StructurePlot)...")
+try:
+    import time
+    from types import SimpleNamespace
+    from neurone_gui import NeuroneGUI, StructurePlot
+    frame_budget = 1.0 / NeuroneGUI.MAX_FPS
+    for n_inputs, n_texts in ((2, 4), (1000, 2), (100000, 2)):
+        fig = Figure(figsize=(8, 6))
+        canvas = FigureCanvasAgg(fig)
+        structure = StructurePlot(fig, canvas)
+        full_draws = []
+        canvas.mpl_connect('draw_event', lambda event: full_draws.append(True))
+        rng = np.random.default_rng(0)
+        structure.update(SimpleNamespace(weights=rng.normal(size=n_inputs), bias=0.1))
+        # Régime établi (sans le premier dessin complet) : meilleur de 10 mises à jour
+        elapsed = np.inf
+        for _ in range(10):
+            neurone = SimpleNamespace(weights=rng.normal(size=n_inputs), bias=0.1)
+            start = time.perf_counter()
+            structure.update(neurone)
+            elapsed = min(elapsed, time.perf_counter() - start)
+        assert len(full_draws) == 1, f"{len(full_draws)} dessins complets"
+        if structure.detailed:
+            assert len(structure.inputs.get_paths()) == n_inputs
+        else:
+            assert structure.inputs.get_array().shape == (n_inputs, 1, 4)
+        assert len(structure.connections.get_segments()) == min(n_inputs,
+                                                                 StructurePlot.MAX_CONNECTIONS)
+        assert len(structure.labels) + len(structure.weight_labels) == n_texts
+        assert elapsed < frame_budget, f"{elapsed * 1000:.1f} ms par mise à jour"
+        print(f"   ✅ {n_inputs} entrées : {elapsed * 1000:.1f} ms par mise à jour")
+    structure.update(SimpleNamespace(weights=np.ones(3), bias=0.0))
+    assert len(structure.weight_labels) == 3 and len(full_draws) == 2
+except Exception as e:
+    print(f"   ❌ Erreur: {e}")
+    sys.exit(1)
+
 # Résumé
 print("\n" + "=" * 60)
 print("✅ TOUS LES TESTS SONT PASSÉS!")
@@ -0,0 +1,205 @@
+"""
+Optimiseurs et planificateurs du taux d'apprentissage
+
+Un optimiseur reçoit des paramètres et les gradients de la perte par rapport à
+ces paramètres, et met les paramètres à jour en place. Son état (vitesses,
+moments) est alloué une seule fois au premier appel de `step`, avec la forme
+des paramètres, puis réutilisé à chaque pas : aucune allocation dans la boucle.
+L'état a le même type que les paramètres (float32 ou float64).
+
+Les tableaux de gradients passés à `step` servent aussi de tampons de travail
+et peuvent être modifiés.
+"""
+
+import numpy as np
+
+
+# ===== Planificateurs du taux d'apprentissage =====
+
+class StepDecay:
+    """Multiplie le taux par `gamma` toutes les `step_size` époques"""
+
+    def __init__(self, step_size, gamma=0.5):
+        self.step_size = step_size
+        self.gamma = gamma
+
+    def __call__(self, base_learning_rate, epoch):
+        return base_learning_rate * self.gamma ** (epoch // self.step_size)
+
+
+class ExponentialDecay:
+    """Taux = base · gamma^époque"""
+
+    def __init__(self, gamma=0.999):
+        self.gamma = gamma
+
+    def __call__(self, base_learning_rate, epoch):
+        return base_learning_rate * self.gamma ** epoch
+
+
+class InverseTimeDecay:
+    """Taux = base / (1 + decay · époque)"""
+
+    def __init__(self, decay=1e-3):
+        self.decay = decay
+
+    def __call__(self, base_learning_rate, epoch):
+        return base_learning_rate / (1 + self.decay * epoch)
+
+
+# ===== Optimiseurs =====
+
+class Optimizer:
+    """
+    Classe de base des optimiseurs.
+
+    Les sous-classes implémentent `_init_state(param)`, qui alloue l'état d'un
+    paramètre, et `_update(param, grad, state)`, qui met `param` à jour en place.
+    """
+
+    def __init__(self, learning_rate=0.1, schedule=None):
+        """
+        Args:
+            learning_rate: Taux d'apprentissage de base
+            schedule: Planificateur appelé avec (taux de base, époque), ou None
+        """
+        self.base_learning_rate = learning_rate
+        self.learning_rate = learning_rate
+        self.schedule = schedule
+        self.iterations = 0
+        self._state = None
+
+    def set_epoch(self, epoch):
+        """Mettre à jour le taux d'apprentissage selon le planificateur"""
+        if self.schedule is not None:
+            self.learning_rate = self.schedule(self.base_learning_rate, epoch)
+
+    def reset(self):
+        """Oublier l'état accumulé (à appeler avant d'optimiser d'autres paramètres)"""
+        self._state = None
+        self.iterations = 0
+
+    def step(self, params, grads):
+        """
+        Appliquer un pas d'optimisation.
+
+        Args:
+            params: Séquence de tableaux NumPy, mis à jour en place
+            grads: Gradients de la perte, de même forme que `params`
+        """
+        if self._state is None:
+            self._state = [self._init_state(p) for p in params]
+        self.iterations += 1
+        for param, grad, state in zip(params, grads, self._state):
+            self._update(param, grad, state)
+
+    def _init_state(self, param):
+        return None
+
+    def _update(self, param, grad, state):
+        raise NotImplementedError
+
+
+class SGD(Optimizer):
+    """Descente de gradient simple : p -= lr · g"""
+
+    def _update(self, param, grad, state):
+        grad *= self.learning_rate
+        param -= grad
+
+
+class Momentum(Optimizer):
+    """Descente de gradient avec inertie : v = β·v + g ; p -= lr · v"""
+
+    def __init__(self, learning_rate=0.1, beta=0.9, schedule=None):
+        super().__init__(learning_rate, schedule)
+        self.beta = beta
+
+    def _init_state(self, param):
+        return np.zeros_like(param)
+
+    def _update(self, param, grad, velocity):
+        velocity *= self.beta
+        velocity += grad
+        np.multiply(velocity, self.learning_rate, out=grad)
+        param -= grad
+
+
+class Nesterov(Momentum):
+    """Inertie de Nesterov : v = β·v + g ; p -= lr · (g + β·v)"""
+
+    def _init_state(self, param):
+        return np.zeros_like(param), np.empty_like(param)
+
+    def _update(self, param, grad, state):
+        velocity, scratch = state
+        velocity *= self.beta
+        velocity += grad
+        np.multiply(velocity, self.beta, out=scratch)
+        scratch += grad
+        scratch *= self.learning_rate
+        param -= scratch
+
+
+class RMSProp(Optimizer):
+    """RMSProp : s = ρ·s + (1-ρ)·g² ; p -= lr · g / (√s + ε)"""
+
+    def __init__(self, learning_rate=0.01, rho=0.9, epsilon=1e-8, schedule=None):
+        super().__init__(learning_rate, schedule)
+        self.rho = rho
+        self.epsilon = epsilon
+
+    def _init_state(self, param):
+        return np.zeros_like(param), np.empty_like(param)
+
+    def _update(self, param, grad, state):
+        square_avg, scratch = state
+        square_avg *= self.rho
+        np.multiply(grad, grad, out=scratch)
+        scratch *= 1 - self.rho
+        square_avg += scratch
+
+        np.sqrt(square_avg, out=scratch)
+        scratch += self.epsilon
+        grad /= scratch
+        grad *= self.learning_rate
+        param -= grad
+
+
+class Adam(Optimizer):
+    """Adam : moments d'ordre 1 et 2 avec correction du biais d'initialisation"""
+
+    def __init__(self, learning_rate=0.01, beta1=0.9, beta2=0.999, epsilon=1e-8,
+                 schedule=None):
+        super().__init__(learning_rate, schedule)
+        self.beta1 = beta1
+        self.beta2 = beta2
+        self.epsilon = epsilon
+
+    def _init_state(self, param):
+        return (np.zeros_like(param), np.zeros_like(param),
+                np.empty_like(param))
+
+    def _update(self, param, grad, state):
+        m, v, scratch = state
+        t = self.iterations
+
+        # m = β1·m + (1-β1)·g
+        m *= self.beta1
+        np.multiply(grad, 1 - self.beta1, out=scratch)
+        m += scratch
+
+        # v = β2·v + (1-β2)·g²
+        v *= self.beta2
+        np.multiply(grad, grad, out=scratch)
+        scratch *= 1 - self.beta2
+        v += scratch
+
+        # p -= lr_t · m / (√v + ε), avec les corrections de biais dans lr_t
+        # et ε mis à l'échelle (forme équivalente de Kingma & Ba, section 2)
+        lr_t = self.learning_rate * np.sqrt(1 - self.beta2 ** t) / (1 - self.beta1 ** t)
+        np.sqrt(v, out=scratch)
+        scratch += self.epsilon * np.sqrt(1 - self.beta2 ** t)
+        np.divide(m, scratch, out=grad)
+        grad *= lr_t
+        param -= grad
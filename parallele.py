@@ -0,0 +1,595 @@
+"""
+Entraînements parallèles : portes logiques, validation croisée, graines, et
+entraînement d'un seul neurone réparti sur plusieurs processus
+
+Chaque tâche (TrainingJob) entraîne un Neurone indépendant sur un jeu de
+données nommé, éventuellement restreint à un pli de validation croisée, avec
+sa propre graine. Les tâches sont réparties sur un ProcessPoolExecutor.
+
+Les jeux de données ne sont pas copiés dans chaque tâche : ils sont placés
+une fois dans des blocs multiprocessing.shared_memory, et chaque processus
+de travail s'y attache à son démarrage. Seules la description de la tâche et
+ses résultats (poids, erreurs) transitent entre processus.
+
+Les résultats sont renvoyés dans l'ordre des tâches, quel que soit l'ordre
+dans lequel elles se terminent, et chaque tâche fixe sa graine : deux
+exécutions donnent les mêmes résultats, quel que soit le nombre de processus.
+
+DataParallelTrainer entraîne au contraire un seul neurone : X et y sont
+découpés en tranches, une par processus, et chaque processus calcule le
+gradient de sa tranche sur le vecteur de poids partagé. En mode synchrone,
+les gradients sont moyennés puis appliqués par l'optimiseur à chaque pas ; en
+mode asynchrone (à la Hogwild), chaque processus applique ses propres pas de
+SGD directement aux poids partagés, sans verrou.
+
+Exemple :
+    jobs = [TrainingJob('OR', seed=s, fit_kwargs={'epochs': 5000}) for s in range(8)]
+    results = ParallelRunner().run({'OR': (X, y)}, jobs)
+    print(summarize(results))
+
+    trainer = DataParallelTrainer(Neurone(X.shape[1]), n_workers=4)
+    trainer.fit(X, y, epochs=100)
+"""
+
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from historique import TrainingHistory
+from neurone import Neurone
+from optimiseurs import SGD
+
+
+class SharedDataset:
+    """
+    Tableaux (X, y) de plusieurs jeux de données copiés en mémoire partagée.
+
+    À utiliser comme gestionnaire de contexte : les blocs sont libérés
+    (unlink) à la sortie. `spec` est la description picklable transmise aux
+    processus de travail.
+    """
+
+    def __init__(self, datasets, dtype=np.float64):
+        """
+        Args:
+            datasets: Dictionnaire nom -> (X, y)
+            dtype: Type des tableaux partagés
+        """
+        self._blocks = []
+        self.spec = {}
+        for name, (X, y) in datasets.items():
+            X = np.asarray(X, dtype=dtype)
+            y = np.asarray(y, dtype=dtype).ravel()
+            if X.ndim != 2 or X.shape[0] != y.shape[0]:
+                raise ValueError(f"{name}: X doit être 2-D et avoir autant de lignes que y")
+            self.spec[name] = (self.share(X)[0], self.share(y)[0])
+
+    def share(self, array):
+        """
+        Copier un tableau dans un nouveau bloc, libéré avec les jeux de données.
+
+        Returns:
+            Couple (description picklable, vue NumPy sur le bloc)
+        """
+        block = shared_memory.SharedMemory(create=True, size=max(array.nbytes, 1))
+        self._blocks.append(block)
+        view = np.ndarray(array.shape, dtype=array.dtype, buffer=block.buf)
+        view[...] = array
+        return (block.name, array.shape, array.dtype.str), view
+
+    def close(self):
+        for block in self._blocks:
+            block.close()
+            block.unlink()
+        self._blocks = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# Jeux de données attachés dans le processus courant (un par processus de travail)
+_attached = {}
+_attached_blocks = []
+
+
+def _attach_array(spec):
+    """Vue sur un bloc décrit par SharedDataset.share, gardé ouvert dans ce processus"""
+    block_name, shape, dtype = spec
+    block = shared_memory.SharedMemory(name=block_name)
+    _attached_blocks.append(block)
+    return np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+
+def _attach(spec):
+    """Initialiseur des processus de travail : s'attacher aux blocs partagés"""
+    _attached.clear()
+    for name, arrays in spec.items():
+        _attached[name] = tuple(_attach_array(array) for array in arrays)
+
+
+class TrainingJob:
+    """Description d'un entraînement : jeu de données, pli, graine, neurone et options de fit"""
+
+    def __init__(self, dataset, seed=0, fold=None, n_folds=None, fold_seed=0, fit_kwargs=None,
+                 neurone_kwargs=None):
+        """
+        Args:
+            dataset: Nom du jeu de données
+            seed: Graine de l'initialisation et du mélange des mini-lots
+            fold: Indice du pli de test (None = entraîner et évaluer sur tout le jeu)
+            n_folds: Nombre de plis de la validation croisée
+            fold_seed: Graine du découpage en plis (commune à tous les plis)
+            fit_kwargs: Options passées à Neurone.fit
+            neurone_kwargs: Options du constructeur Neurone (activation, loss,
+                            dtype...), hors nombre d'entrées
+        """
+        if fold is not None and (n_folds is None or not 0 <= fold < n_folds):
+            raise ValueError("fold doit être compris entre 0 et n_folds - 1")
+        self.dataset = dataset
+        self.seed = seed
+        self.fold = fold
+        self.n_folds = n_folds
+        self.fold_seed = fold_seed
+        self.fit_kwargs = dict(fit_kwargs or {})
+        self.neurone_kwargs = dict(neurone_kwargs or {})
+
+    def __repr__(self):
+        fold = f", fold={self.fold}/{self.n_folds}" if self.fold is not None else ""
+        return f"TrainingJob({self.dataset!r}, seed={self.seed}{fold})"
+
+
+def kfold_indices(n_samples, n_folds, seed=0):
+    """
+    Découpage reproductible en plis de validation croisée.
+
+    Returns:
+        Liste de n_folds couples (indices d'entraînement, indices de test)
+    """
+    if not 2 <= n_folds <= n_samples:
+        raise ValueError("n_folds doit être compris entre 2 et le nombre d'exemples")
+    order = np.random.default_rng(seed).permutation(n_samples)
+    folds = np.array_split(order, n_folds)
+    return [(np.concatenate(folds[:i] + folds[i + 1:]), folds[i]) for i in range(n_folds)]
+
+
+def _run_job(job, datasets=None):
+    """Exécuter une tâche et renvoyer ses résultats sous forme de dictionnaire"""
+    X, y = (datasets or _attached)[job.dataset]
+    if job.fold is None:
+        X_train, y_train, X_test, y_test = X, y, X, y
+    else:
+        train, test = kfold_indices(len(X), job.n_folds, job.fold_seed)[job.fold]
+        X_train, y_train, X_test, y_test = X[train], y[train], X[test], y[test]
+
+    np.random.seed(job.seed)
+    neurone = Neurone(X.shape[1], **job.neurone_kwargs)
+    history = neurone.fit(X_train, y_train, **job.fit_kwargs)
+
+    output = neurone.predict_batch(X_test)
+    return {
+        'dataset': job.dataset,
+        'seed': job.seed,
+        'fold': job.fold,
+        'weights': neurone.weights,
+        'bias': neurone.bias,
+        'epochs': int(history.epochs[-1]) + 1 if len(history) else 0,
+        'train_error': history.last_error,
+        'test_error': float(np.abs(y_test - output).mean()),
+        'test_accuracy': float(np.mean((output >= 0.5) == (y_test >= 0.5))),
+    }
+
+
+class ParallelRunner:
+    """Répartition de tâches d'entraînement sur un ensemble de processus"""
+
+    def __init__(self, max_workers=None):
+        """
+        Args:
+            max_workers: Nombre de processus (None = un par cœur ; 1 = dans le
+                         processus courant, sans pool ni mémoire partagée)
+        """
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+    def run(self, datasets, jobs):
+        """
+        Exécute les tâches.
+
+        Args:
+            datasets: Dictionnaire nom -> (X, y)
+            jobs: Liste de TrainingJob
+
+        Returns:
+            Liste des résultats, dans l'ordre des tâches
+        """
+        jobs = list(jobs)
+        for job in jobs:
+            if job.dataset not in datasets:
+                raise ValueError(f"Jeu de données inconnu: {job.dataset!r}")
+
+        if self.max_workers == 1 or len(jobs) <= 1:
+            arrays = {name: (np.asarray(X, dtype=float), np.asarray(y, dtype=float).ravel())
+                      for name, (X, y) in datasets.items()}
+            return [_run_job(job, arrays) for job in jobs]
+
+        with SharedDataset(datasets) as shared:
+            workers = min(self.max_workers, len(jobs))
+            with ProcessPoolExecutor(workers, initializer=_attach,
+                                     initargs=(shared.spec,)) as pool:
+                # map conserve l'ordre des tâches
+                return list(pool.map(_run_job, jobs))
+
+
+def summarize(results):
+    """
+    Agrège les résultats par jeu de données, dans l'ordre de première apparition.
+
+    Returns:
+        Dictionnaire nom -> {'runs', 'test_accuracy', 'test_accuracy_std',
+        'test_error', 'test_error_std'}
+    """
+    grouped = {}
+    for result in results:
+        grouped.setdefault(result['dataset'], []).append(result)
+
+    summary = {}
+    for name, runs in grouped.items():
+        accuracy = np.array([r['test_accuracy'] for r in runs])
+        error = np.array([r['test_error'] for r in runs])
+        summary[name] = {
+            'runs': len(runs),
+            'test_accuracy': float(accuracy.mean()),
+            'test_accuracy_std': float(accuracy.std()),
+            'test_error': float(error.mean()),
+            'test_error_std': float(error.std()),
+        }
+    return summary
+
+
+def cross_validate(X, y, n_folds=5, seeds=(0,), fold_seed=0, max_workers=None,
+                   neurone_kwargs=None, **fit_kwargs):
+    """
+    Validation croisée à k plis, répétée pour chaque graine, en parallèle.
+    `neurone_kwargs` est passé au constructeur Neurone, `fit_kwargs` à fit.
+
+    Returns:
+        Tuple (résultats par tâche, résumé de `summarize`)
+    """
+    jobs = [TrainingJob('data', seed=seed, fold=fold, n_folds=n_folds, fold_seed=fold_seed,
+                        fit_kwargs=fit_kwargs, neurone_kwargs=neurone_kwargs)
+            for seed in seeds for fold in range(n_folds)]
+    results = ParallelRunner(max_workers).run({'data': (X, y)}, jobs)
+    return results, summarize(results)['data']
+
+
+def _data_parallel_worker(rank, specs, bounds, barrier, activation, loss, options):
+    """
+    Boucle d'un processus de DataParallelTrainer sur sa tranche [start, stop[.
+
+    En mode synchrone, chaque pas est encadré par deux attentes de la barrière :
+    la première libère le pas (ou annonce l'arrêt), la seconde signale que la
+    ligne de gradient du processus est écrite.
+    """
+    try:
+        X, y = _attach_array(specs['X']), _attach_array(specs['y'])
+        theta = _attach_array(specs['theta'])
+        control = _attach_array(specs['control'])
+        start, stop = bounds
+        X, y = X[start:stop], y[start:stop]
+        weights, bias = theta[:-1], theta[-1:]
+        n_samples = stop - start
+        batch_size = min(options['batch_size'], max(n_samples, 1))
+
+        rng = np.random.default_rng(options['seed'] + rank)
+        shuffled = options['shuffle'] and batch_size < n_samples
+        X_work, y_work = (np.empty_like(X), np.empty_like(y)) if shuffled else (X, y)
+        output = np.empty(batch_size, dtype=X.dtype)
+        error = np.empty_like(output)
+        delta = np.empty_like(output)
+        grad = np.empty_like(weights)
+
+        def shuffle():
+            order = rng.permutation(n_samples)
+            np.take(X, order, axis=0, out=X_work)
+            np.take(y, order, out=y_work)
+
+        def forward(lo, hi):
+            m = hi - lo
+            np.matmul(X_work[lo:hi], weights, out=output[:m])
+            output[:m] += bias[0]
+            error_sum = loss.batch(activation, output[:m], y_work[lo:hi], error[:m], delta[:m])
+            np.matmul(delta[:m], X_work[lo:hi], out=grad)
+            return error_sum, float(delta[:m].sum())
+
+        if options['mode'] == 'async':
+            # Hogwild : pas de SGD appliqués sans verrou aux poids partagés
+            losses, snapshots = _attach_array(specs['losses']), _attach_array(specs['snapshots'])
+            learning_rate = options['learning_rate']
+            for epoch in range(options['epochs']):
+                if shuffled:
+                    shuffle()
+                error_sum = 0.0
+                for lo in range(0, n_samples, batch_size):
+                    hi = min(lo + batch_size, n_samples)
+                    batch_error, delta_sum = forward(lo, hi)
+                    grad *= learning_rate / (hi - lo)
+                    weights += grad
+                    bias[0] += learning_rate * delta_sum / (hi - lo)
+                    error_sum += batch_error
+                losses[rank, epoch] = error_sum
+                if rank == 0:
+                    snapshots[epoch] = theta
+            return
+
+        # Synchrone : ligne [Σ delta·x, Σ delta, Σ erreur, m] par pas
+        rows = _attach_array(specs['rows'])
+        row = rows[rank]
+        steps = options['steps']
+        step = 0
+        while True:
+            barrier.wait()
+            if control[0]:
+                return
+            # Les tranches plus courtes que la plus longue finissent l'époque à vide
+            lo = step * batch_size
+            if step == 0 and shuffled:
+                shuffle()
+            if lo < n_samples:
+                hi = min(lo + batch_size, n_samples)
+                error_sum, delta_sum = forward(lo, hi)
+                row[:-3] = grad
+                row[-3:] = delta_sum, error_sum, hi - lo
+            else:
+                row[:] = 0
+            step = (step + 1) % steps
+            barrier.wait()
+    except threading.BrokenBarrierError:
+        # Un autre processus a échoué : son erreur suffit
+        return
+    except BaseException:
+        barrier.abort()
+        raise
+
+
+class DataParallelTrainer:
+    """
+    Entraînement d'un seul Neurone réparti par tranches de données sur plusieurs processus.
+
+    X et y sont copiés une fois en mémoire partagée et découpés en `n_workers`
+    tranches contiguës ; les poids et le biais forment un vecteur partagé.
+
+    - mode 'sync' : à chaque pas, chaque processus calcule la somme des
+      gradients de son mini-lot local (batch_size / n_workers exemples) ; le
+      processus principal les moyenne sur l'ensemble des exemples du pas et
+      applique l'optimiseur. Avec batch_size=None, un pas par époque sur tout
+      le jeu : le résultat est celui de Neurone.fit en lot complet.
+    - mode 'async' : chaque processus parcourt ses propres mini-lots et
+      applique directement ses pas de SGD aux poids partagés, sans verrou ni
+      attente (Hogwild). Les écritures concurrentes se perdent parfois, ce que
+      la descente de gradient tolère ; le résultat n'est pas reproductible.
+    """
+
+    def __init__(self, neurone, n_workers=None, mode='sync'):
+        """
+        Args:
+            neurone: Neurone à entraîner (poids, dtype, activation et perte)
+            n_workers: Nombre de processus (None = un par cœur)
+            mode: 'sync' (gradients moyennés) ou 'async' (Hogwild)
+        """
+        if mode not in ('sync', 'async'):
+            raise ValueError(f"Mode inconnu: {mode!r} (attendu: 'sync' ou 'async')")
+        self.neurone = neurone
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.mode = mode
+
+    def fit(self, X, y, epochs=100, batch_size=None, learning_rate=0.1, shuffle=True,
+            optimizer=None, monitor=None, history=None, seed=0):
+        """
+        Entraîne le neurone ; ses poids et son biais sont mis à jour à la fin.
+
+        Args:
+            X: Matrice des entrées (n_exemples, n_inputs), dense
+            y: Vecteur des cibles (n_exemples,)
+            epochs: Nombre d'époques
+            batch_size: Taille totale d'un pas, répartie entre les processus
+                        (None = tranche complète de chaque processus)
+            learning_rate: Taux d'apprentissage (sans optimiseur)
+            shuffle: Mélanger chaque tranche à chaque époque (mini-lots uniquement)
+            optimizer: Optimiseur de `optimiseurs` ('sync' uniquement) ; par
+                       défaut SGD(learning_rate)
+            monitor: ConvergenceMonitor ('sync' uniquement)
+            history: TrainingHistory à compléter (None = nouvel historique)
+            seed: Graine du mélange (processus k : seed + k)
+
+        Returns:
+            TrainingHistory ; en mode 'async', erreurs cumulées de tous les
+            processus et poids vus par le processus 0 à la fin de chaque époque
+        """
+        neurone = self.neurone
+        dtype = neurone.dtype
+        X = np.ascontiguousarray(X, dtype=dtype)
+        y = np.ascontiguousarray(y, dtype=dtype).ravel()
+        n_inputs = len(neurone.weights)
+        if X.ndim != 2 or X.shape[1] != n_inputs:
+            raise ValueError(f"X doit être de forme (n_exemples, {n_inputs})")
+        if y.shape[0] != X.shape[0]:
+            raise ValueError("X et y doivent avoir le même nombre d'exemples")
+        if self.mode == 'async' and (optimizer is not None or monitor is not None):
+            raise ValueError("Le mode 'async' n'accepte ni optimiseur ni monitor (SGD sans verrou)")
+
+        n_samples = X.shape[0]
+        n_workers = min(self.n_workers, n_samples)
+        if batch_size is None or batch_size > n_samples:
+            batch_size = n_samples
+        local_batch = -(-batch_size // n_workers)
+        if history is None:
+            history = TrainingHistory(n_inputs, dtype=dtype)
+
+        edges = np.cumsum([0] + [len(part) for part in np.array_split(np.arange(n_samples),
+                                                                       n_workers)])
+        # Pas synchrones par époque : ceux de la plus grande tranche
+        steps = -(-int(np.diff(edges).max()) // local_batch)
+        options = {'mode': self.mode, 'batch_size': local_batch, 'shuffle': shuffle,
+                   'seed': seed, 'epochs': epochs, 'learning_rate': learning_rate,
+                   'steps': steps}
+
+        with SharedDataset({'data': (X, y)}, dtype=dtype) as shared:
+            specs = dict(zip(('X', 'y'), shared.spec['data']))
+            specs['theta'], theta = shared.share(np.append(neurone.weights, neurone.bias)
+                                                 .astype(dtype))
+            specs['control'], control = shared.share(np.zeros(1, dtype=np.int64))
+            if self.mode == 'sync':
+                specs['rows'], rows = shared.share(np.zeros((n_workers, n_inputs + 3)))
+            else:
+                specs['losses'], losses = shared.share(np.zeros((n_workers, epochs)))
+                specs['snapshots'], snapshots = shared.share(
+                    np.zeros((epochs, n_inputs + 1), dtype=dtype))
+
+            context = multiprocessing.get_context()
+            barrier = context.Barrier(n_workers + 1)
+            workers = [context.Process(target=_data_parallel_worker, daemon=True,
+                                       args=(rank, specs, (edges[rank], edges[rank + 1]),
+                                             barrier, neurone.activation, neurone.loss,
+                                             options))
+                       for rank in range(n_workers)]
+            for worker in workers:
+                worker.start()
+            try:
+                if self.mode == 'sync':
+                    self._run_sync(theta, rows, control, barrier, epochs, steps,
+                                   learning_rate, optimizer, monitor, history)
+                else:
+                    for worker in workers:
+                        worker.join()
+                    errors = losses.sum(axis=0) / n_samples
+                    for epoch in range(epochs):
+                        history.append(epoch, float(errors[epoch]), snapshots[epoch, :-1],
+                                       float(snapshots[epoch, -1]), force=epoch == epochs - 1)
+            except threading.BrokenBarrierError:
+                raise RuntimeError("Un processus d'entraînement a échoué") from None
+            finally:
+                for worker in workers:
+                    worker.join()
+            if any(worker.exitcode for worker in workers):
+                raise RuntimeError("Un processus d'entraînement a échoué")
+
+            neurone.weights[...] = theta[:-1]
+            neurone.bias = float(theta[-1])
+            neurone.weights_version += 1
+        return history
+
+    def _run_sync(self, theta, rows, control, barrier, epochs, steps, learning_rate,
+                  optimizer, monitor, history):
+        """Boucle du processus principal en mode synchrone : moyenne et mise à jour"""
+        weights, bias = theta[:-1], theta[-1:]
+        grad = np.empty_like(weights)
+        bias_grad = np.empty_like(bias)
+        totals = np.empty(rows.shape[1])
+        if optimizer is None:
+            optimizer = SGD(learning_rate)
+        if monitor is not None:
+            monitor.reset()
+            monitor.start()
+
+        try:
+            for epoch in range(epochs):
+                optimizer.set_epoch(epoch)
+                error_sum = count = 0.0
+                for _ in range(steps):
+                    barrier.wait()
+                    barrier.wait()
+                    rows.sum(axis=0, out=totals)
+                    m = totals[-1]
+                    np.multiply(totals[:-3], -1.0 / m, out=grad)
+                    bias_grad[0] = -totals[-3] / m
+                    optimizer.step((weights, bias), (grad, bias_grad))
+                    error_sum += totals[-2]
+                    count += m
+
+                avg_error = error_sum / count
+                converged = monitor is not None and monitor.update(epoch, avg_error)
+                history.append(epoch, avg_error, weights, float(bias[0]), force=converged)
+                if converged:
+                    break
+        finally:
+            if not barrier.broken:
+                control[0] = 1
+                barrier.wait()
+
+
+def scaling_report(X, y, worker_counts=(1, 2, 4), epochs=20, mode='sync', seed=0, **fit_kwargs):
+    """
+    Mesure la durée de DataParallelTrainer.fit selon le nombre de processus.
+
+    Chaque mesure part des mêmes poids initiaux (graine `seed`). L'accélération
+    est relative au premier nombre de processus de la liste ; l'efficacité est
+    l'accélération divisée par le rapport des nombres de processus.
+
+    Returns:
+        Liste de dictionnaires {'workers', 'seconds', 'speedup', 'efficiency',
+        'final_error'}
+    """
+    X = np.asarray(X)
+    rows = []
+    for workers in worker_counts:
+        np.random.seed(seed)
+        neurone = Neurone(X.shape[1])
+        start = time.perf_counter()
+        history = DataParallelTrainer(neurone, workers, mode).fit(X, y, epochs=epochs, seed=seed,
+                                                                  **fit_kwargs)
+        seconds = time.perf_counter() - start
+        reference = rows[0] if rows else {'workers': workers, 'seconds': seconds}
+        speedup = reference['seconds'] / seconds
+        rows.append({
+            'workers': workers,
+            'seconds': seconds,
+            'speedup': speedup,
+            'efficiency': speedup * reference['workers'] / workers,
+            'final_error': history.last_error,
+        })
+    return rows
+
+
+def format_scaling_report(rows):
+    """Tableau texte des résultats de `scaling_report`"""
+    lines = [f"{'processus':>9} {'durée (s)':>10} {'accélération':>12} "
+             f"{'efficacité':>10} {'erreur':>8}"]
+    for row in rows:
+        lines.append(f"{row['workers']:>9} {row['seconds']:>10.3f} {row['speedup']:>12.2f} "
+                     f"{row['efficiency']:>10.2f} {row['final_error']:>8.4f}")
+    lines.append(f"({os.cpu_count()} cœur(s) disponible(s))")
+    return "\n".join(lines)
+
+
+# Exemple d'utilisation : les quatre portes logiques, plusieurs graines chacune
+if __name__ == "__main__":
+    X = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+    gates = {
+        'OR': (X, [0, 1, 1, 1]),
+        'AND': (X, [0, 0, 0, 1]),
+        'NOR': (X, [1, 0, 0, 0]),
+        'NAND': (X, [1, 1, 1, 0]),
+    }
+    jobs = [TrainingJob(gate, seed=seed, fit_kwargs={'epochs': 5000, 'learning_rate': 1.0})
+            for gate in gates for seed in range(4)]
+
+    runner = ParallelRunner()
+    print(f"{len(jobs)} entraînements sur {runner.max_workers} processus")
+    for gate, stats in summarize(runner.run(gates, jobs)).items():
+        print(f"{gate:>5}: précision {stats['test_accuracy']:.2f}, "
+              f"erreur {stats['test_error']:.4f} ± {stats['test_error_std']:.4f}")
+
+    # Un seul neurone, données réparties entre les processus
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(200000, 32))
+    y = (X @ rng.normal(size=32) > 0).astype(float)
+    print("\nEntraînement réparti (mode synchrone, 20 époques en lot complet) :")
+    print(format_scaling_report(scaling_report(X, y, worker_counts=(1, 2, 4), epochs=20,
+                                               learning_rate=1.0)))
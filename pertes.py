@@ -0,0 +1,145 @@
+"""
+Fonctions de perte de l'entraînement par gradient
+
+Une perte fixe à la fois la règle de mise à jour et l'erreur rapportée dans
+l'historique. Sa méthode `batch` reçoit les pré-activations z = X·w + b d'un
+lot et écrit, sans allocation, le terme delta = -dL/dz de chaque exemple ;
+la mise à jour est ensuite la même pour toutes les pertes
+(gradient = -Xᵀ·delta / m).
+
+Pertes disponibles :
+    mse    erreur quadratique (cible - sortie)·f'(z) : comportement historique ;
+           l'erreur rapportée reste l'erreur absolue moyenne, pour que les
+           seuils existants (arrêt anticipé, interface) gardent leur sens
+    bce    entropie croisée binaire, fusionnée avec la sigmoïde :
+           delta = cible - sortie, sans le facteur σ'(z) qui s'annule quand la
+           sortie sature ; erreur rapportée : entropie croisée moyenne
+    hinge  perte charnière max(0, 1 - s·z) avec s = 2·cible - 1 ∈ {-1, 1},
+           calculée sur la pré-activation ; erreur rapportée : perte moyenne
+"""
+
+import numpy as np
+
+
+class Loss:
+    """Classe de base : les sous-classes implémentent `batch`, et `scalar` pour un exemple isolé"""
+
+    name = None
+
+    def batch(self, activation, output, y, error, delta):
+        """
+        Passe avant et terme de mise à jour d'un lot.
+
+        Args:
+            activation: Activation du neurone (voir `activations`)
+            output: Pré-activations z ; sert ensuite de tampon de travail
+            y: Cibles du lot
+            error, delta: Tampons de même forme ; delta reçoit -dL/dz
+
+        Returns:
+            Somme, sur le lot, de l'erreur rapportée
+        """
+        raise NotImplementedError
+
+    def scalar(self, activation, z, target):
+        """
+        Version d'un seul exemple de `batch` (Neurone.train), sans tableau.
+
+        Returns:
+            Tuple (erreur rapportée, delta = -dL/dz), en flottants
+        """
+        output, error, delta = np.array([z], dtype=float), np.empty(1), np.empty(1)
+        total = self.batch(activation, output, np.array([float(target)]), error, delta)
+        return total, float(delta[0])
+
+    def check_activation(self, activation):
+        """Lever ValueError si la perte n'a pas de sens pour cette activation"""
+
+    def __repr__(self):
+        return f"{type(self).__name__}()"
+
+
+class MSE(Loss):
+    """Erreur quadratique ; erreur rapportée : erreur absolue moyenne"""
+
+    name = 'mse'
+
+    def batch(self, activation, output, y, error, delta):
+        activation.forward_derivative(output, output, delta)
+        np.subtract(y, output, out=error)
+        delta *= error
+        np.abs(error, out=output)
+        return float(output.sum())
+
+    def scalar(self, activation, z, target):
+        output = activation.scalar(z)
+        error = float(target - output)
+        return abs(error), error * float(activation.scalar_derivative(output))
+
+
+class BinaryCrossEntropy(Loss):
+    """Entropie croisée binaire fusionnée avec la sigmoïde : delta = cible - σ(z)"""
+
+    name = 'bce'
+
+    def check_activation(self, activation):
+        if not activation.name.startswith('sigmoid'):
+            raise ValueError("La perte 'bce' suppose une activation sigmoïde")
+
+    def batch(self, activation, output, y, error, delta):
+        # Perte calculée sur z, sans log(0) : log(1 + exp(z)) - y·z
+        np.logaddexp(0, output, out=error)
+        np.multiply(y, output, out=delta)
+        error -= delta
+        total = float(error.sum())
+
+        activation.forward(output, out=output)
+        np.subtract(y, output, out=delta)
+        return total
+
+    def scalar(self, activation, z, target):
+        return float(np.logaddexp(0, z) - target * z), float(target - activation.scalar(z))
+
+
+class Hinge(Loss):
+    """Perte charnière sur la pré-activation, cibles 0/1 ramenées à -1/+1"""
+
+    name = 'hinge'
+
+    def batch(self, activation, output, y, error, delta):
+        # error = s, delta = max(0, 1 - s·z)
+        np.multiply(y, 2, out=error)
+        error -= 1
+        np.multiply(error, output, out=delta)
+        np.subtract(1, delta, out=delta)
+        np.maximum(delta, 0, out=delta)
+        total = float(delta.sum())
+
+        # -dL/dz = s pour les exemples dans la marge, 0 sinon
+        np.greater(delta, 0, out=delta)
+        delta *= error
+        return total
+
+    def scalar(self, activation, z, target):
+        sign = 2.0 * target - 1.0
+        margin = float(1.0 - sign * z)
+        return (margin, sign) if margin > 0 else (0.0, 0.0)
+
+
+LOSSES = {
+    'mse': MSE,
+    'bce': BinaryCrossEntropy,
+    'hinge': Hinge,
+}
+
+
+def get_loss(loss='mse'):
+    """
+    Instance de perte à partir de son nom ('mse', 'bce', 'hinge') ou d'une
+    instance de Loss (renvoyée telle quelle).
+    """
+    if isinstance(loss, Loss):
+        return loss
+    if loss not in LOSSES:
+        raise ValueError(f"Perte inconnue: {loss!r} (disponibles: {', '.join(LOSSES)})")
+    return LOSSES[loss]()
@@ -0,0 +1,219 @@
+"""
+Population de neurones indépendants entraînés en une seule matrice de poids
+
+Pour un balayage d'hyperparamètres, au lieu de créer et d'entraîner N objets
+Neurone l'un après l'autre, la population empile leurs poids dans une matrice
+(N, n_inputs) et leurs biais dans un vecteur (N,) : toutes les passes avant et
+toutes les mises à jour se font par diffusion (broadcasting) en un seul appel.
+"""
+
+import numpy as np
+
+from activations import get_activation
+from neurone import Neurone, _load_arrays, _save_arrays
+
+_SIGMOID = get_activation('sigmoid')
+
+
+class NeuronePopulation:
+    """N neurones sigmoïdes indépendants, chacun avec son taux d'apprentissage"""
+
+    def __init__(self, n_members, n_inputs, learning_rates=0.1, seed=None, dtype=np.float64):
+        """
+        Args:
+            n_members: Nombre de neurones de la population
+            n_inputs: Nombre d'entrées de chaque neurone
+            learning_rates: Taux d'apprentissage, scalaire ou un par membre
+            seed: Graine de l'initialisation aléatoire (None = aléatoire)
+            dtype: Type des poids, des entrées et des calculs (float32 divise
+                   par deux la mémoire des grandes populations)
+        """
+        rng = np.random.default_rng(seed)
+        # Même initialisation que Neurone : uniforme dans [0, 1)
+        self.weights = rng.random((n_members, n_inputs)).astype(dtype, copy=False)
+        self.biases = rng.random(n_members).astype(dtype, copy=False)
+        self.learning_rates = np.broadcast_to(
+            np.asarray(learning_rates, dtype=dtype), (n_members,)).copy()
+        self.errors = None
+
+    @classmethod
+    def from_neurones(cls, neurones, learning_rates=0.1):
+        """Construire une population à partir de neurones existants"""
+        population = cls(len(neurones), len(neurones[0].weights), learning_rates,
+                         dtype=neurones[0].dtype)
+        population.weights[:] = [n.weights for n in neurones]
+        population.biases[:] = [n.bias for n in neurones]
+        return population
+
+    def save(self, path, mmap=False):
+        """
+        Sauvegarde les poids, biais et taux d'apprentissage de la population.
+
+        Args:
+            path: Fichier .npz, ou dossier si mmap=True
+            mmap: Écrire un dossier de fichiers .npy, rechargeable par projection mémoire
+        """
+        _save_arrays(path, {'weights': self.weights, 'biases': self.biases,
+                           'learning_rates': self.learning_rates}, mmap)
+
+    @classmethod
+    def load(cls, path, mmap_mode=None):
+        """
+        Recharge une population sauvegardée par `save`.
+
+        Args:
+            path: Fichier .npz ou dossier écrit avec mmap=True
+            mmap_mode: Mode de projection mémoire (format dossier) : 'r' pour la
+                       prédiction seule, 'r+' ou 'c' pour reprendre l'entraînement
+        """
+        arrays = _load_arrays(path, ('weights', 'biases', 'learning_rates'), mmap_mode)
+        population = cls.__new__(cls)
+        for name, array in arrays.items():
+            setattr(population, name, array if mmap_mode else np.array(array))
+        population.errors = None
+        return population
+
+    @property
+    def n_members(self):
+        return self.weights.shape[0]
+
+    @property
+    def n_inputs(self):
+        return self.weights.shape[1]
+
+    @property
+    def dtype(self):
+        return self.weights.dtype
+
+    def predict(self, X):
+        """
+        Sorties de tous les membres pour un lot d'exemples.
+
+        Returns:
+            Matrice (n_exemples, n_members)
+        """
+        X = np.atleast_2d(np.asarray(X, dtype=self.dtype))
+        output = X @ self.weights.T
+        output += self.biases
+        return _SIGMOID.forward(output, out=output)
+
+    def load_weights(self, source):
+        """
+        Remplace les poids, biais et taux d'apprentissage par ceux d'un fichier
+        ou d'une autre population de même forme.
+
+        Args:
+            source: Chemin accepté par `load`, ou instance de NeuronePopulation
+        """
+        if not isinstance(source, NeuronePopulation):
+            source = NeuronePopulation.load(source)
+        if source.weights.shape != self.weights.shape:
+            raise ValueError(f"Poids incompatibles: {source.weights.shape} "
+                             f"au lieu de {self.weights.shape}")
+        self.weights = np.array(source.weights, dtype=self.dtype)
+        self.biases = np.array(source.biases, dtype=self.dtype)
+        self.learning_rates = np.array(source.learning_rates, dtype=self.dtype)
+
+    def fit(self, X, y, epochs=1000, record_every=1, warm_start=None):
+        """
+        Entraîne tous les membres simultanément en lot complet.
+
+        Args:
+            X: Matrice des entrées (n_exemples, n_inputs)
+            y: Vecteur des cibles (n_exemples,)
+            epochs: Nombre d'époques
+            record_every: Enregistrer l'historique toutes les k époques
+            warm_start: Fichier ou population dont les poids servent de point de départ
+
+        Returns:
+            Tuple (errors_history, weights_history, bias_history) de formes
+            (n_records, N), (n_records, N, n_inputs) et (n_records, N)
+        """
+        if warm_start is not None:
+            self.load_weights(warm_start)
+        dtype = self.dtype
+        X = np.ascontiguousarray(X, dtype=dtype)
+        y = np.ascontiguousarray(y, dtype=dtype).ravel()
+        if X.ndim != 2 or X.shape[1] != self.n_inputs:
+            raise ValueError(f"X doit être de forme (n_exemples, {self.n_inputs})")
+        if y.shape[0] != X.shape[0]:
+            raise ValueError("X et y doivent avoir le même nombre d'exemples")
+
+        m = X.shape[0]
+        N = self.n_members
+        n_records = (epochs + record_every - 1) // record_every
+        errors_history = np.empty((n_records, N), dtype=dtype)
+        weights_history = np.empty((n_records, N, self.n_inputs), dtype=dtype)
+        bias_history = np.empty((n_records, N), dtype=dtype)
+
+        # Tampons de travail : une colonne par membre
+        output = np.empty((m, N), dtype=dtype)
+        error = np.empty((m, N), dtype=dtype)
+        delta = np.empty((m, N), dtype=dtype)
+        grad = np.empty((N, self.n_inputs), dtype=dtype)
+        bias_grad = np.empty(N, dtype=dtype)
+        y_col = y[:, np.newaxis]
+        step = self.learning_rates / m
+
+        for epoch in range(epochs):
+            # Passe avant de toute la population
+            np.matmul(X, self.weights.T, out=output)
+            output += self.biases
+            _SIGMOID.forward_derivative(output, output, delta)
+
+            # delta = erreur * sortie * (1 - sortie) ; `output` sert ensuite de tampon
+            np.subtract(y_col, output, out=error)
+            delta *= error
+            if epoch % record_every == 0:
+                k = epoch // record_every
+                np.abs(error, out=output)
+                np.mean(output, axis=0, out=errors_history[k])
+
+            # Mise à jour de chaque membre avec son propre taux d'apprentissage
+            np.matmul(delta.T, X, out=grad)
+            grad *= step[:, np.newaxis]
+            self.weights += grad
+            np.sum(delta, axis=0, out=bias_grad)
+            bias_grad *= step
+            self.biases += bias_grad
+
+            if epoch % record_every == 0:
+                weights_history[k] = self.weights
+                bias_history[k] = self.biases
+
+        self.errors = np.abs(y_col - self.predict(X)).mean(axis=0)
+        return errors_history, weights_history, bias_history
+
+    def best_index(self):
+        """Indice du membre ayant la plus faible erreur après entraînement"""
+        if self.errors is None:
+            raise RuntimeError("La population n'a pas encore été entraînée")
+        return int(np.argmin(self.errors))
+
+    def member(self, index):
+        """Extraire un membre de la population sous forme de Neurone"""
+        neurone = Neurone(self.n_inputs, dtype=self.dtype)
+        neurone.weights = self.weights[index].copy()
+        neurone.bias = float(self.biases[index])
+        return neurone
+
+    def best_member(self):
+        """Meilleur membre de la population sous forme de Neurone"""
+        return self.member(self.best_index())
+
+
+# Exemple d'utilisation : balayage du taux d'apprentissage sur la porte OR
+if __name__ == "__main__":
+    X = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+    y = np.array([0, 1, 1, 1])
+
+    learning_rates = np.logspace(-3, 1, 1000)
+    population = NeuronePopulation(len(learning_rates), n_inputs=2,
+                                   learning_rates=learning_rates, seed=0)
+    errors_history, _, _ = population.fit(X, y, epochs=2000, record_every=100)
+
+    best = population.best_index()
+    print(f"Membres entraînés: {population.n_members}")
+    print(f"Meilleur taux d'apprentissage: {learning_rates[best]:.4f}")
+    print(f"Erreur finale du meilleur membre: {population.errors[best]:.6f}")
+    print(f"Prédictions: {population.best_member().predict(X)}")
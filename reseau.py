@@ -0,0 +1,219 @@
+"""
+Réseau de neurones multi-couches construit sur l'abstraction du Neurone
+
+Chaque couche stocke les poids de tous ses neurones dans une seule matrice
+2-D : la propagation avant et la rétropropagation se font en une multiplication
+matricielle par couche, au lieu d'un objet Neurone et d'un np.dot par unité.
+
+L'activation de chaque couche (registre de `activations`) calcule sa sortie et
+sa dérivée en une passe, dans des tampons propres à la couche : une fois les
+tampons alloués pour la plus grande taille de lot, l'entraînement ne fait plus
+d'allocation.
+"""
+
+import numpy as np
+
+from activations import get_activation
+
+
+class Layer:
+    """Couche dense de neurones"""
+
+    def __init__(self, n_inputs, n_neurons, activation='sigmoid'):
+        # Une colonne de poids par neurone, un biais par neurone
+        self.weights = np.random.uniform(-1, 1, (n_inputs, n_neurons))
+        self.biases = np.random.uniform(-1, 1, n_neurons)
+        self.activation = get_activation(activation)
+        self.inputs = None
+        self.output = None
+        self.derivative = None
+
+        # Tampons de travail, agrandis si un lot dépasse leur capacité
+        self._capacity = 0
+        self._weights_grad = np.empty_like(self.weights)
+        self._biases_grad = np.empty_like(self.biases)
+
+    @property
+    def n_inputs(self):
+        return self.weights.shape[0]
+
+    @property
+    def n_neurons(self):
+        return self.weights.shape[1]
+
+    def _buffers(self, m):
+        if m > self._capacity:
+            self._capacity = m
+            self._output = np.empty((m, self.n_neurons))
+            self._derivative = np.empty((m, self.n_neurons))
+            self._input_error = np.empty((m, self.n_inputs))
+        return self._output[:m], self._derivative[:m], self._input_error[:m]
+
+    def forward(self, X):
+        """
+        Propagation avant d'un lot.
+
+        Args:
+            X: Matrice des entrées (n_exemples, n_inputs)
+
+        Returns:
+            Sorties de la couche (n_exemples, n_neurons), dans un tampon de la
+            couche réutilisé au lot suivant
+        """
+        output, derivative, _ = self._buffers(X.shape[0])
+        np.matmul(X, self.weights, out=output)
+        output += self.biases
+        self.activation.forward_derivative(output, output, derivative)
+        self.inputs = X
+        self.output = output
+        self.derivative = derivative
+        return output
+
+    def backward(self, error, learning_rate):
+        """
+        Rétropropagation d'un lot et mise à jour des poids.
+
+        Args:
+            error: Erreur sur les sorties de la couche (n_exemples, n_neurons),
+                   dans la même convention que Neurone.train (cible - sortie) ;
+                   modifiée en place
+            learning_rate: Taux d'apprentissage
+
+        Returns:
+            Erreur propagée vers les entrées de la couche (n_exemples, n_inputs)
+        """
+        m = self.inputs.shape[0]
+        _, _, input_error = self._buffers(m)
+
+        # delta = erreur * dérivée de l'activation (calculée par forward)
+        delta = error
+        delta *= self.derivative
+        # Erreur de la couche précédente, calculée avant la mise à jour des poids
+        np.matmul(delta, self.weights.T, out=input_error)
+
+        np.matmul(self.inputs.T, delta, out=self._weights_grad)
+        self._weights_grad *= learning_rate / m
+        self.weights += self._weights_grad
+        np.sum(delta, axis=0, out=self._biases_grad)
+        self._biases_grad *= learning_rate / m
+        self.biases += self._biases_grad
+        return input_error
+
+
+class Network:
+    """Réseau de couches denses entraîné par rétropropagation"""
+
+    def __init__(self, layer_sizes, activation='sigmoid', output_activation=None):
+        """
+        Args:
+            layer_sizes: Nombre d'unités par couche, entrées comprises
+                         (ex : [2, 4, 1] pour XOR)
+            activation: Activation des couches cachées (nom ou instance)
+            output_activation: Activation de la couche de sortie (None = `activation`)
+        """
+        if len(layer_sizes) < 2:
+            raise ValueError("Il faut au moins une taille d'entrée et une couche")
+        n_layers = len(layer_sizes) - 1
+        activations = [activation] * (n_layers - 1) + [output_activation or activation]
+        self.layers = [Layer(n_in, n_out, act)
+                       for n_in, n_out, act in zip(layer_sizes[:-1], layer_sizes[1:], activations)]
+        self._error = np.empty((0, layer_sizes[-1]))
+
+    def forward(self, X):
+        output = X
+        for layer in self.layers:
+            output = layer.forward(output)
+        return output
+
+    def predict(self, X):
+        """
+        Prédit les sorties d'un exemple ou d'un lot d'exemples.
+
+        Args:
+            X: Vecteur (n_inputs,) ou matrice (n_exemples, n_inputs)
+
+        Returns:
+            Sorties du réseau, de même rang que X
+        """
+        X = np.asarray(X, dtype=float)
+        # Copie : la sortie de forward est un tampon réutilisé par la couche
+        if X.ndim == 1:
+            return self.forward(X[np.newaxis, :])[0].copy()
+        return self.forward(X).copy()
+
+    def train_batch(self, X, y, learning_rate=0.1):
+        """
+        Une passe avant et une rétropropagation sur un lot.
+
+        Returns:
+            Erreur absolue moyenne du lot (avant la mise à jour)
+        """
+        m = X.shape[0]
+        if m > self._error.shape[0]:
+            self._error = np.empty((m, self.layers[-1].n_neurons))
+        error = self._error[:m]
+        np.subtract(y, self.forward(X), out=error)
+        abs_error = float(np.abs(error).mean())
+        for layer in reversed(self.layers):
+            error = layer.backward(error, learning_rate)
+        return abs_error
+
+    def fit(self, X, y, epochs=1000, batch_size=None, learning_rate=0.1,
+            shuffle=True, record_every=1):
+        """
+        Entraîne le réseau par lots vectorisés.
+
+        Args:
+            X: Matrice des entrées (n_exemples, n_inputs)
+            y: Cibles (n_exemples,) ou (n_exemples, n_sorties)
+            epochs: Nombre d'époques
+            batch_size: Taille des mini-lots (None = lot complet)
+            learning_rate: Taux d'apprentissage
+            shuffle: Mélanger les exemples à chaque époque (mini-lots uniquement)
+            record_every: Enregistrer l'erreur toutes les k époques
+
+        Returns:
+            Tableau NumPy des erreurs absolues moyennes enregistrées
+        """
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float).reshape(X.shape[0], -1)
+        if X.shape[1] != self.layers[0].n_inputs:
+            raise ValueError(f"X doit être de forme (n_exemples, {self.layers[0].n_inputs})")
+        if y.shape[1] != self.layers[-1].n_neurons:
+            raise ValueError(f"y doit avoir {self.layers[-1].n_neurons} sortie(s) par exemple")
+
+        n_samples = X.shape[0]
+        if batch_size is None or batch_size > n_samples:
+            batch_size = n_samples
+
+        errors_history = np.empty((epochs + record_every - 1) // record_every)
+        for epoch in range(epochs):
+            if shuffle and batch_size < n_samples:
+                order = np.random.permutation(n_samples)
+                X_epoch, y_epoch = X[order], y[order]
+            else:
+                X_epoch, y_epoch = X, y
+
+            abs_error_sum = 0.0
+            for start in range(0, n_samples, batch_size):
+                stop = min(start + batch_size, n_samples)
+                abs_error_sum += self.train_batch(X_epoch[start:stop], y_epoch[start:stop],
+                                                  learning_rate) * (stop - start)
+
+            if epoch % record_every == 0:
+                errors_history[epoch // record_every] = abs_error_sum / n_samples
+
+        return errors_history
+
+
+# Exemple d'utilisation : la porte XOR, non linéairement séparable
+if __name__ == "__main__":
+    X = np.array([[0, 0], [0, 1], [1, 0], [1, 1]])
+    y = np.array([0, 1, 1, 0])
+
+    network = Network([2, 4, 1])
+    errors_history = network.fit(X, y, epochs=20000, learning_rate=1.0, record_every=10)
+
+    print(f"Erreur finale moyenne: {errors_history[-1]:.6f}")
+    for x, sortie in zip(X, network.predict(X)[:, 0]):
+        print(f"Entrée: {x}, Sortie: {sortie:.4f}, Sortie binaire: {int(sortie >= 0.5)}")
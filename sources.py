@@ -0,0 +1,268 @@
+"""
+Sources de données en flux pour l'entraînement hors mémoire
+
+Une source est un itérable ré-itérable : chaque itération correspond à une
+passe (une époque) et produit des mini-lots (X, y), X de forme
+(n_exemples, n_inputs) et y de forme (n_exemples,). La mémoire utilisée ne
+dépend que de la taille des lots et des tampons, pas de la taille du jeu de
+données : on peut ainsi entraîner un Neurone (voir Neurone.fit_stream) sur
+des fichiers plus grands que la RAM.
+
+Sources disponibles :
+    ArraySource      tableaux déjà en mémoire, denses ou creux (scipy.sparse)
+    NpySource        fichiers .npy lus par projection mémoire (mmap)
+    CsvSource        fichier CSV lu par morceaux avec pandas
+    GeneratorSource  fonction génératrice quelconque
+
+Adaptateurs :
+    ShuffleBuffer    mélange à l'intérieur d'un tampon borné
+    Prefetcher       préchargement des lots dans un thread d'arrière-plan
+"""
+
+import itertools
+import queue
+import threading
+
+import numpy as np
+
+
+class ArraySource:
+    """Mini-lots consécutifs de tableaux en mémoire"""
+
+    def __init__(self, X, y, batch_size=256):
+        # Les matrices creuses (scipy.sparse) sont découpées en CSR, sans densification
+        self.sparse = hasattr(X, 'tocsr')
+        self.X = X.tocsr() if self.sparse else X
+        self.y = y
+        self.batch_size = batch_size
+
+    def __iter__(self):
+        n_samples = self.X.shape[0] if self.sparse else len(self.X)
+        for start in range(0, n_samples, self.batch_size):
+            stop = start + self.batch_size
+            X = self.X[start:stop]
+            if not self.sparse:
+                X = np.asarray(X, dtype=float)
+            yield X, np.asarray(self.y[start:stop], dtype=float).ravel()
+
+
+class NpySource(ArraySource):
+    """
+    Mini-lots lus dans des fichiers .npy par projection mémoire.
+
+    Seules les lignes du lot courant sont chargées en mémoire ; le système
+    d'exploitation se charge de la lecture du fichier à la demande.
+    """
+
+    def __init__(self, X_path, y_path, batch_size=256):
+        super().__init__(np.load(X_path, mmap_mode='r'),
+                         np.load(y_path, mmap_mode='r'),
+                         batch_size)
+        if self.X.ndim != 2 or self.X.shape[0] != self.y.shape[0]:
+            raise ValueError("X doit être 2-D et avoir autant de lignes que y")
+
+
+class CsvSource:
+    """Mini-lots lus dans un fichier CSV par morceaux (pandas.read_csv(chunksize=...))"""
+
+    def __init__(self, path, target_column, batch_size=256, feature_columns=None,
+                 **read_csv_kwargs):
+        """
+        Args:
+            path: Chemin du fichier CSV
+            target_column: Nom de la colonne des cibles
+            batch_size: Nombre de lignes lues par morceau
+            feature_columns: Colonnes des entrées (None = toutes sauf la cible)
+            **read_csv_kwargs: Options supplémentaires pour pandas.read_csv
+        """
+        self.path = path
+        self.target_column = target_column
+        self.batch_size = batch_size
+        self.feature_columns = feature_columns
+        self.read_csv_kwargs = read_csv_kwargs
+
+    def __iter__(self):
+        import pandas as pd
+
+        for chunk in pd.read_csv(self.path, chunksize=self.batch_size, **self.read_csv_kwargs):
+            y = chunk.pop(self.target_column).to_numpy(dtype=float)
+            if self.feature_columns is not None:
+                chunk = chunk[self.feature_columns]
+            yield chunk.to_numpy(dtype=float), y
+
+
+class GeneratorSource:
+    """Mini-lots produits par une fonction génératrice, rappelée à chaque époque"""
+
+    def __init__(self, generator_function, *args, **kwargs):
+        """
+        Args:
+            generator_function: Fonction renvoyant un itérateur de couples (X, y)
+            *args, **kwargs: Arguments passés à la fonction à chaque époque
+        """
+        self.generator_function = generator_function
+        self.args = args
+        self.kwargs = kwargs
+
+    def __iter__(self):
+        for X, y in self.generator_function(*self.args, **self.kwargs):
+            yield np.asarray(X, dtype=float), np.asarray(y, dtype=float).ravel()
+
+
+class ShuffleBuffer:
+    """
+    Mélange approximatif d'une source dans un tampon de taille bornée.
+
+    Les lignes entrantes remplissent un tampon de `buffer_size` lignes ; une
+    fois plein, chaque lot émis est tiré au hasard dans le tampon et les places
+    libérées sont reprises par les lignes suivantes. Plus le tampon est grand,
+    plus le mélange se rapproche d'une permutation complète.
+
+    Les lots creux (scipy.sparse, par exemple ArraySource sur une matrice CSR)
+    sont accumulés en CSR : quand le tampon est plein, il est permuté en une
+    seule sélection de lignes, les premiers lots sont émis et le reste est gardé.
+    """
+
+    def __init__(self, source, buffer_size=10000, batch_size=256, seed=None):
+        if batch_size > buffer_size:
+            raise ValueError("batch_size ne peut pas dépasser buffer_size")
+        self.source = source
+        self.buffer_size = buffer_size
+        self.batch_size = batch_size
+        self.rng = np.random.default_rng(seed)
+
+    def __iter__(self):
+        batches = iter(self.source)
+        first = next(batches, None)
+        if first is None:
+            return
+        batches = itertools.chain([first], batches)
+        if hasattr(first[0], 'tocsr'):
+            yield from self._iter_sparse(batches)
+        else:
+            yield from self._iter_dense(batches)
+
+    def _iter_dense(self, batches):
+        X_buf = y_buf = None
+        count = 0
+
+        for X, y in batches:
+            if X_buf is None:
+                X_buf = np.empty((self.buffer_size, X.shape[1]))
+                y_buf = np.empty(self.buffer_size)
+
+            pos = 0
+            while pos < len(X):
+                n = min(self.buffer_size - count, len(X) - pos)
+                X_buf[count:count + n] = X[pos:pos + n]
+                y_buf[count:count + n] = y[pos:pos + n]
+                count += n
+                pos += n
+                if count == self.buffer_size:
+                    yield self._pop(X_buf, y_buf, count)
+                    count -= self.batch_size
+
+        # Vider le tampon en fin de passe
+        if count:
+            order = self.rng.permutation(count)
+            for start in range(0, count, self.batch_size):
+                idx = order[start:start + self.batch_size]
+                yield X_buf[idx], y_buf[idx]
+
+    def _iter_sparse(self, batches):
+        # scipy est forcément installé si la source produit des matrices creuses
+        import scipy.sparse as sp
+
+        X_parts, y_parts, count = [], [], 0
+        for X, y in batches:
+            X_parts.append(X.tocsr())
+            y_parts.append(np.asarray(y, dtype=float))
+            count += X.shape[0]
+            if count < self.buffer_size:
+                continue
+
+            # Tampon plein : assez de lots pour repasser sous buffer_size
+            X_buf, y_buf = sp.vstack(X_parts, format='csr'), np.concatenate(y_parts)
+            order = self.rng.permutation(count)
+            n_out = ((count - self.buffer_size) // self.batch_size + 1) * self.batch_size
+            for start in range(0, n_out, self.batch_size):
+                idx = order[start:start + self.batch_size]
+                yield X_buf[idx], y_buf[idx]
+            keep = order[n_out:]
+            X_parts, y_parts, count = [X_buf[keep]], [y_buf[keep]], len(keep)
+
+        # Vider le tampon en fin de passe
+        if count:
+            X_buf, y_buf = sp.vstack(X_parts, format='csr'), np.concatenate(y_parts)
+            order = self.rng.permutation(count)
+            for start in range(0, count, self.batch_size):
+                idx = order[start:start + self.batch_size]
+                yield X_buf[idx], y_buf[idx]
+
+    def _pop(self, X_buf, y_buf, count):
+        """Tirer un lot au hasard et combler les trous avec les dernières lignes"""
+        b = self.batch_size
+        idx = self.rng.choice(count, b, replace=False)
+        batch = X_buf[idx], y_buf[idx]
+
+        tail_start = count - b
+        holes = idx[idx < tail_start]
+        tail = np.arange(tail_start, count)
+        movers = tail[~np.isin(tail, idx)]
+        X_buf[holes] = X_buf[movers]
+        y_buf[holes] = y_buf[movers]
+        return batch
+
+
+class Prefetcher:
+    """
+    Préchargement des lots d'une source dans un thread d'arrière-plan.
+
+    La lecture (disque, analyse CSV, génération) se fait pendant que le
+    thread principal entraîne sur le lot précédent ; au plus `depth` lots
+    sont gardés en attente.
+    """
+
+    _END = object()
+
+    def __init__(self, source, depth=4):
+        self.source = source
+        self.depth = depth
+
+    def __iter__(self):
+        batches = queue.Queue(maxsize=self.depth)
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for batch in self.source:
+                    if not self._put(batches, batch, stop):
+                        return
+                self._put(batches, self._END, stop)
+            except BaseException as e:
+                self._put(batches, e, stop)
+
+        thread = threading.Thread(target=produce, daemon=True)
+        thread.start()
+        try:
+            while True:
+                item = batches.get()
+                if item is self._END:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            # Débloquer le producteur si la boucle de consommation s'arrête tôt
+            stop.set()
+            thread.join()
+
+    @staticmethod
+    def _put(batches, item, stop):
+        while not stop.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
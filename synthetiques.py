@@ -0,0 +1,217 @@
+"""
+Jeux de données synthétiques reproductibles, de quelques lignes à des millions
+
+Générateurs vectorisés pour tester et mesurer l'entraînement à grande échelle :
+    logic_gate          portes à N entrées : and, or, nand, nor, majority, parity
+    linear_separable    nuage gaussien séparé par un hyperplan aléatoire, avec
+                        marge et bruit d'étiquettes réglables
+    gaussian_blobs      amas gaussiens, un par classe
+
+Les exemples sont produits par blocs de CHUNK_SIZE lignes ; le bloc k est
+tiré d'un générateur de graine (seed, k). Le résultat ne dépend donc que de
+la graine, et pas de la destination : avec `path`, X et y sont écrits
+directement dans des fichiers X.npy et y.npy projetés en mémoire (mmap), sans
+jamais tenir en RAM, et se relisent avec sources.NpySource ou np.load.
+
+Exemple :
+    X, y = linear_separable(10_000_000, 32, noise=0.01, seed=0, path='donnees/lineaire')
+    neurone.fit_stream(NpySource('donnees/lineaire/X.npy', 'donnees/lineaire/y.npy'))
+"""
+
+import argparse
+import os
+
+import numpy as np
+
+
+CHUNK_SIZE = 65536
+
+GATES = ('and', 'or', 'nand', 'nor', 'majority', 'parity')
+
+
+def _allocate(n_samples, n_features, dtype, path):
+    """Tableaux X, y en mémoire, ou fichiers .npy projetés si `path` est donné"""
+    if path is None:
+        return np.empty((n_samples, n_features), dtype=dtype), np.empty(n_samples, dtype=dtype)
+    os.makedirs(path, exist_ok=True)
+    open_memmap = np.lib.format.open_memmap
+    X = open_memmap(os.path.join(path, "X.npy"), mode='w+', dtype=dtype,
+                    shape=(n_samples, n_features))
+    y = open_memmap(os.path.join(path, "y.npy"), mode='w+', dtype=dtype, shape=(n_samples,))
+    return X, y
+
+
+def _standard_normal(rng, X):
+    """Tirage gaussien écrit directement dans X (sans copie en float32/float64)"""
+    if X.dtype in (np.float32, np.float64):
+        rng.standard_normal(dtype=X.dtype, out=X)
+    else:
+        X[...] = rng.standard_normal(X.shape)
+
+
+def _generate(n_samples, n_features, fill, seed, dtype, path):
+    """Remplit X et y bloc par bloc avec fill(rng, X_bloc, y_bloc, début)"""
+    if n_samples < 1 or n_features < 1:
+        raise ValueError("n_samples et n_features doivent être positifs")
+    X, y = _allocate(n_samples, n_features, dtype, path)
+    for chunk, start in enumerate(range(0, n_samples, CHUNK_SIZE)):
+        stop = min(start + CHUNK_SIZE, n_samples)
+        fill(np.random.default_rng([seed, chunk]), X[start:stop], y[start:stop], start)
+    if path is not None:
+        X.flush()
+        y.flush()
+    return X, y
+
+
+def logic_gate(gate, n_inputs=2, n_samples=None, p=0.5, seed=0, dtype=np.float64, path=None):
+    """
+    Porte logique à n_inputs entrées binaires.
+
+    Args:
+        gate: 'and', 'or', 'nand', 'nor', 'majority' (plus de la moitié des
+              entrées à 1) ou 'parity' (nombre impair d'entrées à 1)
+        n_inputs: Nombre d'entrées
+        n_samples: Nombre d'exemples tirés au hasard ; None = table de vérité
+                   complète (2**n_inputs lignes, dans l'ordre binaire)
+        p: Probabilité qu'une entrée tirée vaille 1 (pour and/or avec beaucoup
+           d'entrées, une valeur proche de 1 ou de 0 équilibre les classes)
+        seed: Graine
+        dtype: Type des tableaux
+        path: Dossier où écrire X.npy et y.npy (None = en mémoire)
+
+    Returns:
+        Tuple (X, y)
+    """
+    if gate not in GATES:
+        raise ValueError(f"Porte inconnue: {gate!r} (disponibles: {', '.join(GATES)})")
+    if n_samples is None:
+        if n_inputs > 24:
+            raise ValueError("Table de vérité trop grande : préciser n_samples")
+        n_samples = 2 ** n_inputs
+        bits = np.arange(n_inputs - 1, -1, -1)
+
+        def inputs(rng, X, start):
+            rows = np.arange(start, start + len(X))
+            np.bitwise_and(np.right_shift.outer(rows, bits), 1, out=X, casting='unsafe')
+    else:
+        def inputs(rng, X, start):
+            np.less(rng.random(X.shape), p, out=X)
+
+    def fill(rng, X, y, start):
+        inputs(rng, X, start)
+        ones = X.sum(axis=1, out=y)
+        if gate in ('and', 'nand'):
+            np.equal(ones, n_inputs, out=y)
+        elif gate in ('or', 'nor'):
+            np.greater(ones, 0, out=y)
+        elif gate == 'majority':
+            np.greater(ones, n_inputs / 2, out=y)
+        else:
+            np.remainder(ones, 2, out=y)
+        if gate in ('nand', 'nor'):
+            np.subtract(1, y, out=y)
+
+    return _generate(n_samples, n_inputs, fill, seed, dtype, path)
+
+
+def linear_separable(n_samples, n_features=2, margin=0.0, noise=0.0, seed=0,
+                     dtype=np.float64, path=None):
+    """
+    Points gaussiens étiquetés par le côté d'un hyperplan aléatoire passant par l'origine.
+
+    Args:
+        n_samples: Nombre d'exemples
+        n_features: Dimension
+        margin: Écart ajouté de part et d'autre de l'hyperplan (classes
+                séparées par une bande de largeur 2·margin)
+        noise: Proportion d'étiquettes inversées au hasard (0 = séparable)
+        seed: Graine (fixe aussi l'hyperplan, voir `hyperplane`)
+        dtype: Type des tableaux
+        path: Dossier où écrire X.npy et y.npy (None = en mémoire)
+
+    Returns:
+        Tuple (X, y)
+    """
+    if not 0 <= noise <= 1:
+        raise ValueError("noise doit être compris entre 0 et 1")
+    normal = hyperplane(n_features, seed).astype(dtype)
+
+    def fill(rng, X, y, start):
+        _standard_normal(rng, X)
+        side = np.matmul(X, normal, out=y)
+        np.sign(side, out=side)
+        if margin:
+            X += margin * side[:, None] * normal
+        np.greater(side, 0, out=y)
+        if noise:
+            flip = rng.random(len(y)) < noise
+            y[flip] = 1 - y[flip]
+
+    return _generate(n_samples, n_features, fill, seed, dtype, path)
+
+
+def hyperplane(n_features, seed=0):
+    """Vecteur normal unitaire de l'hyperplan de linear_separable pour cette graine"""
+    normal = np.random.default_rng(seed).standard_normal(n_features)
+    return normal / np.linalg.norm(normal)
+
+
+def gaussian_blobs(n_samples, n_features=2, centers=2, std=1.0, spread=5.0, seed=0,
+                   dtype=np.float64, path=None):
+    """
+    Amas gaussiens isotropes ; l'étiquette est l'indice de l'amas.
+
+    Args:
+        n_samples: Nombre d'exemples
+        n_features: Dimension
+        centers: Nombre d'amas, ou tableau (n_amas, n_features) des centres
+        std: Écart-type de chaque amas
+        spread: Les centres aléatoires sont tirés uniformément dans
+                [-spread, spread]^n_features
+        seed: Graine
+        dtype: Type des tableaux
+        path: Dossier où écrire X.npy et y.npy (None = en mémoire)
+
+    Returns:
+        Tuple (X, y), y à valeurs dans 0..n_amas-1
+    """
+    if np.ndim(centers) == 0:
+        centers = np.random.default_rng(seed).uniform(-spread, spread, (int(centers), n_features))
+    centers = np.asarray(centers, dtype=dtype)
+    if centers.ndim != 2 or centers.shape[1] != n_features:
+        raise ValueError(f"centers doit être de forme (n_amas, {n_features})")
+
+    def fill(rng, X, y, start):
+        labels = rng.integers(len(centers), size=len(y))
+        _standard_normal(rng, X)
+        X *= std
+        X += centers[labels]
+        y[...] = labels
+
+    return _generate(n_samples, n_features, fill, seed, dtype, path)
+
+
+# Écriture d'un jeu de données sur disque, par exemple :
+#   python synthetiques.py linear 10000000 32 donnees/lineaire --noise 0.01
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Génère un jeu de données synthétique (X.npy, y.npy)")
+    parser.add_argument("kind", choices=('linear', 'blobs') + GATES)
+    parser.add_argument("n_samples", type=int)
+    parser.add_argument("n_features", type=int)
+    parser.add_argument("path")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--float32", action="store_true", help="tableaux float32")
+    parser.add_argument("--noise", type=float, default=0.0, help="étiquettes inversées (linear)")
+    parser.add_argument("--margin", type=float, default=0.0, help="marge (linear)")
+    parser.add_argument("--std", type=float, default=1.0, help="écart-type des amas (blobs)")
+    args = parser.parse_args()
+
+    options = {'seed': args.seed, 'dtype': np.float32 if args.float32 else np.float64,
+               'path': args.path}
+    if args.kind == 'linear':
+        X, y = linear_separable(args.n_samples, args.n_features, args.margin, args.noise, **options)
+    elif args.kind == 'blobs':
+        X, y = gaussian_blobs(args.n_samples, args.n_features, std=args.std, **options)
+    else:
+        X, y = logic_gate(args.kind, args.n_features, args.n_samples, **options)
+    print(f"{args.path}: X {X.shape} {X.dtype}, classe 1 : {float(np.mean(y == 1)):.1%}")
@@ -0,0 +1,303 @@
+"""
+Classification de textes en flux par hachage des mots (hashing trick)
+
+Les documents sont lus au fur et à mesure (fichier, CSV, générateur),
+découpés en mots et projetés sur un nombre fixe de colonnes par une fonction
+de hachage, sans passe préalable pour construire un vocabulaire. Chaque lot
+est une matrice creuse CSR (scipy, importé à la demande) directement
+utilisable par Neurone.fit_stream.
+
+La tokenisation et le hachage peuvent être répartis sur un ensemble de
+processus : chaque lot est une tâche, et le nombre de lots en attente est
+borné. La mémoire utilisée ne dépend donc que de la taille des lots, pas de
+celle du corpus. Un compteur (ThroughputMeter) mesure le débit en
+documents par seconde.
+
+Exemple :
+    stream = TextStream(lambda: read_tsv('avis.tsv'), HashingVectorizer(2**18),
+                        batch_size=512, n_workers=4, label_map={'neg': 0, 'pos': 1})
+    neurone = Neurone(2**18)
+    neurone.fit_stream(stream, epochs=3)
+    print(stream.meter.summary())
+"""
+
+import collections
+import re
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+
+_TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+
+def tokenize(text, lowercase=True):
+    """Mots d'au moins deux caractères alphanumériques"""
+    if lowercase:
+        text = text.lower()
+    return _TOKEN_PATTERN.findall(text)
+
+
+class HashingVectorizer:
+    """
+    Projection de textes sur `n_features` colonnes par hachage des mots.
+
+    Le hachage (CRC32) est identique d'un processus à l'autre, contrairement
+    à hash() de Python : tous les processus de travail produisent les mêmes
+    colonnes. Avec alternate_sign, le signe de chaque mot est tiré de son
+    hachage, ce qui compense en moyenne les collisions.
+    """
+
+    def __init__(self, n_features=2 ** 18, ngram_range=(1, 1), alternate_sign=True,
+                 normalize=True, lowercase=True, tokenizer=None):
+        """
+        Args:
+            n_features: Nombre de colonnes des vecteurs produits
+            ngram_range: Tailles (min, max) des n-grammes de mots
+            alternate_sign: Signe ±1 tiré du hachage de chaque mot
+            normalize: Normaliser chaque document (norme euclidienne 1)
+            lowercase: Mettre le texte en minuscules avant la tokenisation
+            tokenizer: Fonction texte -> liste de mots (picklable pour les
+                       processus de travail) ; par défaut `tokenize`
+        """
+        if n_features < 1:
+            raise ValueError("n_features doit être positif")
+        if not 1 <= ngram_range[0] <= ngram_range[1]:
+            raise ValueError("ngram_range doit vérifier 1 <= min <= max")
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+        self.alternate_sign = alternate_sign
+        self.normalize = normalize
+        self.lowercase = lowercase
+        self.tokenizer = tokenizer
+
+    def _tokens(self, text):
+        if self.tokenizer is None:
+            words = tokenize(text, self.lowercase)
+        else:
+            words = self.tokenizer(text.lower() if self.lowercase else text)
+        low, high = self.ngram_range
+        if (low, high) == (1, 1):
+            return words
+        tokens = []
+        for n in range(low, high + 1):
+            tokens.extend(" ".join(words[i:i + n]) for i in range(len(words) - n + 1))
+        return tokens
+
+    def transform_arrays(self, texts):
+        """
+        Vectorise une liste de textes.
+
+        Returns:
+            Tableaux (data, indices, indptr) au format CSR, sans dépendre de scipy
+        """
+        n_features = self.n_features
+        data, indices, indptr = [], [], [0]
+        for text in texts:
+            counts = {}
+            for token in self._tokens(text):
+                h = zlib.crc32(token.encode('utf-8'))
+                column = h % n_features
+                value = -1.0 if self.alternate_sign and h & 0x80000000 else 1.0
+                counts[column] = counts.get(column, 0.0) + value
+            values = np.fromiter(counts.values(), dtype=float, count=len(counts))
+            if self.normalize and len(values):
+                norm = np.sqrt(values @ values)
+                if norm > 0:
+                    values /= norm
+            indices.extend(counts)
+            data.append(values)
+            indptr.append(len(indices))
+        return (np.concatenate(data) if data else np.empty(0),
+                np.array(indices, dtype=np.int64),
+                np.array(indptr, dtype=np.int64))
+
+    def transform(self, texts):
+        """Vectorise une liste de textes en matrice creuse CSR (n_textes, n_features)"""
+        return self._to_csr(self.transform_arrays(texts))
+
+    def _to_csr(self, arrays):
+        import scipy.sparse
+
+        data, indices, indptr = arrays
+        return scipy.sparse.csr_matrix((data, indices, indptr),
+                                       shape=(len(indptr) - 1, self.n_features))
+
+
+class ThroughputMeter:
+    """Compteur de documents traités et débit moyen depuis le démarrage"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.count = 0
+        self._start = None
+        self._stop = None
+
+    def update(self, n):
+        now = time.perf_counter()
+        if self._start is None:
+            self._start = now
+        self._stop = now
+        self.count += n
+
+    def start(self):
+        """Démarrer le chronomètre (sinon au premier `update`)"""
+        if self._start is None:
+            self._start = time.perf_counter()
+
+    @property
+    def elapsed(self):
+        if self._start is None or self._stop is None:
+            return 0.0
+        return self._stop - self._start
+
+    @property
+    def rate(self):
+        """Documents par seconde"""
+        return self.count / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self):
+        return f"{self.count} documents en {self.elapsed:.2f} s ({self.rate:.0f} docs/s)"
+
+
+def read_tsv(path, encoding='utf-8'):
+    """Couples (texte, étiquette) d'un fichier « étiquette<TAB>texte » ligne par ligne"""
+    with open(path, encoding=encoding) as f:
+        for line in f:
+            label, sep, text = line.rstrip('\n').partition('\t')
+            if sep:
+                yield text, label
+
+
+def read_csv(path, text_column, label_column, chunksize=10000, **read_csv_kwargs):
+    """Couples (texte, étiquette) d'un fichier CSV lu par morceaux avec pandas"""
+    import pandas as pd
+
+    for chunk in pd.read_csv(path, chunksize=chunksize, **read_csv_kwargs):
+        yield from zip(chunk[text_column].astype(str), chunk[label_column])
+
+
+def _batched(iterable, size):
+    batch = []
+    for item in iterable:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _bounded_map(executor, function, iterable, max_pending):
+    """Comme executor.map, mais sans consommer plus de `max_pending` éléments d'avance"""
+    pending = collections.deque()
+    for item in iterable:
+        pending.append(executor.submit(function, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+class TextStream:
+    """
+    Source de mini-lots (X creux, y) à partir d'un flux de documents étiquetés.
+
+    Compatible avec Neurone.fit_stream et les adaptateurs de `sources`
+    (Prefetcher, par exemple).
+    """
+
+    def __init__(self, documents, vectorizer=None, batch_size=256, n_workers=0,
+                 max_pending=None, label_map=None):
+        """
+        Args:
+            documents: Itérable ré-itérable de couples (texte, étiquette), ou
+                       fonction sans argument renvoyant un tel itérateur (rappelée
+                       à chaque époque)
+            vectorizer: HashingVectorizer (par défaut 2**18 colonnes)
+            batch_size: Nombre de documents par lot
+            n_workers: Processus de tokenisation (0 = dans le processus courant)
+            max_pending: Lots vectorisés d'avance au plus (défaut: 2 par processus)
+            label_map: Dictionnaire étiquette -> cible (None = float(étiquette))
+        """
+        self.documents = documents
+        self.vectorizer = vectorizer or HashingVectorizer()
+        self.batch_size = batch_size
+        self.n_workers = n_workers
+        self.max_pending = max_pending or 2 * max(n_workers, 1)
+        self.label_map = label_map
+        self.meter = ThroughputMeter()
+
+    @property
+    def n_features(self):
+        return self.vectorizer.n_features
+
+    def _texts_and_targets(self):
+        documents = self.documents() if callable(self.documents) else self.documents
+        label_map = self.label_map
+        for batch in _batched(documents, self.batch_size):
+            texts = [text for text, _ in batch]
+            if label_map is None:
+                targets = np.array([float(label) for _, label in batch])
+            else:
+                targets = np.array([label_map[label] for _, label in batch], dtype=float)
+            yield texts, targets
+
+    def __iter__(self):
+        self.meter.start()
+        batches = self._texts_and_targets()
+        if self.n_workers == 0:
+            for texts, targets in batches:
+                X = self.vectorizer.transform(texts)
+                self.meter.update(len(targets))
+                yield X, targets
+            return
+
+        # Les cibles restent dans ce processus, dans une file de même ordre que les tâches
+        targets_queue = collections.deque()
+
+        def texts_only():
+            for texts, targets in batches:
+                targets_queue.append(targets)
+                yield texts
+
+        executor = ProcessPoolExecutor(self.n_workers)
+        try:
+            for arrays in _bounded_map(executor, self.vectorizer.transform_arrays,
+                                       texts_only(), self.max_pending):
+                targets = targets_queue.popleft()
+                self.meter.update(len(targets))
+                yield self.vectorizer._to_csr(arrays), targets
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+
+# Exemple d'utilisation : avis positifs / négatifs générés aléatoirement
+if __name__ == "__main__":
+    from neurone import Neurone
+
+    positive = "excellent superbe génial parfait agréable recommande adore".split()
+    negative = "décevant horrible nul mauvais ennuyeux déteste lent".split()
+    neutral = "le film un livre ce restaurant service accueil était très vraiment".split()
+
+    def reviews(n=20000, seed=0):
+        rng = np.random.default_rng(seed)
+        for _ in range(n):
+            label = int(rng.integers(2))
+            words = list(rng.choice(neutral, 8)) + list(rng.choice(positive if label else negative, 2))
+            rng.shuffle(words)
+            yield " ".join(words), label
+
+    stream = TextStream(reviews, HashingVectorizer(2 ** 16), batch_size=256, n_workers=2)
+    neurone = Neurone(stream.n_features)
+    history = neurone.fit_stream(stream, epochs=2, learning_rate=5.0)
+    print(stream.meter.summary())
+    print(f"Erreur moyenne de la dernière époque: {history.last_error:.4f}")
+
+    tests = ["un film vraiment excellent", "service horrible et lent"]
+    for text, p in zip(tests, neurone.predict_batch(stream.vectorizer.transform(tests))):
+        print(f"{text!r}: {p:.3f}")